@@ -0,0 +1,106 @@
+"""
+Import time of ``pytorch_lightning`` and of its subpackages, measured in a fresh interpreter with ``-X importtime``.
+
+The cost of a subpackage is the cumulative time of its first import, so it includes the third party packages it
+pulls in. Run it to see where the startup of a script goes::
+
+    python benchmarks/test_import_time.py
+    python benchmarks/test_import_time.py pytorch_lightning.loggers
+"""
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+import pytest
+
+# `import time: self [us] | cumulative | imported package`, nested imports are indented by two spaces
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def import_tree(statement='import pytorch_lightning'):
+    """
+    Runs ``statement`` in a fresh interpreter.
+
+    Return:
+        the imports in the order they started, as the names of the importing modules and of the module and the
+        cumulative microseconds of its first import
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], stderr=subprocess.PIPE, universal_newlines=True,
+        check=True,
+    )
+    lines = [IMPORT_TIME_LINE.match(line) for line in result.stderr.splitlines()]
+    # the lines are printed when an import ends, reversed they start with the outermost import
+    tree, stack = [], []
+    for match in reversed([match for match in lines if match]):
+        depth, module = len(match.group(3)) // 2, match.group(4)
+        del stack[depth:]
+        tree.append((tuple(stack), module, int(match.group(2))))
+        stack.append(module)
+    return tree
+
+
+def import_times(statement='import pytorch_lightning'):
+    """The cumulative microseconds of the first import of each module ``statement`` imports, by module name."""
+    return {module: us for _, module, us in import_tree(statement)}
+
+
+def subpackage_times(tree, package='pytorch_lightning'):
+    """
+    The cumulative microseconds spent importing each subpackage of ``package``, with the third party packages
+    it imported. A subpackage importing another one includes its time.
+    """
+    def subpackage(module):
+        parts = module.split('.')
+        if module.startswith(package + '.'):
+            return '.'.join(parts[:package.count('.') + 2])
+
+    subpackages = defaultdict(int)
+    for parents, module, us in tree:
+        name = subpackage(module)
+        # count the outermost import of each subpackage only, its nested imports are in its cumulative time
+        if name is not None and name not in map(subpackage, parents):
+            subpackages[name] += us
+    return dict(subpackages)
+
+
+def test_import_is_lazy():
+    """Importing the package alone must not import the trainer, the loggers or optional integrations"""
+    times = import_times('import pytorch_lightning')
+    assert 'pytorch_lightning' in times
+    for module in ('pytorch_lightning.trainer', 'pytorch_lightning.loggers', 'pytorch_lightning.accelerators'):
+        assert module not in times, f'{module} is imported by `import pytorch_lightning`'
+
+
+@pytest.mark.parametrize('statement, not_imported', [
+    ('from pytorch_lightning import Trainer', ['pytorch_lightning.loggers.wandb', 'wandb', 'comet_ml', 'mlflow']),
+    ('from pytorch_lightning import Trainer', ['pytorch_lightning.accelerators.horovod_accelerator', 'horovod']),
+    ('from pytorch_lightning.loggers import CSVLogger', ['pytorch_lightning.loggers.neptune', 'neptune']),
+    ('import pytorch_lightning.utilities', ['apex', 'torchtext', 'horovod']),
+])
+def test_optional_integrations_not_imported(statement, not_imported):
+    """Optional integrations are only imported by the code which uses them"""
+    times = import_times(statement)
+    imported = [module for module in not_imported if module in times]
+    assert not imported, f'`{statement}` imports {imported}'
+
+
+def test_subpackage_times():
+    tree = import_tree('from pytorch_lightning import Trainer')
+    subpackages = subpackage_times(tree)
+    assert {'pytorch_lightning.trainer', 'pytorch_lightning.core', 'pytorch_lightning.callbacks'} <= set(subpackages)
+    # the subpackages the trainer imports are part of its time
+    assert subpackages['pytorch_lightning.trainer'] >= subpackages['pytorch_lightning.callbacks']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('package', nargs='?', default='pytorch_lightning', help='the package to break down')
+    args = parser.parse_args()
+
+    for statement in (f'import {args.package}', 'from pytorch_lightning import Trainer'):
+        print(statement)
+        for module, us in sorted(subpackage_times(import_tree(statement), args.package).items(), key=lambda item: -item[1]):
+            print(f'  {module:>46}: {us / 1e3:8.1f} ms')
@@ -0,0 +1,296 @@
+"""
+Per-step overhead of the Lightning loops on CPU, with tiny synthetic models so the framework time dominates.
+
+Each scenario changes one knob of a base configuration and reports the microseconds per call of the training batch,
+the evaluation step and run, the step logging and the checkpointing, next to a plain PyTorch loop doing the same
+optimization. Run the full suite and store the results to compare them between releases::
+
+    python benchmarks/test_loop_overhead.py --output loop_overhead.json
+    python benchmarks/test_loop_overhead.py --output new.json --compare loop_overhead.json
+"""
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+import pytorch_lightning as pl
+from pytorch_lightning import Callback, LightningModule, Trainer, seed_everything
+from pytorch_lightning.callbacks import ModelCheckpoint
+from pytorch_lightning.loggers import CSVLogger
+from pytorch_lightning.trainer.connectors.logger_connector import LoggerConnector
+from pytorch_lightning.trainer.training_loop import TrainLoop
+from pytorch_lightning.trainer.evaluation_loop import EvaluationLoop
+
+NUM_FEATURES = 8
+BATCH_SIZE = 4
+SEQUENCE_LENGTH = 8
+
+BASE_CONFIG = dict(
+    num_logged_keys=1,
+    num_callbacks=0,
+    num_optimizers=1,
+    accumulate_grad_batches=1,
+    tbptt_splits=1,
+    returns='result',
+    profiler=False,
+)
+
+SCENARIOS = {
+    'base': {},
+    'logged_keys_100': dict(num_logged_keys=100),
+    'callbacks_10': dict(num_callbacks=10),
+    'optimizers_2': dict(num_optimizers=2),
+    'accumulate_4': dict(accumulate_grad_batches=4),
+    'tbptt_4': dict(tbptt_splits=4),
+    'dict_returns': dict(returns='dict'),
+    'dict_returns_logged_keys_100': dict(returns='dict', num_logged_keys=100),
+    'profiler': dict(profiler=True),
+}
+
+# the timed sections, by name: the class and the method
+SECTIONS = {
+    'run_training_batch': (TrainLoop, 'run_training_batch'),
+    'evaluation_step': (EvaluationLoop, 'evaluation_step'),
+    'evaluation_run': (Trainer, 'run_evaluation'),
+    'logging': (LoggerConnector, 'log_train_step_metrics'),
+    'checkpointing': (ModelCheckpoint, 'save_checkpoint'),
+}
+
+
+class TinyModel(LightningModule):
+
+    def __init__(self, num_logged_keys=1, num_optimizers=1, tbptt_splits=1, returns='result', num_batches=64):
+        super().__init__()
+        self.num_logged_keys = num_logged_keys
+        self.num_optimizers = num_optimizers
+        self.returns = returns
+        self.num_batches = num_batches
+        self.layers = torch.nn.ModuleList([torch.nn.Linear(NUM_FEATURES, 1) for _ in range(num_optimizers)])
+        self.tbptt_steps = SEQUENCE_LENGTH // tbptt_splits if tbptt_splits > 1 else None
+
+    def step(self, batch, optimizer_idx=0):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self.layers[optimizer_idx](x).squeeze(-1), y)
+
+    def training_step(self, batch, batch_idx, optimizer_idx=0, hiddens=None):
+        # with TBPTT the optimizer index is only passed with several optimizers
+        if self.tbptt_steps is not None and self.num_optimizers == 1:
+            hiddens = optimizer_idx
+            optimizer_idx = 0
+        loss = self.step(batch, optimizer_idx)
+        metrics = {f'train_{i}': loss.detach() for i in range(self.num_logged_keys)}
+        output = {'loss': loss}
+        if self.tbptt_steps is not None:
+            output['hiddens'] = hiddens
+        if self.returns == 'dict':
+            output['log'] = metrics
+        else:
+            self.log_dict(metrics)
+        return output
+
+    def validation_step(self, batch, batch_idx):
+        loss = self.step(batch)
+        if self.returns == 'dict':
+            return {'val_loss': loss}
+        self.log('val_loss', loss)
+
+    def validation_epoch_end(self, outputs):
+        if self.returns == 'dict':
+            return {'log': {'val_loss': torch.stack([o['val_loss'] for o in outputs]).mean()}}
+
+    def configure_optimizers(self):
+        return [torch.optim.SGD(layer.parameters(), lr=0.01) for layer in self.layers]
+
+    def dataset(self):
+        shape = (BATCH_SIZE * self.num_batches, SEQUENCE_LENGTH, NUM_FEATURES)
+        if self.tbptt_steps is None:
+            shape = (BATCH_SIZE * self.num_batches, NUM_FEATURES)
+        x = torch.randn(*shape)
+        return TensorDataset(x, x.sum(-1))
+
+    def train_dataloader(self):
+        return DataLoader(self.dataset(), batch_size=BATCH_SIZE)
+
+    def val_dataloader(self):
+        return DataLoader(self.dataset(), batch_size=BATCH_SIZE)
+
+
+class NoopCallback(Callback):
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        pass
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        pass
+
+    def on_validation_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        pass
+
+
+@contextmanager
+def timed_sections(sections):
+    """Patches the methods of ``sections`` to add up the seconds spent in them, and their calls."""
+    seconds, calls = defaultdict(float), defaultdict(int)
+    originals = []
+
+    def timed(name, fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds[name] += time.perf_counter() - start
+                calls[name] += 1
+        return wrapper
+
+    for name, (cls, method) in sections.items():
+        original = cls.__dict__[method]
+        originals.append((cls, method, original))
+        setattr(cls, method, timed(name, original))
+    try:
+        yield seconds, calls
+    finally:
+        for cls, method, original in originals:
+            setattr(cls, method, original)
+
+
+def pytorch_step_time(model, num_batches, accumulate_grad_batches=1):
+    """Seconds per batch of a plain PyTorch loop doing the same optimization as the Lightning loop."""
+    optimizers = model.configure_optimizers()
+    splits = SEQUENCE_LENGTH // model.tbptt_steps if model.tbptt_steps else 1
+    # the timed Lightning section gets its batches already fetched
+    batches = list(model.train_dataloader())
+    start = time.perf_counter()
+    for batch_idx, batch in enumerate(batches):
+        for split in range(splits):
+            if model.tbptt_steps:
+                size = model.tbptt_steps
+                batch_split = [t[:, split * size:(split + 1) * size] for t in batch]
+            else:
+                batch_split = batch
+            for optimizer_idx, optimizer in enumerate(optimizers):
+                loss = model.step(batch_split, optimizer_idx) / accumulate_grad_batches
+                loss.backward()
+                if (batch_idx + 1) % accumulate_grad_batches == 0:
+                    optimizer.step()
+                    optimizer.zero_grad()
+    return (time.perf_counter() - start) / num_batches
+
+
+def run_scenario(num_batches=64, val_checks=4, save_dir=None, **overrides):
+    """
+    Fits a tiny model with the base configuration changed by ``overrides``.
+
+    Return:
+        the config, the microseconds per call and the number of calls of each timed section
+    """
+    config = dict(BASE_CONFIG, **overrides)
+    seed_everything(1)
+    model = TinyModel(
+        num_logged_keys=config['num_logged_keys'],
+        num_optimizers=config['num_optimizers'],
+        tbptt_splits=config['tbptt_splits'],
+        returns=config['returns'],
+        num_batches=num_batches,
+    )
+    raw_step = pytorch_step_time(model, num_batches, config['accumulate_grad_batches'])
+
+    save_dir = save_dir or tempfile.mkdtemp()
+    trainer = Trainer(
+        default_root_dir=save_dir,
+        max_epochs=1,
+        val_check_interval=max(1, num_batches // val_checks),
+        limit_val_batches=max(1, num_batches // 8),
+        num_sanity_val_steps=0,
+        log_every_n_steps=1,
+        accumulate_grad_batches=config['accumulate_grad_batches'],
+        truncated_bptt_steps=model.tbptt_steps,
+        callbacks=[NoopCallback() for _ in range(config['num_callbacks'])],
+        checkpoint_callback=ModelCheckpoint(
+            filepath=os.path.join(save_dir, 'checkpoints'), monitor='val_loss', save_top_k=2, save_last=True
+        ),
+        logger=CSVLogger(save_dir),
+        profiler=config['profiler'],
+        progress_bar_refresh_rate=0,
+        weights_summary=None,
+    )
+    with timed_sections(SECTIONS) as (seconds, calls):
+        trainer.fit(model)
+
+    us_per_call = {name: seconds[name] / calls[name] * 1e6 for name in SECTIONS if calls[name]}
+    us_per_call['pytorch_step'] = raw_step * 1e6
+    us_per_call['training_batch_overhead'] = us_per_call['run_training_batch'] - us_per_call['pytorch_step']
+    return {'config': config, 'us_per_call': us_per_call, 'calls': dict(calls)}
+
+
+def run_suite(scenarios=None, **kwargs):
+    scenarios = scenarios or SCENARIOS
+    return {
+        'meta': {
+            'pytorch_lightning': pl.__version__,
+            'torch': torch.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'date': datetime.now().isoformat(timespec='seconds'),
+        },
+        'scenarios': {name: run_scenario(**overrides, **kwargs) for name, overrides in scenarios.items()},
+    }
+
+
+def compare(results, reference):
+    """The relative change of each timing of ``results`` against ``reference``, by scenario."""
+    changes = {}
+    for name, scenario in results['scenarios'].items():
+        reference_times = reference['scenarios'].get(name, {}).get('us_per_call', {})
+        changes[name] = {
+            section: us / reference_times[section] - 1
+            for section, us in scenario['us_per_call'].items() if reference_times.get(section, 0) > 0
+        }
+    return changes
+
+
+def test_loop_overhead(tmpdir):
+    """Make sure the suite times every section and stores its results as JSON"""
+    scenarios = {name: SCENARIOS[name] for name in ('base', 'optimizers_2', 'tbptt_4', 'dict_returns')}
+    results = run_suite(scenarios, num_batches=8, val_checks=2, save_dir=str(tmpdir))
+
+    path = os.path.join(tmpdir, 'loop_overhead.json')
+    with open(path, 'w') as f:
+        json.dump(results, f)
+    with open(path) as f:
+        stored = json.load(f)
+
+    for name, scenario in stored['scenarios'].items():
+        assert set(scenario['us_per_call']) == set(SECTIONS) | {'pytorch_step', 'training_batch_overhead'}, name
+        assert scenario['calls']['run_training_batch'] == 8, name
+        assert scenario['calls']['evaluation_run'] == 2, name
+    assert all(change == 0 for changes in compare(stored, stored).values() for change in changes.values())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default='loop_overhead.json', help='where to store the results')
+    parser.add_argument('--compare', help='results of an earlier run to compare with')
+    parser.add_argument('--num-batches', type=int, default=256, help='training batches per scenario')
+    args = parser.parse_args()
+
+    results = run_suite(num_batches=args.num_batches)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    changes = compare(results, json.load(open(args.compare))) if args.compare else {}
+    for name, scenario in results['scenarios'].items():
+        print(name)
+        for section, us in sorted(scenario['us_per_call'].items()):
+            change = changes.get(name, {}).get(section)
+            print(f'  {section:>24}: {us:10.1f} us' + (f' ({change:+.1%})' if change is not None else ''))
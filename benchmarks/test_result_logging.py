@@ -0,0 +1,106 @@
+"""
+Time of a training step of a model logging 100 keys with ``LightningModule.log``, with the per-step metrics read
+through the cached layout of the logged keys and by scanning the meta of every logged key. Run it to print the
+timings::
+
+    python benchmarks/test_result_logging.py --num-steps 200
+"""
+import argparse
+import statistics
+import time
+from copy import copy
+from unittest import mock
+
+import torch
+
+from pytorch_lightning import Callback, Trainer, seed_everything
+from pytorch_lightning.core.step_result import Result
+from tests.base.boring_model import BoringModel
+
+NUM_KEYS = 100
+
+
+class LoggingModel(BoringModel):
+
+    def training_step(self, batch, batch_idx):
+        output = super().training_step(batch, batch_idx)
+        loss = output['loss'].detach()
+        for i in range(NUM_KEYS):
+            self.log(f'metric_{i}', loss + i, on_step=True, on_epoch=True, prog_bar=i % 10 == 0)
+        return output
+
+    def configure_optimizers(self):
+        return torch.optim.SGD(self.layer.parameters(), lr=0.1)
+
+
+class StepTimer(Callback):
+    """Records the time between the starts of consecutive training batches, which includes logging their metrics."""
+
+    def __init__(self):
+        self.starts = []
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        self.starts.append(time.perf_counter())
+
+    @property
+    def durations(self):
+        return [end - start for start, end in zip(self.starts, self.starts[1:])]
+
+
+def fit_logging_model(num_steps: int, scanned: bool, save_dir: str):
+    """The trainer which fitted :class:`LoggingModel` and the median time of its training batches in seconds."""
+    seed_everything(1)
+    timer = StepTimer()
+    trainer = Trainer(
+        default_root_dir=save_dir,
+        max_epochs=1,
+        limit_train_batches=num_steps,
+        limit_val_batches=0,
+        logger=False,
+        checkpoint_callback=False,
+        weights_summary=None,
+        progress_bar_refresh_rate=0,
+        callbacks=[timer],
+    )
+    if scanned:
+        with mock.patch.object(Result, '_logged_schemas', lambda self: None):
+            trainer.fit(LoggingModel())
+    else:
+        trainer.fit(LoggingModel())
+    return trainer, statistics.median(timer.durations)
+
+
+def test_result_logging_layout_matches_scan():
+    """Verify that the cached layout reads the same per-step metrics as scanning the meta of every logged key"""
+    result = Result()
+    for i in range(NUM_KEYS):
+        result.log(f'metric_{i}', torch.tensor(float(i)), on_step=True, on_epoch=True, prog_bar=i % 10 == 0)
+    scanned = copy(result)
+    object.__setattr__(scanned, '_log_schemas', None)
+
+    assert result.get_batch_log_metrics() == scanned.get_batch_log_metrics()
+    assert result.get_batch_pbar_metrics() == scanned.get_batch_pbar_metrics()
+    assert result.get_forked_metrics() == scanned.get_forked_metrics()
+
+
+def test_result_logging_speed(tmpdir, num_steps=20):
+    """Verify that a model logging 100 keys per step logs the same metrics and is not slower with the cached
+    layout, with a generous bound as the timings depend on the machine"""
+    cached, cached_time = fit_logging_model(num_steps, scanned=False, save_dir=str(tmpdir))
+    scanned, scanned_time = fit_logging_model(num_steps, scanned=True, save_dir=str(tmpdir))
+
+    assert cached.logged_metrics.keys() == scanned.logged_metrics.keys()
+    assert cached.progress_bar_metrics == scanned.progress_bar_metrics
+    assert cached_time < 2 * scanned_time
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--num-steps', type=int, default=200, help='training steps per run')
+    parser.add_argument('--save-dir', default='.', help='the root directory of the trainer')
+    args = parser.parse_args()
+
+    _, cached_time = fit_logging_model(args.num_steps, scanned=False, save_dir=args.save_dir)
+    _, scanned_time = fit_logging_model(args.num_steps, scanned=True, save_dir=args.save_dir)
+    print(f'training step logging {NUM_KEYS} keys: cached layout {cached_time * 1e6:.1f} us,'
+          f' scanned meta {scanned_time * 1e6:.1f} us ({cached_time / scanned_time - 1:+.1%})')
@@ -14,11 +14,16 @@ After ~1500 steps, you will see the total_reward hitting the max score of 200. O
 see the metrics:
 
 tensorboard --logdir default
+
+By default the experiences are stored in preallocated arrays, several environments are stepped with one forward
+pass of the network and the dataset yields whole sampled batches. Pass `--prioritized` to sample the experiences
+by their TD error, or `--baseline` to run the original single environment agent with its `deque` replay buffer
+for comparison.
 """
 
 import argparse
 from collections import OrderedDict, deque, namedtuple
-from typing import Tuple, List
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 import gym
 import numpy as np
@@ -88,7 +93,7 @@ class ReplayBuffer:
         states, actions, rewards, dones, next_states = zip(*[self.buffer[idx] for idx in indices])
 
         return (np.array(states), np.array(actions), np.array(rewards, dtype=np.float32),
-                np.array(dones, dtype=np.bool), np.array(next_states))
+                np.array(dones, dtype=bool), np.array(next_states))
 
 
 class RLDataset(IterableDataset):
@@ -186,6 +191,255 @@ class Agent:
         return reward, done
 
 
+class ArrayReplayBuffer:
+    """
+    Replay Buffer storing the fields of the past experiences in preallocated circular arrays, one per field.
+
+    Appending writes into the arrays in place and sampling gathers whole batches with one index array,
+    without building an object per experience. The arrays are allocated on the first append.
+
+    Args:
+        capacity: size of the buffer
+    """
+
+    FIELDS = Experience._fields
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.arrays = None
+        self.position = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _allocate(self, experiences: Experience) -> None:
+        self.arrays = Experience(*(
+            np.empty((self.capacity,) + np.shape(field)[1:], dtype=np.asarray(field).dtype) for field in experiences
+        ))
+
+    def append(self, experience: Experience) -> None:
+        """
+        Add experience to the buffer
+
+        Args:
+            experience: tuple (state, action, reward, done, new_state)
+        """
+        self.extend(Experience(*(np.expand_dims(np.asarray(field), 0) for field in experience)))
+
+    def extend(self, experiences: Experience) -> np.ndarray:
+        """
+        Add a batch of experiences to the buffer, overwriting the oldest ones when it is full
+
+        Args:
+            experiences: tuple of arrays (states, actions, rewards, dones, new_states) with one row per experience
+
+        Returns:
+            the indices the experiences were stored at
+        """
+        if self.arrays is None:
+            self._allocate(experiences)
+        indices = (self.position + np.arange(len(experiences.done))) % self.capacity
+        for array, field in zip(self.arrays, experiences):
+            array[indices] = field
+        self.position = (self.position + len(indices)) % self.capacity
+        self.size = min(self.size + len(indices), self.capacity)
+        return indices
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        return np.random.randint(0, self.size, size=batch_size)
+
+    def sample(self, batch_size: int) -> Tuple:
+        """Sample a batch of experiences uniformly, with replacement"""
+        indices = self.sample_indices(batch_size)
+        states, actions, rewards, dones, next_states = (array[indices] for array in self.arrays)
+        return states, actions, rewards.astype(np.float32), dones.astype(bool), next_states
+
+
+class SumTree:
+    """
+    Binary tree over an array of priorities in which each node holds the sum of its children, to sample
+    indices in proportion to their priority in logarithmic time. All operations are vectorized over batches
+    of indices.
+
+    Args:
+        capacity: number of priorities
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.num_leaves = 1 << max(0, int(capacity - 1).bit_length())
+        # the nodes in breadth first order, the root at index 1 and the leaves at the end
+        self.nodes = np.zeros(2 * self.num_leaves, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return self.nodes[1]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        nodes = np.asarray(indices) + self.num_leaves
+        self.nodes[nodes] = priorities
+        # recompute the parents level by level, duplicate indices get the same sums
+        while nodes[0] > 1:
+            nodes = np.unique(nodes // 2)
+            self.nodes[nodes] = self.nodes[2 * nodes] + self.nodes[2 * nodes + 1]
+
+    def find(self, prefix_sums: np.ndarray) -> np.ndarray:
+        """The indices at which the cumulative sum of the priorities reaches each of ``prefix_sums``"""
+        nodes = np.ones(len(prefix_sums), dtype=np.int64)
+        prefix_sums = np.array(prefix_sums, dtype=np.float64)
+        while nodes[0] < self.num_leaves:
+            left = 2 * nodes
+            go_right = prefix_sums > self.nodes[left]
+            prefix_sums -= np.where(go_right, self.nodes[left], 0.0)
+            nodes = left + go_right
+        return nodes - self.num_leaves
+
+
+class PrioritizedReplayBuffer(ArrayReplayBuffer):
+    """
+    Array Replay Buffer sampling the experiences in proportion to their priority, as in
+    https://arxiv.org/abs/1511.05952. New experiences get the highest priority seen so far.
+
+    Args:
+        capacity: size of the buffer
+        alpha: how much the priorities are used, 0 samples uniformly
+        beta: how much the importance weights correct the bias of the prioritized sampling
+    """
+
+    def __init__(self, capacity: int, alpha: float = 0.6, beta: float = 0.4) -> None:
+        super().__init__(capacity)
+        self.alpha = alpha
+        self.beta = beta
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+
+    def extend(self, experiences: Experience) -> np.ndarray:
+        indices = super().extend(experiences)
+        self.tree.update(indices, np.full(len(indices), self.max_priority ** self.alpha))
+        return indices
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        # one prefix sum from each of batch_size equal segments of the total priority
+        segment = self.tree.total / batch_size
+        prefix_sums = (np.arange(batch_size) + np.random.uniform(size=batch_size)) * segment
+        return np.minimum(self.tree.find(prefix_sums), self.size - 1)
+
+    def sample(self, batch_size: int) -> Tuple:
+        """Sample a batch of experiences by priority, with their indices and importance weights"""
+        indices = self.sample_indices(batch_size)
+        states, actions, rewards, dones, next_states = (array[indices] for array in self.arrays)
+        probabilities = self.tree.nodes[indices + self.tree.num_leaves] / self.tree.total
+        weights = (self.size * probabilities) ** -self.beta
+        weights = (weights / weights.max()).astype(np.float32)
+        return states, actions, rewards.astype(np.float32), dones.astype(bool), next_states, indices, weights
+
+    def update_priorities(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """
+        Sets the priorities of the sampled experiences, typically their absolute TD errors
+
+        Args:
+            indices: indices returned by :meth:`sample`
+            priorities: new priorities of the experiences
+        """
+        priorities = np.asarray(priorities, dtype=np.float64) + 1e-6
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities ** self.alpha)
+
+
+class BatchRLDataset(IterableDataset):
+    """
+    Iterable Dataset yielding whole batches sampled from the replay buffer, to be loaded with
+    ``batch_size=None`` so the batches are not collated again
+
+    Args:
+        buffer: replay buffer
+        batch_size: number of experiences per batch
+        num_batches: number of batches to sample in each pass
+    """
+
+    def __init__(self, buffer: ArrayReplayBuffer, batch_size: int, num_batches: int) -> None:
+        self.buffer = buffer
+        self.batch_size = batch_size
+        self.num_batches = num_batches
+
+    def __iter__(self) -> Iterator[Tuple]:
+        for _ in range(self.num_batches):
+            yield self.buffer.sample(self.batch_size)
+
+
+class VectorAgent:
+    """
+    Agent stepping several environments at once, the actions for all of them are chosen with one forward
+    pass of the network
+
+    Args:
+        envs: training environments
+        replay_buffer: replay buffer storing experiences
+    """
+
+    def __init__(self, envs: Sequence[gym.Env], replay_buffer: ArrayReplayBuffer) -> None:
+        self.envs = envs
+        self.replay_buffer = replay_buffer
+        self.states = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets the environments and updates the states"""
+        self.states = np.stack([env.reset() for env in self.envs])
+
+    def get_actions(self, net: nn.Module, epsilon: float, device: torch.device) -> np.ndarray:
+        """
+        Using the given network, decide which action to carry out in each environment
+        using an epsilon-greedy policy
+
+        Args:
+            net: DQN network
+            epsilon: value to determine likelihood of taking a random action
+            device: current device
+
+        Returns:
+            actions
+        """
+        explore = np.random.random(len(self.envs)) < epsilon
+        actions = np.array([env.action_space.sample() for env in self.envs])
+        if not explore.all():
+            q_values = net(torch.as_tensor(self.states, device=device))
+            greedy = q_values.argmax(dim=1).cpu().numpy()
+            actions = np.where(explore, actions, greedy)
+        return actions
+
+    @torch.no_grad()
+    def play_step(self, net: nn.Module, epsilon: float = 0.0, device: Optional[torch.device] = None) -> Tuple:
+        """
+        Carries out a single interaction step between the agent and each environment
+
+        Args:
+            net: DQN network
+            epsilon: value to determine likelihood of taking a random action
+            device: current device
+
+        Returns:
+            rewards, dones
+        """
+        actions = self.get_actions(net, epsilon, device)
+
+        # do a step in each environment, resetting the finished ones
+        new_states, rewards, dones = [], [], []
+        for env, action in zip(self.envs, actions):
+            new_state, reward, done, _ = env.step(action)
+            new_states.append(new_state)
+            rewards.append(reward)
+            dones.append(done)
+        new_states, rewards, dones = np.stack(new_states), np.array(rewards, dtype=np.float32), np.array(dones)
+
+        self.replay_buffer.extend(Experience(self.states, actions, rewards, dones, new_states))
+
+        self.states = new_states.copy()
+        for i in np.flatnonzero(dones):
+            self.states[i] = self.envs[i].reset()
+        return rewards, dones
+
+
 class DQNLightning(pl.LightningModule):
     """ Basic DQN Model """
 
@@ -199,7 +453,13 @@ class DQNLightning(pl.LightningModule):
                  sync_rate,
                  lr: float,
                  episode_length,
-                 batch_size, **kwargs) -> None:
+                 batch_size,
+                 env: str = "CartPole-v0",
+                 num_envs: int = 4,
+                 prioritized: bool = False,
+                 alpha: float = 0.6,
+                 beta: float = 0.4,
+                 baseline: bool = False, **kwargs) -> None:
         super().__init__()
         self.replay_size = replay_size
         self.warm_start_steps = warm_start_steps
@@ -211,18 +471,28 @@ class DQNLightning(pl.LightningModule):
         self.lr = lr
         self.episode_length = episode_length
         self.batch_size = batch_size
+        self.baseline = baseline
 
-        self.env = gym.make(self.env)
+        self.env = gym.make(env)
         obs_size = self.env.observation_space.shape[0]
         n_actions = self.env.action_space.n
 
         self.net = DQN(obs_size, n_actions)
         self.target_net = DQN(obs_size, n_actions)
 
-        self.buffer = ReplayBuffer(self.replay_size)
-        self.agent = Agent(self.env, self.buffer)
+        if self.baseline:
+            # the original agent stepping a single environment, with a deque of experiences
+            self.buffer = ReplayBuffer(self.replay_size)
+            self.agent = Agent(self.env, self.buffer)
+        else:
+            if prioritized:
+                self.buffer = PrioritizedReplayBuffer(self.replay_size, alpha=alpha, beta=beta)
+            else:
+                self.buffer = ArrayReplayBuffer(self.replay_size)
+            envs = [self.env] + [gym.make(env) for _ in range(num_envs - 1)]
+            self.agent = VectorAgent(envs, self.buffer)
         self.total_reward = 0
-        self.episode_reward = 0
+        self.episode_rewards = np.zeros(1 if self.baseline else num_envs, dtype=np.float32)
         self.populate(self.warm_start_steps)
 
     def populate(self, steps: int = 1000) -> None:
@@ -233,7 +503,8 @@ class DQNLightning(pl.LightningModule):
         Args:
             steps: number of random steps to populate the buffer with
         """
-        for i in range(steps):
+        num_envs = 1 if self.baseline else len(self.agent.envs)
+        for i in range(0, steps, num_envs):
             self.agent.play_step(self.net, epsilon=1.0)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -259,7 +530,7 @@ class DQNLightning(pl.LightningModule):
         Returns:
             loss
         """
-        states, actions, rewards, dones, next_states = batch
+        states, actions, rewards, dones, next_states = batch[:5]
 
         state_action_values = self.net(states).gather(1, actions.unsqueeze(-1)).squeeze(-1)
 
@@ -270,6 +541,13 @@ class DQNLightning(pl.LightningModule):
 
         expected_state_action_values = next_state_values * self.gamma + rewards
 
+        if isinstance(self.buffer, PrioritizedReplayBuffer):
+            # weight the errors by importance and prioritize the experiences by them
+            indices, weights = batch[5:]
+            errors = state_action_values - expected_state_action_values
+            self.buffer.update_priorities(indices.cpu().numpy(), errors.detach().abs().cpu().numpy())
+            return (weights * errors.pow(2)).mean()
+
         return nn.MSELoss()(state_action_values, expected_state_action_values)
 
     def training_step(self, batch: Tuple[torch.Tensor, torch.Tensor], nb_batch) -> OrderedDict:
@@ -288,16 +566,21 @@ class DQNLightning(pl.LightningModule):
         epsilon = max(self.eps_end, self.eps_start -
                       self.global_step + 1 / self.eps_last_frame)
 
-        # step through environment with agent
-        reward, done = self.agent.play_step(self.net, epsilon, device)
-        self.episode_reward += reward
+        # step through the environments with agent
+        if self.baseline:
+            reward, done = self.agent.play_step(self.net, epsilon, device)
+            rewards, dones = np.array([reward]), np.array([done])
+        else:
+            rewards, dones = self.agent.play_step(self.net, epsilon, batch[0].device)
+            reward = rewards.mean()
+        self.episode_rewards += rewards
 
         # calculates training loss
         loss = self.dqn_mse_loss(batch)
 
-        if done:
-            self.total_reward = self.episode_reward
-            self.episode_reward = 0
+        if dones.any():
+            self.total_reward = self.episode_rewards[dones].max()
+            self.episode_rewards[dones] = 0
 
         # Soft update of target network
         if self.global_step % self.sync_rate == 0:
@@ -316,13 +599,17 @@ class DQNLightning(pl.LightningModule):
 
     def __dataloader(self) -> DataLoader:
         """Initialize the Replay Buffer dataset used for retrieving experiences"""
-        dataset = RLDataset(self.buffer, self.episode_length)
-        dataloader = DataLoader(
-            dataset=dataset,
-            batch_size=self.batch_size,
-            sampler=None,
-        )
-        return dataloader
+        if self.baseline:
+            dataset = RLDataset(self.buffer, self.episode_length)
+            return DataLoader(
+                dataset=dataset,
+                batch_size=self.batch_size,
+                sampler=None,
+            )
+        # the dataset samples whole batches, as many as the baseline dataset yields
+        num_batches = -(-self.episode_length // self.batch_size)
+        dataset = BatchRLDataset(self.buffer, self.batch_size, num_batches)
+        return DataLoader(dataset=dataset, batch_size=None)
 
     def train_dataloader(self) -> DataLoader:
         """Get train loader"""
@@ -369,6 +656,15 @@ if __name__ == '__main__':
                         help="max episode reward in the environment")
     parser.add_argument("--warm_start_steps", type=int, default=1000,
                         help="max episode reward in the environment")
+    parser.add_argument("--num_envs", type=int, default=4,
+                        help="how many environments are stepped at once")
+    parser.add_argument("--prioritized", action="store_true",
+                        help="sample the experiences in proportion to their TD error")
+    parser.add_argument("--alpha", type=float, default=0.6, help="how much prioritized sampling is used")
+    parser.add_argument("--beta", type=float, default=0.4,
+                        help="how much importance weights correct prioritized sampling")
+    parser.add_argument("--baseline", action="store_true",
+                        help="use the original single environment agent and deque replay buffer")
 
     args = parser.parse_args()
 
@@ -53,11 +53,17 @@ if __LIGHTNING_SETUP__:
     sys.stdout.write(f'Partial import of `{__name__}` during the build process.\n')  # pragma: no-cover
     # We are not importing the rest of the lightning during the build process, as it may not be compiled yet
 else:
-    from pytorch_lightning.core import LightningDataModule, LightningModule
-    from pytorch_lightning.callbacks import Callback
-    from pytorch_lightning.trainer import Trainer
-    from pytorch_lightning.utilities.seed import seed_everything
-    from pytorch_lightning import metrics
+    import importlib
+
+    # the public API is imported on first access, see PEP 562, so importing a subpackage or a
+    # utility does not pay for the Trainer and everything it pulls in
+    _LAZY_ATTRIBUTES = {
+        'Trainer': 'pytorch_lightning.trainer',
+        'LightningDataModule': 'pytorch_lightning.core',
+        'LightningModule': 'pytorch_lightning.core',
+        'Callback': 'pytorch_lightning.callbacks',
+        'seed_everything': 'pytorch_lightning.utilities.seed',
+    }
 
     __all__ = [
         'Trainer',
@@ -68,6 +74,19 @@ else:
         'metrics',
     ]
 
+    def __getattr__(name):
+        if name in _LAZY_ATTRIBUTES:
+            value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        elif name == 'metrics':
+            value = importlib.import_module('pytorch_lightning.metrics')
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+
     # necessary for regular bolts imports. Skip exception since bolts is not always installed
     try:
         from pytorch_lightning import bolts
@@ -11,17 +11,37 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pytorch_lightning.accelerators.cpu_accelerator import CPUAccelerator
-from pytorch_lightning.accelerators.ddp2_accelerator import DDP2Accelerator
-from pytorch_lightning.accelerators.ddp_accelerator import DDPAccelerator
-from pytorch_lightning.accelerators.ddp_spawn_accelerator import DDPSpawnAccelerator
-from pytorch_lightning.accelerators.ddp_cpu_spawn_accelerator import DDPCPUSpawnAccelerator
-from pytorch_lightning.accelerators.dp_accelerator import DataParallelAccelerator
-from pytorch_lightning.accelerators.gpu_accelerator import GPUAccelerator
-from pytorch_lightning.accelerators.tpu_accelerator import TPUAccelerator
-from pytorch_lightning.accelerators.horovod_accelerator import HorovodAccelerator
-from pytorch_lightning.accelerators.ddp_slurm_accelerator import DDPSLURMAccelerator
-from pytorch_lightning.accelerators.ddp_torchelastic_accelerator import DDPTorchElasticAccelerator
-from pytorch_lightning.accelerators.ddp_cpu_torchelastic_accelerator import DDPCPUTorchElasticAccelerator
-from pytorch_lightning.accelerators.ddp_cpu_slurm_accelerator import DDPCPUSLURMAccelerator
-from pytorch_lightning.accelerators.accelerator import Accelerator
+import importlib
+
+# the accelerators are imported on first access, see PEP 562, so Horovod and XLA
+# are only imported when the trainer picks the accelerator which needs them
+_ACCELERATOR_MODULES = {
+    'CPUAccelerator': 'cpu_accelerator',
+    'DDP2Accelerator': 'ddp2_accelerator',
+    'DDPAccelerator': 'ddp_accelerator',
+    'DDPSpawnAccelerator': 'ddp_spawn_accelerator',
+    'DDPCPUSpawnAccelerator': 'ddp_cpu_spawn_accelerator',
+    'DataParallelAccelerator': 'dp_accelerator',
+    'GPUAccelerator': 'gpu_accelerator',
+    'TPUAccelerator': 'tpu_accelerator',
+    'HorovodAccelerator': 'horovod_accelerator',
+    'DDPSLURMAccelerator': 'ddp_slurm_accelerator',
+    'DDPTorchElasticAccelerator': 'ddp_torchelastic_accelerator',
+    'DDPCPUTorchElasticAccelerator': 'ddp_cpu_torchelastic_accelerator',
+    'DDPCPUSLURMAccelerator': 'ddp_cpu_slurm_accelerator',
+    'Accelerator': 'accelerator',
+}
+
+__all__ = list(_ACCELERATOR_MODULES)
+
+
+def __getattr__(name):
+    if name not in _ACCELERATOR_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    accelerator = getattr(importlib.import_module(f'{__name__}.{_ACCELERATOR_MODULES[name]}'), name)
+    globals()[name] = accelerator
+    return accelerator
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -18,6 +18,7 @@ from typing import Any, Optional
 
 import torch
 
+from pytorch_lightning.distributed.control import ControlSignals
 from pytorch_lightning.utilities import AMPType, rank_zero_warn
 from pytorch_lightning.utilities.apply_func import move_data_to_device
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -25,11 +26,6 @@ from pytorch_lightning.utilities.parsing import AttributeDict
 import torch.distributed as torch_distrib
 from pytorch_lightning import _logger as log
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 EPSILON = 1e-6
 EPSILON_FP16 = 1e-5
 
@@ -41,6 +37,7 @@ class Accelerator(object):
         self.nickname = None
         self.cluster_environment = cluster_environment
         self.dist = AttributeDict(rank=0, device=None)
+        self.control_signals = None
 
         if trainer is not None:
             self.train_loop = self.trainer.train
@@ -67,11 +64,20 @@ class Accelerator(object):
         return results
 
     def batch_to_device(self, batch: Any, device: torch.device):
+        # batches staged ahead of time by the prefetcher are already on their device
+        if self.trainer.data_connector.is_staged(batch, device):
+            return batch
+
         model = self.trainer.get_model()
         if model is not None:
             return model.transfer_batch_to_device(batch, device)
         return move_data_to_device(batch, device)
 
+    def batch_device(self) -> Optional[torch.device]:
+        """The device each batch is moved to before a step, ``None`` if the accelerator doesn't move batches
+        itself (e.g. they stay on CPU or are scattered by the model wrapper)."""
+        return None
+
     def training_step_end(self, output):
         return output
 
@@ -154,6 +160,7 @@ class Accelerator(object):
 
         model = self.trainer.get_model()
         if self.trainer.amp_backend == AMPType.APEX:
+            from apex import amp
             parameters = amp.master_params(optimizer)
         else:
             parameters = model.parameters()
@@ -189,6 +196,33 @@ class Accelerator(object):
     def early_stopping_should_stop(self, pl_module):
         return self.trainer.should_stop
 
+    def submit_early_stopping_decision(self, pl_module):
+        """
+        Starts summing the early stopping decisions of all processes, without waiting for the result.
+
+        The processes keep training until :meth:`update_should_stop` applies the reduced decision, which stops
+        all of them at the same step once every process wants to stop.
+        """
+        if self.control_signals is None:
+            self.control_signals = ControlSignals()
+        self.control_signals.submit(
+            step=self.trainer.total_batch_idx, device=pl_module.device, should_stop=int(self.trainer.should_stop)
+        )
+        return False
+
+    def update_should_stop(self, before_step: Optional[int] = None):
+        """
+        Sets ``trainer.should_stop`` when all processes decided to stop in a submitted early stopping check.
+
+        Args:
+            before_step: only wait for the decisions of earlier steps, all of them if ``None``
+        """
+        if self.control_signals is None:
+            return
+        for signals in self.control_signals.collect(before_step):
+            if signals['should_stop'] == self.trainer.world_size:
+                self.trainer.should_stop = True
+
     def setup_optimizers(self, model):
         if self.trainer.testing is True:
             return
@@ -104,7 +104,7 @@ class DDP2Accelerator(Accelerator):
         self.trainer.world_size = self.trainer.num_nodes
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
     def model_to_device(self, model, process_idx):
         self.trainer.root_gpu = process_idx
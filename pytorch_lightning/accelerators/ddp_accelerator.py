@@ -16,10 +16,9 @@ import torch
 import torch.distributed as torch_distrib
 import subprocess
 import sys
+import time
 from os.path import abspath
-from time import sleep
 from typing import Optional
-import numpy as np
 
 
 from pytorch_lightning import _logger as log
@@ -29,6 +28,7 @@ from pytorch_lightning.utilities.distributed import rank_zero_only
 from pytorch_lightning.utilities import AMPType
 from pytorch_lightning.utilities.seed import seed_everything
 from pytorch_lightning.distributed.dist import LightningDistributed
+from pytorch_lightning.distributed.rendezvous import LocalRendezvous
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.overrides.data_parallel import LightningDistributedDataParallel
 from torch.nn.parallel import DistributedDataParallel
@@ -53,6 +53,7 @@ class DDPAccelerator(Accelerator):
         self.interactive_ddp_procs = []
         self.dist = LightningDistributed()
         self.nickname = 'ddp'
+        self.startup_timings = {}
 
     def setup(self, model):
         # first track model
@@ -61,6 +62,11 @@ class DDPAccelerator(Accelerator):
         # start the other scripts
         if os.environ.get('PL_IN_DDP_SUBPROCESS', '0') != '1':
             self._call_children_scripts()
+        else:
+            # let the launching process know this one made it
+            rendezvous = LocalRendezvous.from_env()
+            if rendezvous is not None:
+                rendezvous.signal_ready(int(os.environ['LOCAL_RANK']))
 
         # set the task idx
         self.task_idx = int(os.environ['PL_DDP_PID'])
@@ -115,11 +121,16 @@ class DDPAccelerator(Accelerator):
 
         os.environ['WORLD_SIZE'] = f'{num_gpus * self.trainer.num_nodes}'
 
+        # start all processes at once, then wait until each one got through its startup
+        rendezvous = LocalRendezvous()
+        start_time = time.time()
         self.interactive_ddp_procs = []
+        procs = {}
         for local_rank in range(1, self.trainer.num_processes):
             env_copy = os.environ.copy()
             env_copy['LOCAL_RANK'] = f'{local_rank}'
             env_copy['PL_DDP_PID'] = str(self.trainer.data_parallel_device_ids[local_rank])
+            rendezvous.export(env_copy)
             # remove env var if global seed not set
             if os.environ.get('PL_GLOBAL_SEED') is None and 'PL_GLOBAL_SEED' in env_copy:
                 del env_copy['PL_GLOBAL_SEED']
@@ -132,11 +143,21 @@ class DDPAccelerator(Accelerator):
                     cwd = get_original_cwd()
             proc = subprocess.Popen(command, env=env_copy, cwd=cwd)
             self.interactive_ddp_procs.append(proc)
+            procs[local_rank] = proc
+        self.startup_timings['spawn'] = time.time() - start_time
 
-            # starting all processes at once can cause issues
-            # with dataloaders delay between 1-10 seconds
-            delay = np.random.uniform(1, 5, 1)[0]
-            sleep(delay)
+        try:
+            ready = rendezvous.wait_ready(
+                procs, start_time, timeout=float(os.environ.get('PL_DDP_STARTUP_TIMEOUT', 1800))
+            )
+        except RuntimeError:
+            for proc in self.interactive_ddp_procs:
+                if proc.poll() is None:
+                    proc.kill()
+            raise
+        finally:
+            rendezvous.cleanup()
+        self.startup_timings['ready'] = max(ready.values(), default=0.)
 
         os.environ['PL_DDP_PID'] = str(0)
 
@@ -193,14 +214,10 @@ class DDPAccelerator(Accelerator):
         pass
 
     def early_stopping_should_stop(self, pl_module):
-        stop = torch.tensor(int(self.trainer.should_stop), device=pl_module.device)
-        torch_distrib.all_reduce(stop, op=torch_distrib.reduce_op.SUM)
-        torch_distrib.barrier()
-        should_stop = stop == self.trainer.world_size
-        return should_stop
+        return self.submit_early_stopping_decision(pl_module)
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
     def ddp_train(self, process_idx, model):
         """
@@ -232,11 +249,18 @@ class DDPAccelerator(Accelerator):
         # try to init for 20 times at max in case ports are taken
         # where to store ip_table
         model.trainer = self.trainer
+        start_time = time.time()
         self.init_ddp_connection(
             self.trainer.global_rank,
             self.trainer.world_size,
             self.trainer.is_slurm_managing_tasks
         )
+        self.startup_timings['init_process_group'] = time.time() - start_time
+        if self._has_spawned_children:
+            log.info(
+                'DDP startup: launched processes in {spawn:.2f}s, all ready after {ready:.2f}s,'
+                ' process group initialized in {init_process_group:.2f}s'.format(**self.startup_timings)
+            )
 
         # call setup after the ddp process has connected
         self.trainer.call_setup_hook(model)
@@ -14,7 +14,6 @@
 import os
 import torch
 import torch.distributed as torch_distrib
-import torch.distributed as dist
 
 from pytorch_lightning.accelerators.accelerator import Accelerator
 from pytorch_lightning import _logger as log
@@ -91,14 +90,10 @@ class DDPCPUSLURMAccelerator(Accelerator):
             torch_distrib.barrier()
 
     def early_stopping_should_stop(self, pl_module):
-        stop = torch.tensor(int(self.trainer.should_stop), device=pl_module.device)
-        dist.all_reduce(stop, op=dist.reduce_op.SUM)
-        dist.barrier()
-        should_stop = stop == self.trainer.world_size
-        return should_stop
+        return self.submit_early_stopping_decision(pl_module)
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
     def ddp_train(self, process_idx, model):
         """
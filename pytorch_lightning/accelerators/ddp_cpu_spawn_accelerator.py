@@ -16,7 +16,6 @@ import re
 
 import torch
 import torch.distributed as torch_distrib
-import torch.distributed as dist
 import torch.multiprocessing as mp
 
 from pytorch_lightning import _logger as log
@@ -26,6 +25,7 @@ from pytorch_lightning.utilities.cloud_io import atomic_save, load as pl_load
 from pytorch_lightning.utilities.distributed import rank_zero_only, rank_zero_warn
 from pytorch_lightning.utilities.distributed import find_free_network_port
 from pytorch_lightning.distributed.dist import LightningDistributed
+from pytorch_lightning.distributed.shared_weights import SharedWeights
 from pytorch_lightning.overrides.data_parallel import LightningDistributedDataParallel
 from torch.nn.parallel import DistributedDataParallel
 from typing import List, Optional
@@ -44,6 +44,7 @@ class DDPCPUSpawnAccelerator(Accelerator):
     def __init__(self, trainer, nprocs, cluster_environment=None):
         super().__init__(trainer, cluster_environment)
         self.mp_queue = None
+        self.shared_weights = None
         self.nprocs = nprocs
         self.dist = LightningDistributed()
         self.nickname = 'ddp_cpu'
@@ -60,15 +61,19 @@ class DDPCPUSpawnAccelerator(Accelerator):
     def train(self):
         model = self.trainer.model
 
+        # the children copy the trained weights back into this memory
+        SharedWeights.share(model)
+
         # train in children process
         mp.spawn(self.ddp_train, nprocs=self.nprocs, args=(self.mp_queue, model,))
 
         # restore main state with best weights
         best_path = self.mp_queue.get()
         results = self.mp_queue.get()
+        missing_weights = self.mp_queue.get()
 
         # recover the weights of the processes trained in the children
-        self.__recover_child_process_weights(model, best_path)
+        self.__recover_child_process_weights(model, best_path, missing_weights)
         return results
 
     def ddp_train(self, process_idx, mp_queue, model):
@@ -80,6 +85,10 @@ class DDPCPUSpawnAccelerator(Accelerator):
             model:
         Returns:
         """
+        # keep the memory shared with the main process, and train a copy of it which only this process updates
+        self.shared_weights = SharedWeights(model)
+        self.shared_weights.make_private(model)
+
         # show progressbar only on progress_rank 0
         if (self.trainer.node_rank != 0 or process_idx != 0) and self.trainer.progress_bar_callback is not None:
             self.trainer.progress_bar_callback.disable()
@@ -169,14 +178,10 @@ class DDPCPUSpawnAccelerator(Accelerator):
             torch_distrib.barrier()
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
     def early_stopping_should_stop(self, pl_module):
-        stop = torch.tensor(int(self.trainer.should_stop), device=pl_module.device)
-        dist.all_reduce(stop, op=dist.reduce_op.SUM)
-        dist.barrier()
-        should_stop = stop == self.trainer.world_size
-        return should_stop
+        return self.submit_early_stopping_decision(pl_module)
 
     def set_world_ranks(self, process_idx):
         self.trainer.local_rank = process_idx
@@ -190,11 +195,15 @@ class DDPCPUSpawnAccelerator(Accelerator):
         device_ids = None
         return device_ids
 
-    def __recover_child_process_weights(self, model, best_path):
+    def __recover_child_process_weights(self, model, best_path, missing_weights):
         # transfer back the best path to the trainer
         if self.trainer.checkpoint_callback:
             self.trainer.checkpoint_callback.best_model_path = best_path
 
+        # the last weights are already in the shared memory of the model, load the ones which were not
+        if not self.trainer.testing:
+            SharedWeights.restore(model, missing_weights)
+
         self.trainer.model = model
 
     def transfer_distrib_spawn_state_on_fit_end(self, model, mp_queue, results):
@@ -209,6 +218,12 @@ class DDPCPUSpawnAccelerator(Accelerator):
             mp_queue.put(best_model_path)
             mp_queue.put(results)
 
+            # hand back the last weights
+            missing_weights = None
+            if not self.trainer.testing:
+                missing_weights = self.shared_weights.hand_back(model)
+            mp_queue.put(missing_weights)
+
     def configure_ddp(
         self, model: "LightningModule", device_ids: List[int]
     ) -> DistributedDataParallel:
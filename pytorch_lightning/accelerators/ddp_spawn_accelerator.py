@@ -12,20 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 import os
-import re
 
 import torch
 import torch.multiprocessing as mp
 import torch.distributed as torch_distrib
-import torch.distributed as dist
 
 from pytorch_lightning import _logger as log
 from pytorch_lightning.accelerators.accelerator import Accelerator
 from pytorch_lightning.utilities import AMPType
-from pytorch_lightning.utilities.cloud_io import atomic_save, load as pl_load
 from pytorch_lightning.utilities.distributed import rank_zero_only, rank_zero_warn
 from pytorch_lightning.utilities.seed import seed_everything
 from pytorch_lightning.distributed.dist import LightningDistributed
+from pytorch_lightning.distributed.shared_weights import SharedWeights
 from pytorch_lightning.utilities.distributed import find_free_network_port
 from pytorch_lightning.overrides.data_parallel import LightningDistributedDataParallel
 from torch.nn.parallel import DistributedDataParallel
@@ -45,6 +43,7 @@ class DDPSpawnAccelerator(Accelerator):
     def __init__(self, trainer, nprocs, cluster_environment=None):
         super().__init__(trainer, cluster_environment)
         self.mp_queue = None
+        self.shared_weights = None
         self.nprocs = nprocs
         self.dist = LightningDistributed()
         self.nickname = 'ddp'
@@ -61,16 +60,19 @@ class DDPSpawnAccelerator(Accelerator):
     def train(self):
         model = self.trainer.model
 
+        # the children copy the trained weights back into this memory
+        SharedWeights.share(model)
+
         # train in children process
         mp.spawn(self.ddp_train, nprocs=self.nprocs, args=(self.mp_queue, model,))
 
         # restore main state with best weights
         best_path = self.mp_queue.get()
         results = self.mp_queue.get()
-        last_path = self.mp_queue.get()
+        missing_weights = self.mp_queue.get()
 
         # recover the weights of the processes trained in the children
-        self.__recover_child_process_weights(model, best_path, last_path)
+        self.__recover_child_process_weights(model, best_path, missing_weights)
         return results
 
     def ddp_train(self, process_idx, mp_queue, model, is_master=False, proc_offset=0):
@@ -85,6 +87,9 @@ class DDPSpawnAccelerator(Accelerator):
         Returns:
 
         """
+        # keep the memory shared with the main process, before the model moves to its device
+        self.shared_weights = SharedWeights(model)
+
         seed = os.environ.get("PL_GLOBAL_SEED")
         if seed is not None:
             seed_everything(int(seed))
@@ -196,25 +201,20 @@ class DDPSpawnAccelerator(Accelerator):
             torch_distrib.barrier()
 
     def early_stopping_should_stop(self, pl_module):
-        stop = torch.tensor(int(self.trainer.should_stop), device=pl_module.device)
-        dist.all_reduce(stop, op=dist.reduce_op.SUM)
-        dist.barrier()
-        should_stop = stop == self.trainer.world_size
-        return should_stop
+        return self.submit_early_stopping_decision(pl_module)
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
-    def __recover_child_process_weights(self, model, best_path, last_path):
+    def __recover_child_process_weights(self, model, best_path, missing_weights):
         # transfer back the best path to the trainer
         if self.trainer.checkpoint_callback:
             self.trainer.checkpoint_callback.best_model_path = best_path
         # todo, pass also best score
 
-        # load last weights
-        if last_path is not None and not self.trainer.testing:
-            ckpt = pl_load(last_path, map_location=lambda storage, loc: storage)
-            model.load_state_dict(ckpt)
+        # the last weights are already in the shared memory of the model, load the ones which were not
+        if not self.trainer.testing:
+            SharedWeights.restore(model, missing_weights)
 
         self.trainer.model = model
 
@@ -229,12 +229,11 @@ class DDPSpawnAccelerator(Accelerator):
             mp_queue.put(best_model_path)
             mp_queue.put(results)
 
-            # save the last weights
-            last_path = None
-            if not self.trainer.testing and best_model_path is not None and len(best_model_path) > 0:
-                last_path = re.sub('.ckpt', '.tmp_end.ckpt', best_model_path)
-                atomic_save(model.state_dict(), last_path)
-            mp_queue.put(last_path)
+            # hand back the last weights
+            missing_weights = None
+            if not self.trainer.testing:
+                missing_weights = self.shared_weights.hand_back(model)
+            mp_queue.put(missing_weights)
 
     def configure_ddp(
         self, model: "LightningModule", device_ids: List[int]
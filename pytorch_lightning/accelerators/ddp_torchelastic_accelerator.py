@@ -100,7 +100,7 @@ class DDPTorchElasticAccelerator(Accelerator):
         return should_stop
 
     def broadcast(self, obj, src=0):
-        return self.dist.broadcast(obj)
+        return self.dist.broadcast(obj, src)
 
     def ddp_train(self, process_idx, model):
         """
@@ -102,12 +102,19 @@ class GPUAccelerator(Accelerator):
         output = self.trainer.model.test_step(*args)
         return output
 
+    def batch_device(self):
+        return torch.device('cuda', self._root_gpu_id())
+
     def to_device(self, batch):
-        gpu_id = 0
-        if isinstance(self.trainer.data_parallel_device_ids, list):
-            gpu_id = self.trainer.data_parallel_device_ids[0]
+        gpu_id = self._root_gpu_id()
 
         # Don't copy the batch since there is a single gpu that the batch could
         # be referenced from and if there are multiple optimizers the batch will
         # wind up copying it to the same device repeatedly.
         return self.batch_to_device(batch, gpu_id)
+
+    def _root_gpu_id(self):
+        gpu_id = 0
+        if isinstance(self.trainer.data_parallel_device_ids, list):
+            gpu_id = self.trainer.data_parallel_device_ids[0]
+        return gpu_id
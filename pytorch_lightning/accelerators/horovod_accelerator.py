@@ -110,6 +110,11 @@ class HorovodAccelerator(Accelerator):
     def teardown(self):
         pass
 
+    def batch_device(self):
+        if self.trainer.on_gpu:
+            return torch.device('cuda', hvd.local_rank())
+        return None
+
     def training_step(self, args):
         if self.trainer.on_gpu:
             batch = args[0]
@@ -23,31 +23,248 @@ Monitor and logs GPU stats during training.
 import os
 import shutil
 import subprocess
+import threading
 import time
-from typing import List, Tuple, Dict
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from pytorch_lightning import _logger as log
 from pytorch_lightning.callbacks.base import Callback
-from pytorch_lightning.utilities import rank_zero_only
+from pytorch_lightning.utilities import _module_available, rank_zero_only
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.parsing import AttributeDict
 
+PSUTIL_AVAILABLE = _module_available("psutil")
+PYNVML_AVAILABLE = _module_available("pynvml")
+
+
+class StatsSource(ABC):
+    """
+    A source of device or host stats, polled by the sampling thread of :class:`GPUStatsMonitor`.
+
+    Subclass it to log other stats, or to feed fixed stats in tests.
+    """
+
+    def start(self):
+        """Called in the sampling thread before the first sample."""
+
+    @abstractmethod
+    def sample(self) -> Dict[str, float]:
+        """The current stats, by the name they are logged with."""
+
+    def stop(self):
+        """Called in the sampling thread after the last sample."""
+
+
+class NvidiaSmiStatsSource(StatsSource):
+    """Reads the GPU stats from ``nvidia-smi --query-gpu``, one call per sample."""
+
+    def __init__(self, gpu_ids: str, keys: List[Tuple[str, str]]):
+        self.gpu_ids = gpu_ids
+        self.keys = keys
+
+    def sample(self) -> Dict[str, float]:
+        gpu_query = ','.join(k for k, _ in self.keys)
+        format = 'csv,nounits,noheader'
+        result = subprocess.run(
+            [shutil.which('nvidia-smi'), f'--query-gpu={gpu_query}', f'--format={format}', f'--id={self.gpu_ids}'],
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,  # for backward compatibility with python version 3.6
+            check=True
+        )
+
+        def _to_float(x: str) -> float:
+            try:
+                return float(x)
+            except ValueError:
+                return 0.
+
+        stats = result.stdout.strip().split(os.linesep)
+        stats = [[_to_float(x) for x in s.split(', ')] for s in stats]
+        return GPUStatsMonitor._parse_gpu_stats(self.gpu_ids, stats, self.keys)
+
+
+class NVMLStatsSource(StatsSource):
+    """
+    Reads the GPU stats through the NVML bindings of ``pynvml``, without starting a process per sample.
+    NVML does not report ``temperature.memory``.
+    """
+
+    def __init__(self, gpu_ids: str, keys: List[Tuple[str, str]]):
+        self.gpu_ids = gpu_ids
+        self.keys = keys
+        self._handles = []
+
+    def start(self):
+        import pynvml
+        pynvml.nvmlInit()
+        self._handles = [pynvml.nvmlDeviceGetHandleByIndex(int(i)) for i in self.gpu_ids.split(',')]
+
+    def sample(self) -> Dict[str, float]:
+        import pynvml
+        logs = {}
+        for gpu_id, handle in zip(self.gpu_ids.split(','), self._handles):
+            stats = {}
+            query_keys = {k for k, _ in self.keys}
+            if query_keys & {'utilization.gpu', 'utilization.memory'}:
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                stats['utilization.gpu'], stats['utilization.memory'] = utilization.gpu, utilization.memory
+            if query_keys & {'memory.used', 'memory.free'}:
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                stats['memory.used'], stats['memory.free'] = memory.used / 1024 ** 2, memory.free / 1024 ** 2
+            if 'fan.speed' in query_keys:
+                stats['fan.speed'] = pynvml.nvmlDeviceGetFanSpeed(handle)
+            if 'temperature.gpu' in query_keys:
+                stats['temperature.gpu'] = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            for key, unit in self.keys:
+                if key in stats:
+                    logs[f'gpu_id: {gpu_id}/{key} ({unit})'] = float(stats[key])
+        return logs
+
+    def stop(self):
+        import pynvml
+        pynvml.nvmlShutdown()
+
+
+class HostStatsSource(StatsSource):
+    """Reads the CPU utilization and the host memory, with ``psutil`` or else from ``/proc``."""
+
+    def __init__(self):
+        self._cpu_times = None
+
+    def sample(self) -> Dict[str, float]:
+        if PSUTIL_AVAILABLE:
+            import psutil
+            memory = psutil.virtual_memory()
+            # the utilization since the last sample
+            cpu_utilization = psutil.cpu_percent(interval=None)
+            used, free = memory.total - memory.available, memory.available
+        else:
+            cpu_utilization = self._proc_cpu_percent()
+            meminfo = self._proc_meminfo()
+            free = meminfo['MemAvailable']
+            used = meminfo['MemTotal'] - free
+        return {
+            'host/cpu_utilization (%)': cpu_utilization,
+            'host/memory.used (MB)': used / 1024 ** 2,
+            'host/memory.free (MB)': free / 1024 ** 2,
+        }
+
+    def _proc_cpu_percent(self) -> float:
+        with open('/proc/stat') as f:
+            times = [int(x) for x in f.readline().split()[1:]]
+        # idle and iowait
+        idle, total = times[3] + times[4], sum(times)
+        previous, self._cpu_times = self._cpu_times, (idle, total)
+        if previous is None or total == previous[1]:
+            return 0.
+        return 100. * (1 - (idle - previous[0]) / (total - previous[1]))
+
+    @staticmethod
+    def _proc_meminfo() -> Dict[str, int]:
+        meminfo = {}
+        with open('/proc/meminfo') as f:
+            for line in f:
+                name, value = line.split(':', 1)
+                meminfo[name] = int(value.split()[0]) * 1024
+        return meminfo
+
+
+class StatsSampler(object):
+    """
+    Polls stats sources every ``interval`` seconds in a background thread, keeping the last ``history`` samples.
+
+    Example:
+
+        >>> class StepSource(StatsSource):
+        ...     def __init__(self):
+        ...         self.step = 0
+        ...     def sample(self):
+        ...         self.step += 1
+        ...         return {'step': self.step}
+        >>> sampler = StatsSampler([StepSource()], interval=0.01)
+        >>> sampler.start()
+        >>> sampler.stop()
+        >>> sampler.latest()['step'] == len(sampler.samples)
+        True
+    """
+
+    def __init__(self, sources: Sequence[StatsSource], interval: float = 0.1, history: int = 100):
+        self.sources = list(sources)
+        self.interval = interval
+        # the ring buffer of (time.perf_counter(), stats) tuples
+        self.samples = deque(maxlen=history)
+        self._stop = threading.Event()
+        self._started = threading.Event()
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        # the first sample is there when the training starts
+        self._started.wait()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def latest(self) -> Dict[str, float]:
+        """The stats of the last sample, without waiting for the sources."""
+        if self._error is not None:
+            raise self._error
+        return self.samples[-1][1] if self.samples else {}
+
+    def _run(self):
+        started = []
+        try:
+            for source in self.sources:
+                source.start()
+                started.append(source)
+            while True:
+                stats = {}
+                for source in self.sources:
+                    stats.update(source.sample())
+                self.samples.append((time.perf_counter(), stats))
+                self._started.set()
+                if self._stop.wait(self.interval):
+                    break
+        except Exception as err:
+            log.warning(f'Sampling stats failed: {err}')
+            self._error = err
+        finally:
+            for source in started:
+                source.stop()
+            self._started.set()
+
 
 class GPUStatsMonitor(Callback):
     r"""
     Automatically monitors and logs GPU stats during training stage. ``GPUStatsMonitor``
     is a callback and in order to use it you need to assign a logger in the ``Trainer``.
 
+    The stats are sampled in a background thread every ``sampling_interval`` seconds, the step hooks only log the
+    latest sample, so monitoring does not slow down the steps it measures.
+
     Args:
         memory_utilization: Set to ``True`` to monitor used, free and percentage of memory
-            utilization at the start and end of each step. Default: ``True``.
-        gpu_utilization: Set to ``True`` to monitor percentage of GPU utilization
-            at the start and end of each step. Default: ``True``.
+            utilization. Default: ``True``.
+        gpu_utilization: Set to ``True`` to monitor percentage of GPU utilization. Default: ``True``.
         intra_step_time: Set to ``True`` to monitor the time of each step. Default: ``False``.
         inter_step_time: Set to ``True`` to monitor the time between the end of one step
             and the start of the next step. Default: ``False``.
         fan_speed: Set to ``True`` to monitor percentage of fan speed. Default: ``False``.
         temperature: Set to ``True`` to monitor the memory and gpu temperature in degree Celsius.
             Default: ``False``.
+        host_stats: Set to ``True`` to monitor the CPU utilization and the used and free host memory.
+            Together with the GPU stats turned off, the callback also runs on CPU-only nodes. Default: ``False``.
+        sampling_interval: How many seconds to wait between two samples. Default: ``0.1``.
+        sources: The stats sources to sample instead of the ones the flags above select.
 
     Example::
 
@@ -56,7 +273,8 @@ class GPUStatsMonitor(Callback):
         >>> gpu_stats = GPUStatsMonitor() # doctest: +SKIP
         >>> trainer = Trainer(callbacks=[gpu_stats]) # doctest: +SKIP
 
-    GPU stats are mainly based on `nvidia-smi --query-gpu` command. The description of the queries is as follows:
+    GPU stats are read with the NVML bindings of ``pynvml`` when they are installed and with the
+    `nvidia-smi --query-gpu` command otherwise. The description of the queries is as follows:
 
     - **fan.speed** – The fan speed value is the percent of maximum speed that the device's fan is currently
       intended to run at. It ranges from 0 to 100 %. Note: The reported speed is the intended fan speed.
@@ -80,23 +298,31 @@ class GPUStatsMonitor(Callback):
         intra_step_time: bool = False,
         inter_step_time: bool = False,
         fan_speed: bool = False,
-        temperature: bool = False
+        temperature: bool = False,
+        host_stats: bool = False,
+        sampling_interval: float = 0.1,
+        sources: Optional[Sequence[StatsSource]] = None,
     ):
         super().__init__()
 
-        if shutil.which('nvidia-smi') is None:
-            raise MisconfigurationException(
-                'Cannot use GPUStatsMonitor callback because NVIDIA driver is not installed.'
-            )
-
         self._log_stats = AttributeDict({
             'memory_utilization': memory_utilization,
             'gpu_utilization': gpu_utilization,
             'intra_step_time': intra_step_time,
             'inter_step_time': inter_step_time,
             'fan_speed': fan_speed,
-            'temperature': temperature
+            'temperature': temperature,
+            'host_stats': host_stats,
         })
+        self._sampling_interval = sampling_interval
+        self._sources = sources
+        self._sampler = None
+
+        if sources is None and self._get_gpu_stat_keys() + self._get_gpu_device_stat_keys():
+            if not PYNVML_AVAILABLE and shutil.which('nvidia-smi') is None:
+                raise MisconfigurationException(
+                    'Cannot use GPUStatsMonitor callback because NVIDIA driver is not installed.'
+                )
 
     def on_train_start(self, trainer, pl_module):
         if not trainer.logger:
@@ -104,13 +330,30 @@ class GPUStatsMonitor(Callback):
                 'Cannot use GPUStatsMonitor callback with Trainer that has no logger.'
             )
 
-        if not trainer.on_gpu:
+        gpu_stat_keys = self._get_gpu_stat_keys() + self._get_gpu_device_stat_keys()
+        if self._sources is None and gpu_stat_keys and not trainer.on_gpu:
             raise MisconfigurationException(
                 'You are using GPUStatsMonitor but are not running on GPU'
                 f' since gpus attribute in Trainer is set to {trainer.gpus}.'
             )
 
-        self._gpu_ids = ','.join(map(str, trainer.data_parallel_device_ids))
+        sources = self._sources
+        if sources is None:
+            sources = []
+            if gpu_stat_keys:
+                gpu_ids = ','.join(map(str, trainer.data_parallel_device_ids))
+                source_cls = NVMLStatsSource if PYNVML_AVAILABLE else NvidiaSmiStatsSource
+                sources.append(source_cls(gpu_ids, gpu_stat_keys))
+            if self._log_stats.host_stats:
+                sources.append(HostStatsSource())
+
+        if trainer.is_global_zero:
+            self._sampler = StatsSampler(sources, self._sampling_interval)
+            self._sampler.start()
+
+    def on_train_end(self, trainer, pl_module):
+        if self._sampler is not None:
+            self._sampler.stop()
 
     def on_train_epoch_start(self, trainer, pl_module):
         self._snap_intra_step_time = None
@@ -118,55 +361,26 @@ class GPUStatsMonitor(Callback):
 
     @rank_zero_only
     def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
-        gpu_stat_keys = self._get_gpu_stat_keys()
-        gpu_stats = self._get_gpu_stats([k for k, _ in gpu_stat_keys])
-        logs = self._parse_gpu_stats(self._gpu_ids, gpu_stats, gpu_stat_keys)
-
         if self._log_stats.inter_step_time and self._snap_inter_step_time:
             # First log at beginning of second step
-            logs['batch_time/inter_step (ms)'] = (time.time() - self._snap_inter_step_time) * 1000
+            logs = {'batch_time/inter_step (ms)': (time.perf_counter() - self._snap_inter_step_time) * 1000}
+            trainer.logger.log_metrics(logs, step=trainer.global_step)
 
         if self._log_stats.intra_step_time:
-            self._snap_intra_step_time = time.time()
-
-        trainer.logger.log_metrics(logs, step=trainer.global_step)
+            self._snap_intra_step_time = time.perf_counter()
 
     @rank_zero_only
     def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
-        gpu_stat_keys = self._get_gpu_stat_keys() + self._get_gpu_device_stat_keys()
-        gpu_stats = self._get_gpu_stats([k for k, _ in gpu_stat_keys])
-        logs = self._parse_gpu_stats(self._gpu_ids, gpu_stats, gpu_stat_keys)
+        logs = dict(self._sampler.latest())
 
         if self._log_stats.inter_step_time:
-            self._snap_inter_step_time = time.time()
+            self._snap_inter_step_time = time.perf_counter()
 
         if self._log_stats.intra_step_time and self._snap_intra_step_time:
-            logs['batch_time/intra_step (ms)'] = (time.time() - self._snap_intra_step_time) * 1000
+            logs['batch_time/intra_step (ms)'] = (time.perf_counter() - self._snap_intra_step_time) * 1000
 
         trainer.logger.log_metrics(logs, step=trainer.global_step)
 
-    def _get_gpu_stats(self, queries: List[str]) -> List[List[float]]:
-        """Run nvidia-smi to get the gpu stats"""
-        gpu_query = ','.join(queries)
-        format = 'csv,nounits,noheader'
-        result = subprocess.run(
-            [shutil.which('nvidia-smi'), f'--query-gpu={gpu_query}', f'--format={format}', f'--id={self._gpu_ids}'],
-            encoding="utf-8",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,  # for backward compatibility with python version 3.6
-            check=True
-        )
-
-        def _to_float(x: str) -> float:
-            try:
-                return float(x)
-            except ValueError:
-                return 0.
-
-        stats = result.stdout.strip().split(os.linesep)
-        stats = [[_to_float(x) for x in s.split(', ')] for s in stats]
-        return stats
-
     @staticmethod
     def _parse_gpu_stats(gpu_ids: str, stats: List[List[float]], keys: List[Tuple[str, str]]) -> Dict[str, float]:
         """Parse the gpu stats into a loggable dict"""
@@ -32,7 +32,8 @@ import torch
 from pytorch_lightning import _logger as log
 from pytorch_lightning.callbacks.base import Callback
 from pytorch_lightning.utilities import rank_zero_only, rank_zero_warn, rank_zero_info
-from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.checkpoint_store import IncrementalCheckpointStore
+from pytorch_lightning.utilities.cloud_io import alias_file, get_filesystem
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 
@@ -89,6 +90,11 @@ class ModelCheckpoint(Callback):
             saved (``model.save_weights(filepath)``), else the full model
             is saved (``model.save(filepath)``).
         period: Interval (number of epochs) between checkpoints.
+        incremental: if ``True``, checkpoints are saved as small manifests which reference their tensors in a
+            content-addressed store next to them, so only the tensors which changed since an earlier checkpoint
+            are written. Blobs no checkpoint references anymore are removed with the top-k checkpoints.
+            The checkpoints load like any other with ``load_from_checkpoint`` or ``resume_from_checkpoint``.
+            Default: ``False``.
 
     Example::
 
@@ -129,6 +135,7 @@ class ModelCheckpoint(Callback):
         mode: str = "auto",
         period: int = 1,
         prefix: str = "",
+        incremental: bool = False,
     ):
         super().__init__()
         self.monitor = monitor
@@ -137,6 +144,8 @@ class ModelCheckpoint(Callback):
         self.save_top_k = save_top_k
         self.save_weights_only = save_weights_only
         self.period = period
+        self.incremental = incremental
+        self._store = None
         self.last_global_step_saved = -1
         self.prefix = prefix
         self.best_k_models = {}
@@ -146,6 +155,8 @@ class ModelCheckpoint(Callback):
         self.last_model_path = ""
         self.save_function = None
         self.warned_result_obj = False
+        # the global step and path of the last checkpoint written, later saves at that step link to it
+        self._last_saved_checkpoint = (None, None)
 
         if save_top_k is None and monitor is not None:
             self.save_top_k = 1
@@ -159,6 +170,9 @@ class ModelCheckpoint(Callback):
         When pretrain routine starts we build the ckpt dir on the fly
         """
         self.__resolve_ckpt_dir(trainer, pl_module)
+        self._last_saved_checkpoint = (None, None)
+        if self.incremental:
+            self._store = IncrementalCheckpointStore(self.dirpath)
 
     def on_validation_end(self, trainer, pl_module):
         """
@@ -278,9 +292,12 @@ class ModelCheckpoint(Callback):
 
     @rank_zero_only
     def _del_model(self, filepath: str):
+        # a checkpoint linked to another one only loses its own name, the other keeps the data
         if self._fs.exists(filepath):
             self._fs.rm(filepath)
             log.debug(f"Removed checkpoint: {filepath}")
+            if self._store is not None:
+                self._store.collect_garbage()
 
     def _save_model(self, filepath: str, trainer, pl_module):
         # in debugging, track when we save checkpoints
@@ -290,11 +307,21 @@ class ModelCheckpoint(Callback):
         if trainer.is_global_zero:
             self._fs.makedirs(os.path.dirname(filepath), exist_ok=True)
 
+        # the checkpoint of this step was already written to another path, alias it instead of dumping it again
+        saved_step, saved_path = self._last_saved_checkpoint
+        if saved_step == trainer.global_step and saved_path is not None:
+            if trainer.is_global_zero and saved_path != filepath:
+                alias_file(saved_path, filepath)
+            return
+
         # delegate the saving to the trainer
-        if self.save_function is not None:
+        if self.save_function is not None and self._store is not None:
+            self.save_function(filepath, self.save_weights_only, store=self._store)
+        elif self.save_function is not None:
             self.save_function(filepath, self.save_weights_only)
         else:
             raise ValueError(".save_function() not set")
+        self._last_saved_checkpoint = (trainer.global_step, filepath)
 
     def check_monitor_top_k(self, current) -> bool:
         if current is None:
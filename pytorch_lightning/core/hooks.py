@@ -21,12 +21,6 @@ from torch.optim.optimizer import Optimizer
 from torch.utils.data import DataLoader
 
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
-
 class ModelHooks:
     def setup(self, stage: str):
         """
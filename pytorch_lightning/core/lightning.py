@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import collections
+import collections.abc
 import copy
 import inspect
 import os
@@ -20,7 +20,7 @@ import re
 import tempfile
 from abc import ABC
 from argparse import Namespace
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import torch
 from pytorch_lightning import _logger as log
@@ -1111,7 +1111,8 @@ class LightningModule(
 
         .. note:: Only called when using multiple optimizers
 
-        Override for your own behavior
+        Override for your own behavior. Unless it is overridden, the trainer switches the parameters
+        the same way, flipping only the ones the optimizers don't share.
 
         Args:
             optimizer:
@@ -1215,7 +1216,7 @@ class LightningModule(
     ):
         optimizer.zero_grad()
 
-    def tbptt_split_batch(self, batch: Tensor, split_size: int) -> list:
+    def tbptt_split_batch(self, batch: Tensor, split_size: int) -> Iterable:
         r"""
         When using truncated backpropagation through time, each batch must be split along the
         time dimension. Lightning handles this by default, but for custom behavior override
@@ -1226,9 +1227,11 @@ class LightningModule(
             split_size: The size of the split
 
         Return:
-            List of batch splits. Each split will be passed to :meth:`training_step` to enable truncated
-            back propagation through time. The default implementation splits root level Tensors and
-            Sequences at dim=1 (i.e. time dim). It assumes that each time dim is the same length.
+            Iterable of batch splits, a list or a generator. Each split will be passed to :meth:`training_step`
+            to enable truncated back propagation through time. The default implementation lazily splits root
+            level Tensors at dim=1 (i.e. time dim) and the items of root level Sequences at dim=0, recursing into
+            Mappings. It assumes that each time dim is the same length. Tensors are split into views with
+            :meth:`~torch.Tensor.narrow`, so no split copies the data of the batch.
 
         Examples:
             .. code-block:: python
@@ -1258,36 +1261,23 @@ class LightningModule(
             Each returned batch split is passed separately to :meth:`training_step`.
 
         """
+        elements = batch.values() if isinstance(batch, collections.abc.Mapping) else batch
         time_dims = [
             len(x[0])
-            for x in batch
-            if isinstance(x, (torch.Tensor, collections.Sequence))
+            for x in elements
+            if isinstance(x, (torch.Tensor, collections.abc.Sequence))
         ]
         assert len(time_dims) >= 1, "Unable to determine batch time dimension"
         assert all(
             x == time_dims[0] for x in time_dims
         ), "Batch time dimension length is ambiguous"
 
-        splits = []
-        for t in range(0, time_dims[0], split_size):
-            batch_split = []
-            for i, x in enumerate(batch):
-                if isinstance(x, torch.Tensor):
-                    split_x = x[:, t : t + split_size]
-                elif isinstance(x, collections.Sequence):
-                    split_x = [None] * len(x)
-                    for batch_idx in range(len(x)):
-                        split_x[batch_idx] = x[batch_idx][t : t + split_size]
-
-                batch_split.append(split_x)
-
-            splits.append(batch_split)
-
-        return splits
+        return (_tbptt_split(batch, t, split_size) for t in range(0, time_dims[0], split_size))
 
     def summarize(self, mode: str = ModelSummary.MODE_DEFAULT) -> ModelSummary:
         model_summary = ModelSummary(self, mode=mode)
-        log.info("\n" + str(model_summary))
+        # the summary is only computed when it is logged
+        log.info("\n%s", model_summary)
         return model_summary
 
     def freeze(self) -> None:
@@ -1638,3 +1628,24 @@ class LightningModule(
             return "hparams"
 
         return None
+
+
+def _tbptt_split(batch: Any, start: int, length: int) -> Any:
+    """The split of ``batch`` at ``start`` along its time dimension, tensors are split into views."""
+    if isinstance(batch, collections.abc.Mapping):
+        return {k: _tbptt_split_element(x, start, length) for k, x in batch.items()}
+    return [_tbptt_split_element(x, start, length) for x in batch]
+
+
+def _tbptt_split_element(x: Any, start: int, length: int) -> Any:
+    if isinstance(x, torch.Tensor):
+        return x.narrow(1, start, min(length, x.size(1) - start))
+    if isinstance(x, collections.abc.Mapping):
+        return _tbptt_split(x, start, length)
+    if isinstance(x, collections.abc.Sequence):
+        return [
+            item.narrow(0, start, min(length, len(item) - start)) if isinstance(item, torch.Tensor)
+            else item[start:start + length]
+            for item in x
+        ]
+    return x
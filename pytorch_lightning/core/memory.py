@@ -15,7 +15,9 @@
 import os
 import shutil
 import subprocess
+import weakref
 from collections import OrderedDict
+from contextlib import ExitStack
 from typing import Tuple, Dict, Union, List, Any
 
 import numpy as np
@@ -24,10 +26,20 @@ import torch.nn as nn
 from torch.utils.hooks import RemovableHandle
 
 from pytorch_lightning.utilities import AMPType
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+
+try:
+    from torch._subclasses.fake_tensor import FakeTensorMode
+except ImportError:  # pragma: no-cover
+    # fake tensors were added in PyTorch 2.0
+    FakeTensorMode = None
 
 PARAMETER_NUM_UNITS = [" ", "K", "M", "B", "T"]
 UNKNOWN_SIZE = "?"
 
+# the last layer summaries of each model by mode, with the key of the model state they summarize
+_SUMMARY_CACHE = weakref.WeakKeyDictionary()
+
 
 class LayerSummary(object):
     """
@@ -67,6 +79,7 @@ class LayerSummary(object):
         self._hook_handle = self._register_hook()
         self._in_size = None
         self._out_size = None
+        self._num_parameters = None
 
     def __del__(self):
         self.detach_hook()
@@ -113,8 +126,10 @@ class LayerSummary(object):
 
     @property
     def num_parameters(self) -> int:
-        """ Returns the number of parameters in this module. """
-        return sum(np.prod(p.shape) for p in self._module.parameters())
+        """ Returns the number of parameters in this module, counted once. """
+        if self._num_parameters is None:
+            self._num_parameters = sum(p.numel() for p in self._module.parameters())
+        return self._num_parameters
 
 
 class ModelSummary(object):
@@ -137,6 +152,12 @@ class ModelSummary(object):
     nested lists and tuples of tensors. All other types of inputs will be skipped and show as `?`
     in the summary table. The summary will also display `?` for layers not used in the forward pass.
 
+    The layers are summarized when the summary is first used, e.g. printed. The shapes are traced with fake
+    tensors where PyTorch supports them, so the example input is not actually computed, with a regular forward
+    pass as a fallback. The summaries of a model are reused as long as its layers, parameters and example input
+    stay the same, so fitting it again, like the :class:`~pytorch_lightning.tuner.tuning.Tuner` does, does not
+    summarize it again.
+
     Example::
 
         >>> import pytorch_lightning as pl
@@ -171,7 +192,27 @@ class ModelSummary(object):
     def __init__(self, model, mode: str = MODE_DEFAULT):
         self._model = model
         self._mode = mode
-        self._layer_summary = self.summarize()
+        self._summary = None
+
+    @property
+    def _layer_summary(self) -> Dict[str, LayerSummary]:
+        if self._summary is None:
+            key = self._summary_key()
+            cached = _SUMMARY_CACHE.get(self._model, {}).get(self._mode)
+            if cached is not None and cached[0] == key:
+                self._summary = cached[1]
+            else:
+                self._summary = self.summarize()
+                _SUMMARY_CACHE.setdefault(self._model, {})[self._mode] = (key, self._summary)
+        return self._summary
+
+    def _summary_key(self) -> tuple:
+        """ Identifies the layers, the parameters and the example input a summary of the model depends on. """
+        model = self._model
+        layers = tuple((name, id(module)) for name, module in self.named_modules)
+        parameters = tuple((id(p), p.shape, p.dtype, p.device) for p in model.parameters())
+        example_input = model.example_input_array
+        return layers, parameters, id(example_input), _input_signature(example_input)
 
     @property
     def named_modules(self) -> List[Tuple[str, nn.Module]]:
@@ -207,14 +248,28 @@ class ModelSummary(object):
 
     def summarize(self) -> Dict[str, LayerSummary]:
         summary = OrderedDict((name, LayerSummary(module)) for name, module in self.named_modules)
-        if self._model.example_input_array is not None:
+        if self._model.example_input_array is not None and FakeTensorMode is not None:
+            try:
+                self._forward_example_input(fake=True)
+            except Exception:
+                # not every operation supports fake tensors, e.g. those depending on the values of their inputs
+                for layer in summary.values():
+                    layer.detach_hook()
+                summary = OrderedDict((name, LayerSummary(module)) for name, module in self.named_modules)
+                self._forward_example_input()
+        elif self._model.example_input_array is not None:
             self._forward_example_input()
         for layer in summary.values():
             layer.detach_hook()
         return summary
 
-    def _forward_example_input(self) -> None:
-        """ Run the example input through each layer to get input- and output sizes. """
+    def _forward_example_input(self, fake: bool = False) -> None:
+        """
+        Run the example input through each layer to get input- and output sizes.
+
+        Args:
+            fake: Run it as fake tensors, which have the shapes of the real ones without being computed.
+        """
         model = self._model
         trainer = self._model.trainer
 
@@ -226,15 +281,21 @@ class ModelSummary(object):
 
         mode = model.training
         model.eval()
-        with torch.no_grad():
-            # let the model hooks collect the input- and output shapes
-            if isinstance(input_, (list, tuple)):
-                model(*input_)
-            elif isinstance(input_, dict):
-                model(**input_)
-            else:
-                model(input_)
-        model.train(mode)  # restore mode of module
+        try:
+            with torch.no_grad(), ExitStack() as stack:
+                if fake:
+                    fake_mode = FakeTensorMode(allow_non_fake_inputs=True)
+                    stack.enter_context(fake_mode)
+                    input_ = apply_to_collection(input_, torch.Tensor, fake_mode.from_tensor)
+                # let the model hooks collect the input- and output shapes
+                if isinstance(input_, (list, tuple)):
+                    model(*input_)
+                elif isinstance(input_, dict):
+                    model(**input_)
+                else:
+                    model(input_)
+        finally:
+            model.train(mode)  # restore mode of module
 
     def __str__(self):
         """
@@ -258,6 +319,16 @@ class ModelSummary(object):
         return str(self)
 
 
+def _input_signature(batch: Any) -> Any:
+    if isinstance(batch, torch.Tensor):
+        return batch.shape, batch.dtype, batch.device
+    if isinstance(batch, (list, tuple)):
+        return tuple(_input_signature(el) for el in batch)
+    if isinstance(batch, dict):
+        return tuple((k, _input_signature(v)) for k, v in batch.items())
+    return type(batch)
+
+
 def parse_batch_shape(batch: Any) -> Union[str, List]:
     if hasattr(batch, "shape"):
         return list(batch.shape)
@@ -14,6 +14,7 @@
 
 import numbers
 from copy import copy
+from functools import lru_cache
 from typing import Optional, Dict, Union, Sequence, Callable, MutableMapping, Any, List, Tuple, Iterable
 
 import torch
@@ -24,6 +25,74 @@ from pytorch_lightning.utilities.distributed import sync_ddp_if_available
 from pytorch_lightning.metrics import Metric
 
 
+# bounds the number of distinct (key, options) and per-step key sequences whose layout is cached
+_SCHEMA_CACHE_SIZE = 4096
+
+
+class _LogSchema(object):
+    """The meta entries one :meth:`Result.log` call creates for a given key and options (all but the value).
+
+    Instances are cached, so the same key logged with the same options every step maps to the same object.
+    """
+    __slots__ = ('entries', 'on_epoch')
+
+    def __init__(self, entries: Tuple[Tuple[str, dict], ...], on_epoch: bool):
+        self.entries = entries
+        self.on_epoch = on_epoch
+
+
+def _meta_options(prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token, forked):
+    return dict(
+        prog_bar=prog_bar,
+        logger=logger,
+        on_step=on_step,
+        on_epoch=on_epoch,
+        reduce_fx=reduce_fx,
+        tbptt_reduce_fx=tbptt_reduce_fx,
+        tbptt_pad_token=tbptt_pad_token,
+        forked=forked
+    )
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _log_schema(name, prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token):
+    # if user requests both step and epoch, then we split the metric in two automatically
+    # one will be logged per step. the other per epoch
+    was_forked = on_step and on_epoch
+    entries = []
+    if was_forked:
+        entries.append((f'{name}_step', _meta_options(
+            prog_bar, logger, True, False, reduce_fx, tbptt_reduce_fx, tbptt_pad_token, forked=False
+        )))
+        entries.append((f'{name}_epoch', _meta_options(
+            prog_bar, logger, False, True, reduce_fx, tbptt_reduce_fx, tbptt_pad_token, forked=False
+        )))
+
+    # always log the original metric
+    entries.append((name, _meta_options(
+        prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token, forked=was_forked
+    )))
+    return _LogSchema(tuple(entries), on_epoch)
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _schema_keys(schemas: Tuple[_LogSchema, ...], option: str, include_forked_originals: bool) -> Tuple[str, ...]:
+    """The keys with ``option`` and ``on_step`` set, in logging order, for a sequence of ``log`` calls."""
+    keys = []
+    for schema in schemas:
+        for key, options in schema.entries:
+            if options['forked'] and not include_forked_originals:
+                continue
+            if options[option] and options['on_step']:
+                keys.append(key)
+    return tuple(keys)
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _schema_forked_keys(schemas: Tuple[_LogSchema, ...]) -> Tuple[str, ...]:
+    return tuple(key for schema in schemas for key, options in schema.entries if options['forked'])
+
+
 class Result(Dict):
     def __init__(
         self,
@@ -35,8 +104,12 @@ class Result(Dict):
 
         super().__init__()
 
+        # the schemas of all `log` calls so far, lets the per-step lookups reuse precomputed key lists
+        object.__setattr__(self, '_log_schemas', [])
+
         # temporary until dict results are deprecated
-        os.environ['PL_USING_RESULT_OBJ'] = '1'
+        if os.environ.get('PL_USING_RESULT_OBJ') != '1':
+            os.environ['PL_USING_RESULT_OBJ'] = '1'
 
         if early_stop_on is not None:
             self.early_stop_on = early_stop_on
@@ -72,8 +145,11 @@ class Result(Dict):
                 return self.get_epoch_log_metrics()
             elif key == 'epoch_pbar_metrics':
                 return self.get_epoch_pbar_metrics()
-            else:
+            elif key in self:
                 return self[key]
+            else:
+                # same fallback as `__getitem__`, without raising and catching two `KeyError`s
+                return self.get(f'{key}_step')
         except KeyError:
             return None
 
@@ -136,93 +212,38 @@ class Result(Dict):
         if 'meta' not in self:
             self.__setitem__('meta', {})
 
-        # if user requests both step and epoch, then we split the metric in two automatically
-        # one will be logged per step. the other per epoch
-        was_forked = False
-        if on_step and on_epoch:
-            was_forked = True
-
-            # set step version
-            step_name = f'{name}_step'
-            self.__set_meta(
-                step_name,
-                value,
-                prog_bar,
-                logger,
-                on_step=True,
-                on_epoch=False,
-                reduce_fx=reduce_fx,
-                tbptt_reduce_fx=tbptt_reduce_fx,
-                tbptt_pad_token=tbptt_pad_token,
-                forked=False
-            )
-            self.__setitem__(step_name, value)
-
-            # set epoch version
-            epoch_name = f'{name}_epoch'
-            self.__set_meta(
-                epoch_name,
-                value,
-                prog_bar,
-                logger,
-                on_step=False,
-                on_epoch=True,
-                reduce_fx=reduce_fx,
-                tbptt_reduce_fx=tbptt_reduce_fx,
-                tbptt_pad_token=tbptt_pad_token,
-                forked=False
+        try:
+            schema = _log_schema(name, prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token)
+        except TypeError:
+            # unhashable options can't be cached
+            schema = _log_schema.__wrapped__(
+                name, prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token
             )
-            self.__setitem__(epoch_name, value)
-
-        # always log the original metric
-        self.__set_meta(
-            name,
-            value,
-            prog_bar,
-            logger,
-            on_step,
-            on_epoch,
-            reduce_fx,
-            tbptt_reduce_fx=tbptt_reduce_fx,
-            tbptt_pad_token=tbptt_pad_token,
-            forked=was_forked
-        )
 
-        # set the value
-        self.__setitem__(name, value)
+        meta = self['meta']
+        for key, options in schema.entries:
+            meta_value = dict(options)
+            meta_value['value'] = value
+            meta[key] = meta_value
+            self.__setitem__(key, value)
 
-    def __set_meta(
-        self,
-        name: str,
-        value: Any,
-        prog_bar: bool,
-        logger: bool,
-        on_step: bool,
-        on_epoch: bool,
-        reduce_fx: Callable,
-        tbptt_pad_token: int,
-        tbptt_reduce_fx: Callable,
-        forked: bool
-    ):
-        # set the meta for the item
-        meta_value = value
-        meta = dict(
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            reduce_fx=reduce_fx,
-            value=meta_value,
-            tbptt_reduce_fx=tbptt_reduce_fx,
-            tbptt_pad_token=tbptt_pad_token,
-            forked=forked
-        )
+        # track whether any input requires reduction on epoch end
+        _internal = meta['_internal']
+        _internal['_reduce_on_epoch'] = max(_internal['_reduce_on_epoch'], schema.on_epoch)
 
-        self['meta'][name] = meta
+        if self._log_schemas is not None:
+            self._log_schemas.append(schema)
 
-        # track whether any input requires reduction on epoch end
-        _internal = self['meta']['_internal']
-        _internal['_reduce_on_epoch'] = max(_internal['_reduce_on_epoch'], on_epoch)
+    def _logged_schemas(self) -> Optional[Tuple[_LogSchema, ...]]:
+        """The schemas of all `log` calls if they still describe the meta exactly, `None` otherwise."""
+        schemas = self._log_schemas
+        meta = self.get('meta')
+        if not schemas or meta is None:
+            return None
+        # a key logged twice or meta modified by other means, don't trust the precomputed layout
+        if len(meta) != sum(len(schema.entries) for schema in schemas) + ('_internal' in meta):
+            return None
+        return tuple(schemas)
 
     def track_batch_size(self, batch):
         try:
@@ -247,6 +268,10 @@ class Result(Dict):
         Gets the metrics to log at the end of the batch step
 
         """
+        schemas = self._logged_schemas()
+        if schemas is not None:
+            return self._step_values(_schema_keys(schemas, 'logger', include_forked_originals))
+
         result = {}
 
         meta = self['meta']
@@ -265,6 +290,13 @@ class Result(Dict):
 
         return result
 
+    def _step_values(self, keys: Sequence[str]) -> dict:
+        result = {}
+        for k in keys:
+            value = self[k]
+            result[k] = value._forward_cache if isinstance(value, Metric) else value
+        return result
+
     def get_epoch_log_metrics(self) -> dict:
         """
         Gets the metrics to log at the end of epoch
@@ -321,6 +353,10 @@ class Result(Dict):
         """
         Gets the metrics to log at the end of epoch
         """
+        schemas = self._logged_schemas()
+        if schemas is not None:
+            return {k: self[k] for k in _schema_forked_keys(schemas)}
+
         result = {}
 
         meta = self['meta']
@@ -337,6 +373,10 @@ class Result(Dict):
         """
         Gets the metrics to log at the end of the batch step
         """
+        schemas = self._logged_schemas()
+        if schemas is not None:
+            return self._step_values(_schema_keys(schemas, 'prog_bar', include_forked_originals))
+
         result = {}
 
         meta = self['meta']
@@ -380,6 +420,8 @@ class Result(Dict):
             if isinstance(v, torch.Tensor):
                 v = v.detach()
             newone[k] = copy(v)
+        if self._log_schemas is not None:
+            object.__setattr__(newone, '_log_schemas', list(self._log_schemas))
         return newone
 
     @staticmethod
@@ -523,8 +565,9 @@ class Result(Dict):
         return result
 
     def dp_reduce(self):
+        reduced = self.__dp_reduce_scalar_blocks()
         for k, value in self.items():
-            if k == 'meta' or isinstance(value, Metric):
+            if k == 'meta' or k in reduced or isinstance(value, Metric):
                 continue
 
             if isinstance(value, list):
@@ -532,6 +575,26 @@ class Result(Dict):
 
             self[k] = value.mean(dim=-1)
 
+    def __dp_reduce_scalar_blocks(self) -> set:
+        """
+        Reduces the scalars that DP gathered as one ``(replicas, keys)`` block with a single mean per block.
+        Keys whose value was replaced since the gather are left to the regular per-key reduction.
+        """
+        reduced = set()
+        blocks = self.__dict__.get('_dp_scalar_blocks')
+        if not blocks:
+            return reduced
+        object.__setattr__(self, '_dp_scalar_blocks', None)
+
+        for keys, block, columns in blocks:
+            if not all(self.get(k) is column for k, column in zip(keys, columns)):
+                continue
+            means = block.mean(dim=0)
+            for j, k in enumerate(keys):
+                self[k] = means[j]
+            reduced.update(keys)
+        return reduced
+
     @property
     def should_reduce_on_epoch_end(self) -> bool:
         return self['meta']['_internal']['_reduce_on_epoch']
@@ -548,6 +611,7 @@ class Result(Dict):
             map_dict:
         """
         meta = self.meta
+        object.__setattr__(self, '_log_schemas', None)
         for source, dest in map_dict.items():
             # map the main keys
             self[dest] = self[source]
@@ -613,6 +677,106 @@ def _recursive_fx_apply(input: dict, fx):
             _recursive_fx_apply(v, fx)
 
 
+class RunningTimeReduction(object):
+    """
+    Folds the results of the truncated backpropagation through time splits of a batch into the reduction
+    :meth:`Result.reduce_across_time` computes, one split at a time.
+
+    Values reduced with ``torch.mean``, ``torch.sum``, ``torch.max`` or ``torch.min`` are kept as running
+    reductions, without keeping the results of the splits to stack them afterwards. Any other value, like one
+    with a custom ``tbptt_reduce_fx``, is kept and reduced by :meth:`Result.reduce_across_time` in :meth:`compute`.
+
+    Example:
+
+        >>> reduction = RunningTimeReduction()
+        >>> for value in (1., 2., 6.):
+        ...     result = Result()
+        ...     result.log('a', torch.tensor(value), on_step=False, on_epoch=True)
+        ...     result.log('b', torch.tensor(value), on_step=False, on_epoch=True, tbptt_reduce_fx=torch.max)
+        ...     reduction.update(result)
+        >>> result = reduction.compute()
+        >>> result.a, result.b
+        (tensor(3.), tensor(6.))
+    """
+
+    FOLDABLE_FX = (torch.mean, torch.sum, torch.max, torch.min)
+    RESERVED_KEYS = ('checkpoint_on', 'early_stop_on', 'minimize')
+
+    def __init__(self):
+        self.num_splits = 0
+        self._cls = None
+        self._meta = None
+        # the running reductions by key: the reduce fx, the running value and the number of reduced elements
+        self._running = {}
+        self._metrics = {}
+        self._kept = []
+
+    def update(self, result: Result):
+        if self._cls is None:
+            self._cls = type(result)
+            self._meta = result['meta']
+        self.num_splits += 1
+
+        kept = {}
+        for k, value in result.items():
+            if k in ('meta', 'extra') or (k == 'minimize' and value is None):
+                continue
+            if isinstance(value, Metric):
+                self._metrics[k] = value
+                continue
+
+            fx = torch.mean if k in self.RESERVED_KEYS else self._meta.get(k, {}).get('tbptt_reduce_fx')
+            if fx not in self.FOLDABLE_FX or not isinstance(value, (Tensor, numbers.Number)):
+                kept[k] = value
+                continue
+
+            value = value.detach().float() if isinstance(value, Tensor) else torch.tensor(float(value))
+            self._fold(k, fx, value)
+
+        if kept:
+            self._kept.append(kept)
+
+    def _fold(self, key: str, fx: Callable, value: Tensor):
+        if fx is torch.max:
+            value, numel = value.max(), 1
+        elif fx is torch.min:
+            value, numel = value.min(), 1
+        else:
+            value, numel = value.sum(), value.numel()
+
+        running = self._running.get(key)
+        if running is None:
+            self._running[key] = [fx, value, numel]
+            return
+        if fx is torch.max:
+            running[1] = torch.max(running[1], value)
+        elif fx is torch.min:
+            running[1] = torch.min(running[1], value)
+        else:
+            running[1] = running[1] + value
+        running[2] += numel
+
+    def compute(self) -> Result:
+        """The reduction of the results of all splits across time, as :meth:`Result.reduce_across_time` returns."""
+        result = self._cls()
+        for k, (fx, value, numel) in self._running.items():
+            result[k] = value / numel if fx is torch.mean else value
+        result.update(self._metrics)
+
+        if self._kept:
+            splits = []
+            for kept in self._kept:
+                split = self._cls()
+                split.update(kept)
+                split['meta'] = self._meta
+                splits.append(split)
+            reduced = self._cls.reduce_across_time(splits)
+            result.update({k: v for k, v in reduced.items() if k != 'meta'})
+
+        result['meta'] = self._meta
+        return result
+
+
 def collate_tensors(items: Union[List, Tuple]) -> Union[Tensor, List, Tuple]:
     if not items or not isinstance(items, (list, tuple)) or any(not isinstance(item, Tensor) for item in items):
         # items is not a sequence, empty, or contains non-tensors
@@ -12,3 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pytorch_lightning.distributed.dist import LightningDistributed
+from pytorch_lightning.distributed.rendezvous import LocalRendezvous
+from pytorch_lightning.distributed.control import ControlSignals
+from pytorch_lightning.distributed.shared_weights import SharedWeights
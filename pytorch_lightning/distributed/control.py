@@ -0,0 +1,80 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Dict, List, Optional
+
+import torch
+
+
+class ControlSignals:
+    """
+    Sums small integer control signals, like the early stopping decision, over all processes in the background.
+
+    :meth:`submit` packs the signals of one decision into a single tensor and starts an asynchronous
+    ``all_reduce`` without a barrier. :meth:`collect` waits for the reductions, typically a training step
+    later, so the collective overlaps with the compute in between. All processes have to submit the same
+    signals in the same order, but may collect whenever they like, since waiting does not communicate.
+
+    Example:
+
+        >>> signals = ControlSignals()
+        >>> signals.submit(step=3, should_stop=1)  # no process group, the local values are the result
+        >>> signals.collect(before_step=3)
+        []
+        >>> signals.collect(before_step=4)
+        [{'should_stop': 1}]
+    """
+
+    def __init__(self, group: Optional[Any] = None):
+        self.group = group
+        self._pending = []
+
+    @property
+    def pending(self) -> bool:
+        return len(self._pending) > 0
+
+    def submit(self, step: int, device: Optional[torch.device] = None, **signals: int):
+        """
+        Starts summing ``signals`` over all processes.
+
+        Args:
+            step: the training step the signals belong to, see :meth:`collect`
+            device: where the reduced tensor lives, needs to be a CUDA device for NCCL
+            signals: the local integer value of each signal
+        """
+        names = sorted(signals)
+        packed = torch.tensor([int(signals[name]) for name in names], dtype=torch.int64, device=device)
+        work = None
+        if torch.distributed.is_available() and torch.distributed.is_initialized():
+            work = torch.distributed.all_reduce(
+                packed, op=torch.distributed.ReduceOp.SUM, group=self.group, async_op=True
+            )
+        self._pending.append((step, names, packed, work))
+
+    def collect(self, before_step: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Waits for the submitted reductions and returns their sums, in submission order.
+
+        Args:
+            before_step: only collect the signals submitted for an earlier step, all of them if ``None``
+        """
+        collected, pending = [], []
+        for step, names, packed, work in self._pending:
+            if before_step is not None and step >= before_step:
+                pending.append((step, names, packed, work))
+                continue
+            if work is not None:
+                work.wait()
+            collected.append(dict(zip(names, packed.tolist())))
+        self._pending = pending
+        return collected
@@ -12,38 +12,152 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import io
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
 import torch
-from typing import Any
 from torch import distributed as torch_distrib
 
 
+class _SkeletonPickler(pickle.Pickler):
+    """Pickles an object without its dense tensors, which are collected by dtype instead.
+
+    A tensor referenced several times is sent once, and a view of a contiguous tensor is sent as a view of it,
+    so the unpickled object shares memory between its tensors like the pickled one did.
+    """
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.tensors = OrderedDict()
+        self.numels = {}
+        # the persistent ids of the tensors by their id, holding on to the tensors so their ids are not reused
+        self.tensor_memo = {}
+
+    def persistent_id(self, obj):
+        if type(obj) not in (torch.Tensor, torch.nn.Parameter) or obj.layout != torch.strided:
+            return None
+        memoized = self.tensor_memo.get(id(obj))
+        if memoized is not None:
+            return memoized[1]
+
+        base = obj._base
+        if self._is_sendable_base(base, obj):
+            pid = (
+                'view', self.persistent_id(base), obj.storage_offset(), tuple(obj.shape), obj.stride(),
+                len(self.tensor_memo), type(obj) is torch.nn.Parameter, obj.requires_grad,
+            )
+        else:
+            dtype = obj.dtype
+            offset = self.numels.get(dtype, 0)
+            self.numels[dtype] = offset + obj.numel()
+            self.tensors.setdefault(dtype, []).append(obj.detach().reshape(-1))
+            pid = (
+                'tensor', dtype, offset, tuple(obj.shape), obj.device.type, len(self.tensor_memo),
+                type(obj) is torch.nn.Parameter, obj.requires_grad,
+            )
+        self.tensor_memo[id(obj)] = (obj, pid)
+        return pid
+
+    @staticmethod
+    def _is_sendable_base(base, view: torch.Tensor) -> bool:
+        return (
+            base is not None
+            and type(base) in (torch.Tensor, torch.nn.Parameter)
+            and base.layout == torch.strided
+            and base.dtype == view.dtype
+            and base.storage_offset() == 0
+            and base.is_contiguous()
+        )
+
+
+class _SkeletonUnpickler(pickle.Unpickler):
+    """Unpickles an object pickled by :class:`_SkeletonPickler`, taking its tensors from the flat buffers."""
+
+    def __init__(self, file, flat_buffers: Dict[torch.dtype, torch.Tensor]):
+        super().__init__(file)
+        self.flat_buffers = flat_buffers
+        # the tensors by their index, a tensor referenced several times is unpickled once
+        self.tensor_memo = {}
+
+    def persistent_load(self, pid):
+        index = pid[5]
+        tensor = self.tensor_memo.get(index)
+        if tensor is None:
+            tensor = self.tensor_memo[index] = self._load(pid)
+        return tensor
+
+    def _load(self, pid):
+        if pid[0] == 'view':
+            _, base_pid, storage_offset, shape, stride, _, is_parameter, requires_grad = pid
+            tensor = self.persistent_load(base_pid).detach().as_strided(shape, stride, storage_offset)
+        else:
+            _, dtype, offset, shape, device_type, _, is_parameter, requires_grad = pid
+            numel = 1
+            for size in shape:
+                numel *= size
+            # clone, so every tensor owns its memory, as if it was unpickled
+            tensor = self.flat_buffers[dtype][offset:offset + numel].view(shape).clone()
+            if device_type == 'cpu':
+                tensor = tensor.cpu()
+        if is_parameter:
+            return torch.nn.Parameter(tensor, requires_grad=requires_grad)
+        return tensor.requires_grad_(requires_grad)
+
+
 class LightningDistributed:
 
     def __init__(self, rank=None, device=None):
         self.rank = rank
         self.device = device
 
-    def broadcast(self, obj: Any):
-        if self.rank == 0:
-            self._emit(obj)
+    def broadcast(self, obj: Any, src: int = 0, group: Optional[Any] = None):
+        """
+        Sends ``obj`` from the process with global rank ``src`` to all other processes.
+
+        Only the object without its tensors is pickled. The tensors are sent as they are, in one flat buffer
+        per dtype, so state dicts and metric states are not serialized. Tensors the sender has on the CPU
+        are returned on the CPU, all others on the device of the receiving process.
+        """
+        if self.rank == src:
+            self._emit(obj, src, group)
         else:
-            obj = self._receive()
+            obj = self._receive(src, group)
         return obj
 
-    def _emit(self, obj):
+    def _emit(self, obj, src: int, group):
         buffer = io.BytesIO()
-        torch.save(obj, buffer)
-        data = bytearray(buffer.getbuffer())
-        length_tensor = torch.tensor([len(data)]).long().to(self.device)
-        length_tensor = torch_distrib.broadcast(length_tensor, src=0)
-        data_tensor = torch.ByteTensor(data).to(self.device)
-        data_tensor = torch_distrib.broadcast(data_tensor, src=0)
-
-    def _receive(self):
-        length_tensor = torch.tensor([0]).long().to(self.device)
-        torch_distrib.broadcast(length_tensor, src=0)
-        data_tensor = torch.empty([length_tensor.item()], dtype=torch.uint8).to(self.device)
-        torch_distrib.broadcast(data_tensor, src=0)
-        buffer = io.BytesIO(data_tensor.cpu().numpy())
-        obj = torch.load(buffer)
-        return obj
+        pickler = _SkeletonPickler(buffer)
+        pickler.dump(obj)
+        layout = list(pickler.numels.items())
+        self._broadcast_bytes(pickle.dumps((layout, buffer.getvalue()), protocol=pickle.HIGHEST_PROTOCOL), src, group)
+
+        for dtype, tensors in pickler.tensors.items():
+            flat = torch.cat([t.to(self.device) for t in tensors]) if len(tensors) > 1 else tensors[0].to(self.device)
+            self._broadcast_flat(flat, src, group)
+
+    def _receive(self, src: int, group):
+        layout, skeleton = pickle.loads(self._broadcast_bytes(None, src, group))
+        flat_buffers = {}
+        for dtype, numel in layout:
+            flat = torch.empty(numel, dtype=dtype, device=self.device)
+            flat_buffers[dtype] = self._broadcast_flat(flat, src, group)
+        return _SkeletonUnpickler(io.BytesIO(skeleton), flat_buffers).load()
+
+    def _broadcast_bytes(self, data: Optional[bytes], src: int, group) -> bytes:
+        length_tensor = torch.tensor([0 if data is None else len(data)]).long().to(self.device)
+        torch_distrib.broadcast(length_tensor, src=src, group=group)
+        if data is None:
+            data_tensor = torch.empty([length_tensor.item()], dtype=torch.uint8).to(self.device)
+        else:
+            data_tensor = torch.from_numpy(np.frombuffer(data, dtype=np.uint8).copy()).to(self.device)
+        torch_distrib.broadcast(data_tensor, src=src, group=group)
+        return data if data is not None else data_tensor.cpu().numpy().tobytes()
+
+    @staticmethod
+    def _broadcast_flat(flat: torch.Tensor, src: int, group) -> torch.Tensor:
+        # not every backend supports bool tensors, they are sent as bytes
+        transport = flat.view(torch.uint8) if flat.dtype == torch.bool else flat
+        torch_distrib.broadcast(transport, src=src, group=group)
+        return flat
@@ -0,0 +1,105 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, MutableMapping, Optional
+
+
+class LocalRendezvous:
+    """
+    File based handshake between the process launching the local DDP processes and the processes it launched.
+
+    The launcher starts all processes at once and waits until each of them signals that it is ready, instead
+    of pausing between the launches. A process that exits before it got ready fails the launch right away,
+    rather than leaving the others waiting for it in ``init_process_group``.
+
+    Example:
+
+        >>> rendezvous = LocalRendezvous()
+        >>> rendezvous.signal_ready(local_rank=1)  # in the launched process
+        >>> list(rendezvous.wait_ready({1: None}, start_time=0.))
+        [1]
+        >>> rendezvous.cleanup()
+    """
+
+    ENV_VAR = 'PL_DDP_RENDEZVOUS_DIR'
+
+    def __init__(self, path: Optional[str] = None):
+        self._owner = path is None
+        self.path = tempfile.mkdtemp(prefix='pl_ddp_rendezvous_') if path is None else path
+
+    @classmethod
+    def from_env(cls) -> Optional['LocalRendezvous']:
+        """The rendezvous of the launcher, in a process it launched."""
+        path = os.environ.get(cls.ENV_VAR)
+        return cls(path) if path else None
+
+    def export(self, env: MutableMapping[str, str]):
+        env[self.ENV_VAR] = self.path
+
+    def signal_ready(self, local_rank: int):
+        # write then rename, so the launcher never reads a partial file
+        ready_file = self._ready_file(local_rank)
+        with open(ready_file + '.tmp', 'w') as f:
+            f.write(repr(time.time()))
+        os.replace(ready_file + '.tmp', ready_file)
+
+    def wait_ready(
+        self, procs: Dict[int, Optional[object]], start_time: float, timeout: float = 1800., poll_interval: float = 0.01
+    ) -> Dict[int, float]:
+        """
+        Waits until all launched processes signaled they are ready.
+
+        Args:
+            procs: the launched processes (anything with ``poll()``, like a ``subprocess.Popen``) by local rank
+            start_time: ``time.time()`` when the launch started
+            timeout: seconds to wait for all processes
+            poll_interval: seconds between checks
+
+        Return:
+            the seconds from the start of the launch until each process was ready, by local rank
+
+        Raises:
+            RuntimeError:
+                If a process exits or does not get ready within ``timeout``.
+        """
+        ready = {}
+        deadline = time.time() + timeout
+        while len(ready) < len(procs):
+            for local_rank, proc in procs.items():
+                if local_rank in ready:
+                    continue
+                ready_file = self._ready_file(local_rank)
+                if os.path.exists(ready_file):
+                    with open(ready_file) as f:
+                        ready[local_rank] = float(f.read()) - start_time
+                elif proc is not None and proc.poll() is not None:
+                    raise RuntimeError(
+                        f'DDP process with local rank {local_rank} exited with code {proc.returncode} during startup'
+                    )
+            if len(ready) < len(procs):
+                if time.time() > deadline:
+                    missing = sorted(set(procs) - set(ready))
+                    raise RuntimeError(f'DDP processes with local ranks {missing} did not start within {timeout}s')
+                time.sleep(poll_interval)
+        return ready
+
+    def cleanup(self):
+        if self._owner:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def _ready_file(self, local_rank: int) -> str:
+        return os.path.join(self.path, f'ready_{local_rank}')
@@ -0,0 +1,90 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+from itertools import chain
+from typing import Optional
+
+import torch
+
+
+class SharedWeights:
+    """
+    Hands the weights trained in a spawned process back to the process which spawned it, through shared memory.
+
+    The spawning process moves the weights of its model to shared memory with :meth:`share`, so the spawned
+    processes receive that memory along with the model. A spawned process keeps references to it before it
+    trains a private copy of the weights (:meth:`make_private`, or moving the model to another device), and
+    :meth:`hand_back` copies the trained weights into it at the end. The model of the spawning process then
+    already holds them, nothing is saved to disk or pickled.
+
+    Example:
+
+        >>> model = torch.nn.Linear(2, 2)
+        >>> SharedWeights.share(model)
+        >>> shared = SharedWeights(model)  # in the spawned process
+        >>> shared.make_private(model)
+        >>> with torch.no_grad():
+        ...     _ = model.weight.add_(1)
+        >>> torch.equal(shared._shared['weight'], model.weight)
+        False
+        >>> shared.hand_back(model) is None
+        True
+        >>> torch.equal(shared._shared['weight'], model.weight)
+        True
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        self._shared = dict(model.state_dict())
+
+    @staticmethod
+    def share(model: torch.nn.Module):
+        model.share_memory()
+
+    @staticmethod
+    def make_private(model: torch.nn.Module):
+        """
+        Gives ``model`` its own copy of every weight in shared memory, so that the spawned processes don't all
+        train (and race on) the single copy of the spawning process.
+        """
+        with torch.no_grad():
+            for tensor in chain(model.parameters(), model.buffers()):
+                if tensor.is_shared():
+                    tensor.data = tensor.data.clone()
+
+    def hand_back(self, model: torch.nn.Module) -> Optional[bytes]:
+        """
+        Copies the weights of ``model`` into the shared memory of the spawning process.
+
+        Return:
+            the weights which have no shared counterpart of the same shape and dtype, like buffers registered
+            after spawning, serialized for :meth:`restore`, or ``None`` when all weights were handed back
+        """
+        missing = {}
+        for name, tensor in model.state_dict().items():
+            shared = self._shared.get(name)
+            if shared is None or shared.shape != tensor.shape or shared.dtype != tensor.dtype:
+                missing[name] = tensor.cpu()
+            else:
+                shared.copy_(tensor)
+        if not missing:
+            return None
+        buffer = io.BytesIO()
+        torch.save(missing, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def restore(model: torch.nn.Module, missing: Optional[bytes]):
+        """Loads the weights :meth:`hand_back` could not copy into shared memory, in the spawning process."""
+        if missing is not None:
+            model.load_state_dict(torch.load(io.BytesIO(missing)), strict=False)
@@ -11,53 +11,42 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import importlib
 from os import environ
 
 from pytorch_lightning.loggers.base import LightningLoggerBase, LoggerCollection
 from pytorch_lightning.loggers.csv_logs import CSVLogger
 from pytorch_lightning.loggers.tensorboard import TensorBoardLogger
 
+# the loggers of optional integrations are imported on first access, see PEP 562,
+# so their packages are only imported by the code which uses them
+_LAZY_LOGGERS = {
+    'CometLogger': 'pytorch_lightning.loggers.comet',
+    'MLFlowLogger': 'pytorch_lightning.loggers.mlflow',
+    'NeptuneLogger': 'pytorch_lightning.loggers.neptune',
+    'TestTubeLogger': 'pytorch_lightning.loggers.test_tube',
+    'WandbLogger': 'pytorch_lightning.loggers.wandb',
+}
+
 __all__ = [
     'LightningLoggerBase',
     'LoggerCollection',
     'TensorBoardLogger',
     'CSVLogger',
+    *_LAZY_LOGGERS,
 ]
 
-try:
-    # needed to prevent ImportError and duplicated logs.
-    environ["COMET_DISABLE_AUTO_LOGGING"] = "1"
-
-    from pytorch_lightning.loggers.comet import CometLogger
-except ImportError:  # pragma: no-cover
-    del environ["COMET_DISABLE_AUTO_LOGGING"]  # pragma: no-cover
-else:
-    __all__.append('CometLogger')
-
-try:
-    from pytorch_lightning.loggers.mlflow import MLFlowLogger
-except ImportError:  # pragma: no-cover
-    pass  # pragma: no-cover
-else:
-    __all__.append('MLFlowLogger')
 
-try:
-    from pytorch_lightning.loggers.neptune import NeptuneLogger
-except ImportError:  # pragma: no-cover
-    pass  # pragma: no-cover
-else:
-    __all__.append('NeptuneLogger')
+def __getattr__(name):
+    if name not in _LAZY_LOGGERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == 'CometLogger':
+        # needed to prevent ImportError and duplicated logs.
+        environ["COMET_DISABLE_AUTO_LOGGING"] = "1"
+    logger = getattr(importlib.import_module(_LAZY_LOGGERS[name]), name)
+    globals()[name] = logger
+    return logger
 
-try:
-    from pytorch_lightning.loggers.test_tube import TestTubeLogger
-except ImportError:  # pragma: no-cover
-    pass  # pragma: no-cover
-else:
-    __all__.append('TestTubeLogger')
 
-try:
-    from pytorch_lightning.loggers.wandb import WandbLogger
-except ImportError:  # pragma: no-cover
-    pass  # pragma: no-cover
-else:
-    __all__.append('WandbLogger')
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
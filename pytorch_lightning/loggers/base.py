@@ -313,6 +313,10 @@ class LoggerCollection(LightningLoggerBase):
         for logger in self._logger_iterable:
             logger.agg_and_log_metrics(metrics, step)
 
+    def _finalize_agg_metrics(self):
+        for logger in self._logger_iterable:
+            logger._finalize_agg_metrics()
+
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None) -> None:
         for logger in self._logger_iterable:
             logger.log_metrics(metrics, step)
@@ -440,6 +444,34 @@ def merge_dicts(
     return d_out
 
 
+def hparams_changed(current: Mapping, update: Mapping) -> bool:
+    """
+    Whether updating the hyperparameters ``current`` with ``update`` changes them.
+
+    Values which cannot be compared, like tensors with several elements, count as changed unless they are the same
+    object.
+
+    Examples:
+        >>> hparams_changed({'lr': 0.1, 'layers': 2}, {'lr': 0.1})
+        False
+        >>> hparams_changed({'lr': 0.1}, {'lr': 0.01})
+        True
+        >>> hparams_changed({'lr': 0.1}, {'batch_size': 32})
+        True
+    """
+    for key, value in update.items():
+        if key not in current:
+            return True
+        if current[key] is value:
+            continue
+        try:
+            if bool(current[key] != value):
+                return True
+        except Exception:
+            return True
+    return False
+
+
 def rank_zero_experiment(fn: Callable) -> Callable:
     """ Returns the real experiment on rank 0 and otherwise the DummyExperiment. """
     @wraps(fn)
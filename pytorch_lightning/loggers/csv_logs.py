@@ -29,7 +29,7 @@ import torch
 
 from pytorch_lightning import _logger as log
 from pytorch_lightning.core.saving import save_hparams_to_yaml
-from pytorch_lightning.loggers.base import LightningLoggerBase
+from pytorch_lightning.loggers.base import LightningLoggerBase, hparams_changed
 from pytorch_lightning.utilities.distributed import rank_zero_only, rank_zero_warn
 
 
@@ -50,6 +50,9 @@ class ExperimentWriter(object):
     def __init__(self, log_dir: str) -> None:
         self.hparams = {}
         self.metrics = []
+        self._hparams_saved = False
+        self._saved_metrics_keys = None
+        self._num_saved_metrics = 0
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir):
@@ -63,6 +66,8 @@ class ExperimentWriter(object):
 
     def log_hparams(self, params: Dict[str, Any]) -> None:
         """Record hparams"""
+        if hparams_changed(self.hparams, params):
+            self._hparams_saved = False
         self.hparams.update(params)
 
     def log_metrics(self, metrics_dict: Dict[str, float], step: Optional[int] = None) -> None:
@@ -82,9 +87,23 @@ class ExperimentWriter(object):
     def save(self) -> None:
         """Save recorded hparams and metrics into files"""
         hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
-        save_hparams_to_yaml(hparams_file, self.hparams)
+        if not self._hparams_saved:
+            save_hparams_to_yaml(hparams_file, self.hparams)
+            self._hparams_saved = True
 
-        if not self.metrics:
+        new_metrics = self.metrics[self._num_saved_metrics:]
+        if not new_metrics:
+            return
+
+        # append the new rows, unless they bring new columns and the whole file has to be written with a new header
+        new_keys = set()
+        for m in new_metrics:
+            new_keys.update(m)
+        if self._saved_metrics_keys is not None and new_keys.issubset(self._saved_metrics_keys):
+            with io.open(self.metrics_file_path, 'a', newline='') as f:
+                self.writer = csv.DictWriter(f, fieldnames=self._saved_metrics_keys)
+                self.writer.writerows(new_metrics)
+            self._num_saved_metrics = len(self.metrics)
             return
 
         last_m = {}
@@ -96,6 +115,8 @@ class ExperimentWriter(object):
             self.writer = csv.DictWriter(f, fieldnames=metrics_keys)
             self.writer.writeheader()
             self.writer.writerows(self.metrics)
+        self._saved_metrics_keys = metrics_keys
+        self._num_saved_metrics = len(self.metrics)
 
 
 class CSVLogger(LightningLoggerBase):
@@ -29,7 +29,7 @@ from torch.utils.tensorboard.summary import hparams
 from pytorch_lightning import _logger as log
 from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.core.saving import save_hparams_to_yaml
-from pytorch_lightning.loggers.base import LightningLoggerBase, rank_zero_experiment
+from pytorch_lightning.loggers.base import LightningLoggerBase, hparams_changed, rank_zero_experiment
 from pytorch_lightning.utilities import rank_zero_only, rank_zero_warn
 from pytorch_lightning.utilities.cloud_io import get_filesystem
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -93,6 +93,7 @@ class TensorBoardLogger(LightningLoggerBase):
 
         self._experiment = None
         self.hparams = {}
+        self._hparams_saved = False
         self._kwargs = kwargs
 
     @property
@@ -150,6 +151,8 @@ class TensorBoardLogger(LightningLoggerBase):
         params = self._convert_params(params)
 
         # store params to output
+        if hparams_changed(self.hparams, params):
+            self._hparams_saved = False
         if OMEGACONF_AVAILABLE and isinstance(params, Container):
             self.hparams = OmegaConf.merge(self.hparams, params)
         else:
@@ -215,9 +218,13 @@ class TensorBoardLogger(LightningLoggerBase):
         # prepare the file path
         hparams_file = os.path.join(dir_path, self.NAME_HPARAMS_FILE)
 
-        # save the metatags file if it doesn't exist
-        if not os.path.isfile(hparams_file):
+        # save the metatags file when it doesn't exist or the hparams changed
+        if not self._hparams_saved or not os.path.isfile(hparams_file):
             save_hparams_to_yaml(hparams_file, self.hparams)
+            self._hparams_saved = True
+
+        if self._experiment is not None:
+            self._experiment.flush()
 
     @rank_zero_only
     def finalize(self, status: str) -> None:
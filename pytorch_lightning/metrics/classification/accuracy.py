@@ -21,6 +21,7 @@ from collections import namedtuple
 import torch
 from torch import nn
 from pytorch_lightning.metrics.metric import Metric
+from pytorch_lightning.metrics.classification.precision_recall import _cached_categorical_input, _categorical_input
 
 
 class Accuracy(Metric):
@@ -61,6 +62,8 @@ class Accuracy(Metric):
 
     """
 
+    mergeable_states = True
+
     def __init__(
         self,
         threshold: float = 0.5,
@@ -80,18 +83,7 @@ class Accuracy(Metric):
         self.threshold = threshold
 
     def _input_format(self, preds: torch.Tensor, target: torch.Tensor):
-        if not (len(preds.shape) == len(target.shape) or len(preds.shape) == len(target.shape) + 1):
-            raise ValueError(
-                "preds and target must have same number of dimensions, or one additional dimension for preds"
-            )
-
-        if len(preds.shape) == len(target.shape) + 1:
-            # multi class probabilites
-            preds = torch.argmax(preds, dim=1)
-
-        if len(preds.shape) == len(target.shape) and preds.dtype == torch.float:
-            # binary or multilabel probablities
-            preds = (preds >= self.threshold).long()
+        preds, _ = _categorical_input(preds, target, self.threshold)
         return preds, target
 
     def update(self, preds: torch.Tensor, target: torch.Tensor):
@@ -103,6 +95,13 @@ class Accuracy(Metric):
             target: Ground truth values
         """
         preds, target = self._input_format(preds, target)
+        self._update_categorical(preds, target)
+
+    def _cached_update(self, cache: dict, preds: torch.Tensor, target: torch.Tensor):
+        preds, _ = _cached_categorical_input(cache, preds, target, self.threshold)
+        self._update_categorical(preds, target)
+
+    def _update_categorical(self, preds: torch.Tensor, target: torch.Tensor):
         assert preds.shape == target.shape
 
         self.correct += torch.sum(preds == target)
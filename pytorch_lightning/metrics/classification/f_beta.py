@@ -21,7 +21,7 @@ from collections import namedtuple
 import torch
 from torch import nn
 from pytorch_lightning.metrics.metric import Metric
-from pytorch_lightning.metrics.classification.precision_recall import _input_format
+from pytorch_lightning.metrics.classification.precision_recall import _cached_stat_scores, _stat_scores
 from pytorch_lightning.metrics.utils import METRIC_EPS
 
 
@@ -72,6 +72,8 @@ class Fbeta(Metric):
         tensor(0.3333)
 
     """
+    mergeable_states = True
+
     def __init__(
         self,
         num_classes: int = 1,
@@ -110,11 +112,17 @@ class Fbeta(Metric):
             preds: Predictions from model
             target: Ground truth values
         """
-        preds, target = _input_format(self.num_classes, preds, target, self.threshold, self.multilabel)
+        self._update_stat_scores(*_stat_scores(self.num_classes, preds, target, self.threshold, self.multilabel))
+
+    def _cached_update(self, cache: dict, preds: torch.Tensor, target: torch.Tensor):
+        self._update_stat_scores(
+            *_cached_stat_scores(cache, self.num_classes, preds, target, self.threshold, self.multilabel)
+        )
 
-        self.true_positives += torch.sum(preds * target, dim=1)
-        self.predicted_positives += torch.sum(preds, dim=1)
-        self.actual_positives += torch.sum(target, dim=1)
+    def _update_stat_scores(self, true_positives, predicted_positives, actual_positives):
+        self.true_positives += true_positives
+        self.predicted_positives += predicted_positives
+        self.actual_positives += actual_positives
 
     def compute(self):
         """
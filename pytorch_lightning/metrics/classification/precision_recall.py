@@ -24,7 +24,13 @@ from pytorch_lightning.metrics.metric import Metric
 from pytorch_lightning.metrics.utils import to_onehot, METRIC_EPS
 
 
-def _input_format(num_classes: int, preds: torch.Tensor, target: torch.Tensor, threshold=0.5, multilabel=False):
+def _categorical_input(preds: torch.Tensor, target: torch.Tensor, threshold: float = 0.5):
+    """
+    Turns multi-class scores into class indices and binary or multi-label probabilities into labels.
+
+    Return:
+        the predictions and whether they were thresholded
+    """
     if not (len(preds.shape) == len(target.shape) or len(preds.shape) == len(target.shape) + 1):
         raise ValueError(
             "preds and target must have same number of dimensions, or one additional dimension for preds"
@@ -34,15 +40,20 @@ def _input_format(num_classes: int, preds: torch.Tensor, target: torch.Tensor, t
         # multi class probabilites
         preds = torch.argmax(preds, dim=1)
 
-    if len(preds.shape) == len(target.shape) and preds.dtype == torch.long and num_classes > 1 and not multilabel:
+    if len(preds.shape) == len(target.shape) and preds.dtype == torch.float:
+        # binary or multilabel probablities
+        return (preds >= threshold).long(), True
+    return preds, False
+
+
+def _input_format(num_classes: int, preds: torch.Tensor, target: torch.Tensor, threshold=0.5, multilabel=False):
+    preds, thresholded = _categorical_input(preds, target, threshold)
+
+    if not thresholded and preds.dtype == torch.long and num_classes > 1 and not multilabel:
         # multi-class
         preds = to_onehot(preds, num_classes=num_classes)
         target = to_onehot(target, num_classes=num_classes)
 
-    elif len(preds.shape) == len(target.shape) and preds.dtype == torch.float:
-        # binary or multilabel probablities
-        preds = (preds >= threshold).long()
-
     # transpose class as first dim and reshape
     if len(preds.shape) > 1:
         preds = preds.transpose(1, 0)
@@ -51,6 +62,54 @@ def _input_format(num_classes: int, preds: torch.Tensor, target: torch.Tensor, t
     return preds.reshape(num_classes, -1), target.reshape(num_classes, -1)
 
 
+def _stat_scores(num_classes: int, preds: torch.Tensor, target: torch.Tensor, threshold=0.5, multilabel=False,
+                 categorical=None):
+    """
+    Counts the true, predicted and actual positives of every class.
+
+    Args:
+        categorical: the output of :func:`_categorical_input` if it was already computed for these inputs
+    """
+    preds, thresholded = categorical if categorical is not None else _categorical_input(preds, target, threshold)
+
+    if not thresholded and preds.dtype == torch.long and num_classes > 1 and not multilabel:
+        # multi-class, counting the class indices gives the sums of their one-hot encodings
+        preds, target = preds.reshape(-1), target.reshape(-1)
+        true_positives = torch.bincount(target[preds == target], minlength=num_classes)
+        predicted_positives = torch.bincount(preds, minlength=num_classes)
+        actual_positives = torch.bincount(target, minlength=num_classes)
+        return true_positives, predicted_positives, actual_positives
+
+    # transpose class as first dim and reshape
+    if len(preds.shape) > 1:
+        preds = preds.transpose(1, 0)
+        target = target.transpose(1, 0)
+    preds, target = preds.reshape(num_classes, -1), target.reshape(num_classes, -1)
+
+    # multiply because we are counting (1, 1) pair for true positives
+    return torch.sum(preds * target, dim=1), torch.sum(preds, dim=1), torch.sum(target, dim=1)
+
+
+def _cached_stat_scores(cache: dict, num_classes: int, preds: torch.Tensor, target: torch.Tensor, threshold=0.5,
+                        multilabel=False):
+    """:func:`_stat_scores` computed once per update of a :class:`MetricCollection` for all metrics needing them."""
+    key = ('stat_scores', num_classes, threshold, multilabel)
+    if key not in cache:
+        cache[key] = _stat_scores(
+            num_classes, preds, target, threshold, multilabel, categorical=_cached_categorical_input(
+                cache, preds, target, threshold
+            )
+        )
+    return cache[key]
+
+
+def _cached_categorical_input(cache: dict, preds: torch.Tensor, target: torch.Tensor, threshold=0.5):
+    key = ('categorical', threshold)
+    if key not in cache:
+        cache[key] = _categorical_input(preds, target, threshold)
+    return cache[key]
+
+
 class Precision(Metric):
     """
     Computes the precision metric.
@@ -98,6 +157,8 @@ class Precision(Metric):
         tensor(0.3333)
 
     """
+    mergeable_states = True
+
     def __init__(
         self,
         num_classes: int = 1,
@@ -126,11 +187,16 @@ class Precision(Metric):
         self.add_state("predicted_positives", default=torch.zeros(num_classes), dist_reduce_fx="sum")
 
     def update(self, preds: torch.Tensor, target: torch.Tensor):
-        preds, target = _input_format(self.num_classes, preds, target, self.threshold, self.multilabel)
+        self._update_stat_scores(*_stat_scores(self.num_classes, preds, target, self.threshold, self.multilabel))
+
+    def _cached_update(self, cache: dict, preds: torch.Tensor, target: torch.Tensor):
+        self._update_stat_scores(
+            *_cached_stat_scores(cache, self.num_classes, preds, target, self.threshold, self.multilabel)
+        )
 
-        # multiply because we are counting (1, 1) pair for true positives
-        self.true_positives += torch.sum(preds * target, dim=1)
-        self.predicted_positives += torch.sum(preds, dim=1)
+    def _update_stat_scores(self, true_positives, predicted_positives, actual_positives):
+        self.true_positives += true_positives
+        self.predicted_positives += predicted_positives
 
     def compute(self):
         if self.average == 'micro':
@@ -186,6 +252,8 @@ class Recall(Metric):
         tensor(0.3333)
 
     """
+    mergeable_states = True
+
     def __init__(
         self,
         num_classes: int = 1,
@@ -221,11 +289,16 @@ class Recall(Metric):
             preds: Predictions from model
             target: Ground truth values
         """
-        preds, target = _input_format(self.num_classes, preds, target, self.threshold, self.multilabel)
+        self._update_stat_scores(*_stat_scores(self.num_classes, preds, target, self.threshold, self.multilabel))
+
+    def _cached_update(self, cache: dict, preds: torch.Tensor, target: torch.Tensor):
+        self._update_stat_scores(
+            *_cached_stat_scores(cache, self.num_classes, preds, target, self.threshold, self.multilabel)
+        )
 
-        # multiply because we are counting (1, 1) pair for true positives
-        self.true_positives += torch.sum(preds * target, dim=1)
-        self.actual_positives += torch.sum(target, dim=1)
+    def _update_stat_scores(self, true_positives, predicted_positives, actual_positives):
+        self.true_positives += true_positives
+        self.actual_positives += actual_positives
 
     def compute(self):
         """
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Union
-from collections.abc import Mapping, Sequence
-from collections import namedtuple
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+from collections.abc import Mapping
+from collections import namedtuple, OrderedDict
 from copy import deepcopy
 from distutils.version import LooseVersion
 
@@ -25,7 +26,14 @@ from torch import nn
 
 from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.distributed import gather_all_tensors_if_available
-from pytorch_lightning.metrics.utils import _flatten, dim_zero_cat, dim_zero_mean, dim_zero_sum
+from pytorch_lightning.metrics.utils import (
+    _flatten,
+    dim_zero_cat,
+    dim_zero_max,
+    dim_zero_mean,
+    dim_zero_min,
+    dim_zero_sum,
+)
 
 
 class Metric(nn.Module, ABC):
@@ -48,6 +56,12 @@ class Metric(nn.Module, ABC):
         is valid, but it won't return the metric value at the current step. A call to ``forward()``
         automatically calls ``update()`` and also returns the metric value at the current step.
 
+    Note:
+        Set the class attribute ``mergeable_states = True`` if ``update()`` only adds to the states what it computes
+        from the inputs, independent of the current state values, and every tensor state is reduced by ``"sum"``,
+        ``"max"`` or ``"min"``. ``forward()`` then updates a separate state with the batch and merges it into the
+        accumulated state, instead of calling ``update()`` twice. List states are merged by concatenation.
+
     Args:
         compute_on_step:
             Forward only calls ``update()`` and returns None if this is set to False. default: True
@@ -57,6 +71,8 @@ class Metric(nn.Module, ABC):
         process_group:
             Specify the process group on which synchronization is called. default: None (which selects the entire world)
     """
+    mergeable_states = False
+
     def __init__(
         self,
         compute_on_step: bool = True,
@@ -78,6 +94,11 @@ class Metric(nn.Module, ABC):
         # initialize state
         self._reductions = {}
         self._defaults = {}
+        self._fill_values = {}
+        # reset states `forward` updates with the batch alone
+        self._local_state = None
+        # the state tensors the metric allocated itself, only these are reset in place
+        self._owned_states = weakref.WeakValueDictionary()
 
     def add_state(
         self, name: str, default, dist_reduce_fx: Optional[Union[str, Callable]] = None, persistent: bool = True
@@ -90,9 +111,9 @@ class Metric(nn.Module, ABC):
             default: Default value of the state; can either be a ``torch.Tensor`` or an empty list. The state will be
                 reset to this value when ``self.reset()`` is called.
             dist_reduce_fx (Optional): Function to reduce state accross mutliple processes in distributed mode.
-                If value is ``"sum"``, ``"mean"``, or ``"cat"``, we will use ``torch.sum``, ``torch.mean``,
-                and ``torch.cat`` respectively, each with argument ``dim=0``. The user can also pass a custom
-                function in this parameter.
+                If value is ``"sum"``, ``"mean"``, ``"max"``, ``"min"`` or ``"cat"``, we will use ``torch.sum``,
+                ``torch.mean``, ``torch.max``, ``torch.min`` and ``torch.cat`` respectively, each with argument
+                ``dim=0``. The user can also pass a custom function in this parameter.
             persistent (Optional): whether the state will be saved as part of the modules ``state_dict``.
 
         Note:
@@ -126,11 +147,15 @@ class Metric(nn.Module, ABC):
             dist_reduce_fx = dim_zero_sum
         elif dist_reduce_fx == "mean":
             dist_reduce_fx = dim_zero_mean
+        elif dist_reduce_fx == "max":
+            dist_reduce_fx = dim_zero_max
+        elif dist_reduce_fx == "min":
+            dist_reduce_fx = dim_zero_min
         elif dist_reduce_fx == "cat":
             dist_reduce_fx = dim_zero_cat
         elif dist_reduce_fx is not None and not isinstance(dist_reduce_fx, Callable):
             raise ValueError(
-                "`dist_reduce_fx` must be callable or one of ['mean', 'sum', 'cat', None]"
+                "`dist_reduce_fx` must be callable or one of ['mean', 'sum', 'max', 'min', 'cat', None]"
             )
 
         if isinstance(default, torch.Tensor):
@@ -139,38 +164,78 @@ class Metric(nn.Module, ABC):
                 self.register_buffer(name, default, persistent=persistent)
             else:
                 self.register_buffer(name, default)
+            self._own(default)
         else:
             setattr(self, name, default)
 
         self._defaults[name] = deepcopy(default)
         self._reductions[name] = dist_reduce_fx
+        self._fill_values[name] = _fill_value(default)
 
     def forward(self, *args, **kwargs):
         """
         Automatically calls ``update()``. Returns the metric value over inputs if ``compute_on_step`` is True.
         """
-        # add current step
-        self.update(*args, **kwargs)
-        self._forward_cache = None
+        return self._forward(self.update, *args, **kwargs)
 
-        if self.compute_on_step:
-            self._to_sync = self.dist_sync_on_step
+    def _forward(self, update: Callable, *args, **kwargs):
+        self._forward_cache = None
 
-            # save context before switch
-            self._cache = {attr: getattr(self, attr) for attr in self._defaults.keys()}
+        if not self.compute_on_step:
+            # add current step
+            update(*args, **kwargs)
+            return
+
+        merge = self._can_merge_states()
+        if not merge:
+            # add current step
+            update(*args, **kwargs)
+
+        # save context before switch
+        self._cache = {attr: getattr(self, attr) for attr in self._defaults.keys()}
+        try:
+            # call update, compute, on single batch
+            self._set_local_state()
+            update(*args, **kwargs)
+            if merge:
+                # add current step, before `compute` resets the batch state
+                for attr, val in self._cache.items():
+                    self._cache[attr] = _merge_state(self._reductions[attr], val, getattr(self, attr))
 
-            # call reset, update, compute, on single batch
-            self.reset()
-            self.update(*args, **kwargs)
+            self._to_sync = self.dist_sync_on_step
             self._forward_cache = self.compute()
-
+            # `compute` left the states reset, ready for the next batch
+            self._local_state = {attr: getattr(self, attr) for attr in self._defaults.keys()}
+        finally:
             # restore context
             for attr, val in self._cache.items():
                 setattr(self, attr, val)
             self._to_sync = True
             self._computed = None
 
-            return self._forward_cache
+        return self._forward_cache
+
+    def _can_merge_states(self) -> bool:
+        return self.mergeable_states and all(
+            isinstance(getattr(self, attr), list) or reduction_fn in _MERGE_OPS
+            for attr, reduction_fn in self._reductions.items()
+        )
+
+    def _set_local_state(self):
+        """Switches to the reset states of the last ``forward``, or to new ones if the metric moved since."""
+        local_state = self._local_state or {}
+        for attr, default in self._defaults.items():
+            current_val = getattr(self, attr)
+            local_val = local_state.get(attr)
+            if isinstance(default, torch.Tensor):
+                if not (
+                    isinstance(local_val, torch.Tensor) and local_val.device == current_val.device
+                    and local_val.dtype == default.dtype and local_val.shape == default.shape  # noqa: W503
+                ):
+                    local_val = self._own(deepcopy(default).to(current_val.device))
+            elif not isinstance(local_val, list) or local_val:
+                local_val = deepcopy(default)
+            setattr(self, attr, local_val)
 
     def _sync_dist(self):
         input_dict = {attr: getattr(self, attr) for attr in self._reductions.keys()}
@@ -238,21 +303,41 @@ class Metric(nn.Module, ABC):
     def reset(self):
         """
         This method automatically resets the metric state variables to their default value.
+        Tensor states are refilled and list states cleared in place, unless the last computed value refers to them.
         """
+        referenced = _referenced_storage(self._computed)
         for attr, default in self._defaults.items():
             current_val = getattr(self, attr)
             if isinstance(current_val, torch.Tensor):
-                setattr(self, attr, deepcopy(default).to(current_val.device))
+                if (
+                    self._owned_states.get(id(current_val)) is current_val
+                    and current_val.shape == default.shape and current_val.dtype == default.dtype  # noqa: W503
+                    and not current_val.requires_grad and _storage_ptr(current_val) not in referenced  # noqa: W503
+                ):
+                    fill_value = self._fill_values[attr]
+                    if fill_value is None:
+                        current_val.copy_(default)
+                    else:
+                        current_val.fill_(fill_value)
+                else:
+                    setattr(self, attr, self._own(deepcopy(default).to(current_val.device)))
+            elif isinstance(current_val, list) and id(current_val) not in referenced:
+                current_val.clear()
             else:
                 setattr(self, attr, deepcopy(default))
 
+    def _own(self, tensor: torch.Tensor) -> torch.Tensor:
+        self._owned_states[id(tensor)] = tensor
+        return tensor
+
     def __getstate__(self):
         # ignore update and compute functions for pickling
-        return {k: v for k, v in self.__dict__.items() if k not in ["update", "compute"]}
+        return {k: v for k, v in self.__dict__.items() if k not in ["update", "compute", "_owned_states"]}
 
     def __setstate__(self, state):
         # manually restore update and compute functions for pickling
         self.__dict__.update(state)
+        self._owned_states = weakref.WeakValueDictionary()
         self.update = self._wrap_update(self.update)
         self.compute = self._wrap_compute(self.compute)
 
@@ -260,3 +345,328 @@ class Metric(nn.Module, ABC):
         """ Check that predictions and target have the same shape, else raise error """
         if pred.shape != target.shape:
             raise RuntimeError('Predictions and targets are expected to have the same shape')
+
+
+def _fill_value(default: Union[torch.Tensor, list]) -> Optional[Union[int, float, bool]]:
+    """The value of all elements of a tensor state default, if they have the same one."""
+    if not isinstance(default, torch.Tensor) or default.numel() == 0:
+        return None
+    value = default.reshape(-1)[0]
+    if not torch.equal(default, torch.full_like(default, value.item())):
+        return None
+    return value.item()
+
+
+def _storage_ptr(tensor: torch.Tensor) -> int:
+    if hasattr(tensor, 'untyped_storage'):
+        return tensor.untyped_storage().data_ptr()
+    return tensor.storage().data_ptr()
+
+
+def _referenced_storage(value: Any) -> set:
+    """The storages of the tensors and the ids of the lists in a computed value, which a reset must not overwrite."""
+    referenced = set()
+    if value is None:
+        return referenced
+
+    def collect(data):
+        referenced.add(_storage_ptr(data) if isinstance(data, torch.Tensor) else id(data))
+
+    apply_to_collection(value, (torch.Tensor, list), collect)
+    return referenced
+
+
+def _merge_state(reduction_fn: Optional[Callable], state: Union[torch.Tensor, list],
+                 batch_state: Union[torch.Tensor, list]):
+    """Merges the state of one batch into the accumulated state of a metric with ``mergeable_states``."""
+    if isinstance(state, list):
+        state.extend(batch_state)
+        return state
+    if _MERGE_OPS[reduction_fn] == 'sum':
+        if state.shape == batch_state.shape and state.dtype == batch_state.dtype and not state.requires_grad:
+            return state.add_(batch_state)
+        return state + batch_state
+    if _MERGE_OPS[reduction_fn] == 'max':
+        return torch.max(state, batch_state)
+    return torch.min(state, batch_state)
+
+
+# tensor states with these reductions can be merged by `forward`
+_MERGE_OPS = {dim_zero_sum: 'sum', dim_zero_max: 'max', dim_zero_min: 'min'}
+
+# states with these reductions are combined with one `all_reduce` per dtype and op instead of being gathered
+_ALL_REDUCE_OPS = {dim_zero_sum: 'sum', dim_zero_mean: 'mean', dim_zero_max: 'max', dim_zero_min: 'min'}
+
+# dtypes that can be sent through the byte buffer of the coalesced `all_gather`
+_PACKED_DTYPES = [
+    torch.float32, torch.float64, torch.float16, torch.bfloat16, torch.int64, torch.int32, torch.int16,
+    torch.int8, torch.uint8, torch.bool, torch.complex64, torch.complex128,
+]
+
+
+# viewing a tensor as a dtype of another element size, which the byte buffer relies on, needs torch>=1.10
+_DTYPE_VIEWS_AVAILABLE = LooseVersion(torch.__version__) >= LooseVersion("1.10.0")
+
+
+def _as_bytes(tensor: torch.Tensor) -> torch.Tensor:
+    return tensor.detach().contiguous().reshape(-1).view(torch.uint8)
+
+
+def _from_bytes(buffer: torch.Tensor, dtype: torch.dtype) -> torch.Tensor:
+    # the clone aligns the storage for dtypes wider than a byte
+    return buffer.clone().view(dtype)
+
+
+def _sync_metrics(metrics: Sequence[Metric], group: Optional[Any] = None):
+    """
+    Synchronizes the states of several metrics across processes at once. Tensor states reduced by
+    ``"sum"``, ``"mean"``, ``"max"`` or ``"min"`` are packed into one flat buffer per dtype and reduction
+    and combined with a single ``all_reduce`` each, all other states (lists, custom or no reductions)
+    are packed into one byte buffer behind a header with their shapes and gathered with a single padded
+    ``all_gather``. The states end up as if every metric had called ``Metric._sync_dist``.
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+    world_size = torch.distributed.get_world_size(group)
+
+    device = None
+    reduced = OrderedDict()
+    gathered = []
+    for metric in metrics:
+        for attr, reduction_fn in metric._reductions.items():
+            value = getattr(metric, attr)
+            tensors = value if isinstance(value, list) else [value]
+            if any(t.dtype not in _PACKED_DTYPES for t in tensors):
+                raise ValueError(f'Can not synchronize metric state `{attr}` of dtype {tensors[0].dtype}')
+            if device is None and tensors:
+                device = tensors[0].device
+
+            op = _ALL_REDUCE_OPS.get(reduction_fn) if isinstance(value, torch.Tensor) else None
+            if op is None or value.dtype == torch.bool or (op == 'mean' and not value.is_floating_point()):
+                gathered.append((metric, attr))
+                continue
+            dtype = value.dtype
+            if op == 'sum' and not value.is_floating_point() and not value.is_complex():
+                # `torch.sum` accumulates integers as int64
+                dtype = torch.int64
+            reduced.setdefault((dtype, op), []).append((metric, attr))
+
+    if device is None:
+        device = torch.device('cuda', torch.cuda.current_device()) \
+            if torch.distributed.get_backend(group) == 'nccl' else torch.device('cpu')
+
+    if gathered:
+        payload = _pack_states([getattr(metric, attr) for metric, attr in gathered], device)
+        # the longest payload is found with the other maxima, the slot stands for the local length
+        reduced.setdefault((torch.int64, 'max'), []).append(None)
+
+    ops = {
+        'sum': torch.distributed.ReduceOp.SUM,
+        'mean': torch.distributed.ReduceOp.SUM,
+        'max': torch.distributed.ReduceOp.MAX,
+        'min': torch.distributed.ReduceOp.MIN,
+    }
+    max_length = 0
+    for (dtype, op), states in reduced.items():
+        tensors = [
+            torch.tensor([len(payload)], device=device) if state is None else getattr(*state)
+            for state in states
+        ]
+        buffer = torch.cat([t.to(device=device, dtype=dtype).reshape(-1) for t in tensors])
+        torch.distributed.all_reduce(buffer, op=ops[op], group=group)
+        if op == 'mean':
+            buffer /= world_size
+
+        offset = 0
+        for state, tensor in zip(states, tensors):
+            value = buffer[offset:offset + tensor.numel()].view(tensor.shape)
+            offset += tensor.numel()
+            if state is None:
+                max_length = int(value)
+            else:
+                setattr(state[0], state[1], value.to(tensor.device))
+
+    if not gathered:
+        return
+
+    padded = torch.zeros(max_length, dtype=torch.uint8, device=device)
+    padded[:len(payload)] = payload
+    payloads = [torch.zeros_like(padded) for _ in range(world_size)]
+    torch.distributed.all_gather(payloads, padded, group)
+
+    # per state, the items of every rank
+    unpacked = [_unpack_states(payload, len(gathered)) for payload in payloads]
+    for i, (metric, attr) in enumerate(gathered):
+        value = getattr(metric, attr)
+        ranks = [states[i] for states in unpacked]
+        if isinstance(value, torch.Tensor):
+            synced = torch.stack([items[0].to(value.device) for items in ranks])
+        else:
+            # same order as gathering the list items one by one
+            synced = [items[j] for j in range(max(len(items) for items in ranks)) for items in ranks if j < len(items)]
+            if not synced:
+                setattr(metric, attr, synced)
+                continue
+
+        reduction_fn = metric._reductions[attr]
+        setattr(metric, attr, reduction_fn(synced) if reduction_fn is not None else synced)
+
+
+def _pack_states(values: Sequence[Union[torch.Tensor, list]], device: torch.device) -> torch.Tensor:
+    """Packs the tensor and list states into one byte buffer, prefixed with the length of a header of their shapes."""
+    header = []
+    chunks = []
+    for value in values:
+        tensors = value if isinstance(value, list) else [value]
+        header.append(len(tensors))
+        for tensor in tensors:
+            header.extend([_PACKED_DTYPES.index(tensor.dtype), tensor.dim(), *tensor.shape])
+            chunks.append(_as_bytes(tensor.to(device)))
+    header = torch.tensor([len(header)] + header, dtype=torch.int64, device=device)
+    return torch.cat([_as_bytes(header)] + chunks)
+
+
+def _unpack_states(payload: torch.Tensor, num_states: int) -> list:
+    header_length = int(_from_bytes(payload[:8], torch.int64))
+    offset = 8 * (header_length + 1)
+    header = iter(_from_bytes(payload[8:offset], torch.int64).tolist())
+
+    states = []
+    for _ in range(num_states):
+        items = []
+        for _ in range(next(header)):
+            dtype = _PACKED_DTYPES[next(header)]
+            shape = [next(header) for _ in range(next(header))]
+            num_bytes = torch.Size(shape).numel() * torch.empty(0, dtype=dtype).element_size()
+            items.append(_from_bytes(payload[offset:offset + num_bytes], dtype).view(shape))
+            offset += num_bytes
+        states.append(items)
+    return states
+
+
+def _shared_update(metric: Metric, cache: dict) -> Callable:
+    """
+    The ``update`` of a metric inside a :class:`MetricCollection`. Metrics implementing ``_cached_update`` take
+    the intermediate results other metrics already computed from the same inputs (class predictions, stat scores)
+    from ``cache`` and store their own there, unless a subclass overrides ``update`` itself.
+    """
+    mro = type(metric).__mro__
+    if not any('_cached_update' in cls.__dict__ for cls in mro):
+        return metric.update
+    update_owner = next(cls for cls in mro if 'update' in cls.__dict__)
+    if '_cached_update' not in update_owner.__dict__:
+        return metric.update
+
+    def update(*args, **kwargs):
+        metric._computed = None
+        return metric._cached_update(cache, *args, **kwargs)
+
+    return update
+
+
+class MetricCollection(nn.ModuleDict):
+    """
+    MetricCollection class can be used to chain metrics that have the same call pattern into one single class.
+    Intermediate results several metrics derive from the same inputs, like the class predictions and stat scores
+    of ``Accuracy``, ``Precision``, ``Recall`` and ``Fbeta``, are computed once per update and shared between them.
+    In distributed mode, ``compute()`` synchronizes the states of all metrics at once: tensor states reduced by
+    ``"sum"``, ``"mean"``, ``"max"`` or ``"min"`` with one ``all_reduce`` per dtype and reduction and all
+    other states with one ``all_gather``, instead of a barrier and a gather for every single state.
+
+    Args:
+        metrics: One of the following
+
+            * list or tuple: if metrics are passed in as a list, will use the
+              metrics class name as key for output dict. Therefore, two metrics
+              of the same class cannot be chained this way.
+
+            * dict: if metrics are passed in as a dict, will use each key in the
+              dict as key for output dict. Use this format if you want to chain
+              together multiple of the same metric with different parameters.
+
+    Example:
+
+        >>> from pytorch_lightning.metrics import Accuracy, Precision, Recall
+        >>> target = torch.tensor([0, 2, 0, 2, 0, 1, 0, 2])
+        >>> preds = torch.tensor([2, 1, 2, 0, 1, 2, 2, 2])
+        >>> metrics = MetricCollection([Accuracy(),
+        ...                             Precision(num_classes=3, average='macro'),
+        ...                             Recall(num_classes=3, average='macro')])
+        >>> metrics(preds, target)
+        {'Accuracy': tensor(0.1250), 'Precision': tensor(0.0667), 'Recall': tensor(0.1111)}
+
+        >>> metrics = MetricCollection({'micro_recall': Recall(num_classes=3, average='micro'),
+        ...                             'macro_recall': Recall(num_classes=3, average='macro')})
+        >>> metrics(preds, target)
+        {'micro_recall': tensor(0.1250), 'macro_recall': tensor(0.1111)}
+    """
+    def __init__(self, metrics: Union[Sequence[Metric], Dict[str, Metric]]):
+        super().__init__()
+        if isinstance(metrics, dict):
+            for name, metric in metrics.items():
+                if not isinstance(metric, Metric):
+                    raise ValueError(f'Value {metric} belonging to key {name} is not an instance of'
+                                     ' `pl.metrics.Metric`')
+                self[name] = metric
+        elif isinstance(metrics, (tuple, list)):
+            for metric in metrics:
+                if not isinstance(metric, Metric):
+                    raise ValueError(f'Input {metric} to `MetricCollection` is not a instance of `pl.metrics.Metric`')
+                name = metric.__class__.__name__
+                if name in self:
+                    raise ValueError(f'Encountered two metrics both named {name}')
+                self[name] = metric
+        else:
+            raise ValueError('Unknown input to MetricCollection.')
+
+    def forward(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Iteratively call forward for each metric. Positional arguments (args) will
+        be passed to every metric in the collection, while keyword arguments (kwargs)
+        will be passed to every metric.
+        """
+        cache = {}
+        return {name: metric._forward(_shared_update(metric, cache), *args, **kwargs) for name, metric in self.items()}
+
+    def update(self, *args, **kwargs):
+        """
+        Iteratively call update for each metric. Positional arguments (args) will
+        be passed to every metric in the collection, while keyword arguments (kwargs)
+        will be passed to every metric.
+        """
+        cache = {}
+        for metric in self.values():
+            _shared_update(metric, cache)(*args, **kwargs)
+
+    def compute(self) -> Dict[str, Any]:
+        """Synchronizes the states of all metrics in one go and computes each of them."""
+        if torch.distributed.is_available() and torch.distributed.is_initialized():
+            self._sync_dist()
+
+        result = {}
+        for name, metric in self.items():
+            metric._to_sync = False
+            try:
+                result[name] = metric.compute()
+            finally:
+                metric._to_sync = True
+        return result
+
+    def _sync_dist(self):
+        # metrics that would return their cached value have nothing to sync
+        groups = OrderedDict()
+        for metric in self.values():
+            if metric._computed is None:
+                groups.setdefault(metric.process_group, []).append(metric)
+
+        for group, metrics in groups.items():
+            if _DTYPE_VIEWS_AVAILABLE:
+                _sync_metrics(metrics, group)
+            else:
+                for metric in metrics:
+                    metric._sync_dist()
+
+    def reset(self):
+        """Iteratively call reset for each metric."""
+        for metric in self.values():
+            metric.reset()
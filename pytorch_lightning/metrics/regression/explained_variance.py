@@ -65,6 +65,8 @@ class ExplainedVariance(Metric):
         tensor([0.9677, 1.0000])
     """
 
+    mergeable_states = True
+
     def __init__(
         self,
         multioutput: str = 'uniform_average',
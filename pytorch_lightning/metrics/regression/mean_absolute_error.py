@@ -40,6 +40,8 @@ class MeanAbsoluteError(Metric):
         tensor(0.5000)
     """
 
+    mergeable_states = True
+
     def __init__(
         self,
         compute_on_step: bool = True,
@@ -41,6 +41,8 @@ class MeanSquaredError(Metric):
 
     """
 
+    mergeable_states = True
+
     def __init__(
         self,
         compute_on_step: bool = True,
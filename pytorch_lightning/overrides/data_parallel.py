@@ -14,6 +14,7 @@
 
 import itertools
 import threading
+from collections import OrderedDict
 from collections.abc import Mapping, Iterable
 from itertools import chain
 
@@ -24,6 +25,7 @@ from torch.nn.parallel import DistributedDataParallel
 from torch.nn.parallel._functions import Gather
 
 from pytorch_lightning.core.step_result import Result
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.warning_utils import WarningCache
 
 
@@ -55,6 +57,64 @@ def get_a_var(obj):  # pragma: no-cover
     return None
 
 
+class _PendingGather(object):
+    """Stands in for a tensor leaf of the gathered output until all leaves are gathered together."""
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+def _batched_gather(leaves, gather_fn):
+    """
+    Gathers tensor leaves along dim 0, packing every group of leaves with the same dtype and the same
+    shape on all replicas into one flat buffer per replica so the group needs a single gather.
+
+    Args:
+        leaves: for every leaf, the list of its tensors on each replica
+        gather_fn: gathers one tensor per replica along dim 0, e.g. :class:`Gather`
+
+    Return:
+        the gathered tensor of every leaf
+    """
+    gathered = [None] * len(leaves)
+    groups = OrderedDict()
+    for i, tensors in enumerate(leaves):
+        shape = tensors[0].shape
+        if all(t.shape == shape for t in tensors):
+            groups.setdefault(tensors[0].dtype, []).append(i)
+        else:
+            gathered[i] = gather_fn(*tensors)
+
+    for indices in groups.values():
+        if len(indices) == 1:
+            gathered[indices[0]] = gather_fn(*leaves[indices[0]])
+            continue
+
+        num_replicas = len(leaves[indices[0]])
+        flat = [torch.cat([leaves[i][r].reshape(-1) for i in indices]) for r in range(num_replicas)]
+        buffer = gather_fn(*flat).view(num_replicas, -1)
+
+        offset = 0
+        for i in indices:
+            shape = leaves[i][0].shape
+            numel = leaves[i][0].numel()
+            # replica r's tensor is row r of the buffer, concatenated along dim 0 like `Gather` does
+            rows = num_replicas * (shape[0] if shape else 1)
+            gathered[i] = buffer[:, offset:offset + numel].reshape(rows, *shape[1:])
+            offset += numel
+    return gathered
+
+
+def _gather_scalars(outputs, keys, gather_fn):
+    """
+    Gathers the scalar tensors under ``keys`` of every replica's output into one ``(replicas, len(keys))`` block.
+    The gathered value of each key is a column view of the block.
+    """
+    stacked = [torch.stack([output[k] for k in keys]) for output in outputs]
+    return gather_fn(*stacked).view(len(outputs), len(keys))
+
+
 warning_cache = WarningCache()
 
 
@@ -102,7 +162,26 @@ class LightningDataParallel(DataParallel):
         for i, output in enumerate(outputs):
             del output['meta']
 
-        outputs = self.gather(outputs)
+        # logged scalars are gathered as one block per dtype and reduced together in `Result.dp_reduce`
+        scalar_keys = OrderedDict()
+        if self.dim == 0:
+            for k, v in outputs[0].items():
+                if isinstance(v, torch.Tensor) and v.dim() == 0 and v.is_floating_point() and all(
+                    isinstance(o[k], torch.Tensor) and o[k].dim() == 0 and o[k].dtype == v.dtype for o in outputs
+                ):
+                    scalar_keys.setdefault(v.dtype, []).append(k)
+
+        scalar_blocks = []
+        gathered = {}
+        for keys in scalar_keys.values():
+            block = _gather_scalars(outputs, keys, self._gather_fn)
+            columns = [block[:, j] for j in range(len(keys))]
+            scalar_blocks.append((keys, block, columns))
+            gathered.update(zip(keys, columns))
+
+        outputs = self.gather([{k: v for k, v in output.items() if k not in gathered} for output in outputs])
+        outputs.update(gathered)
+        outputs = OrderedDict((k, outputs[k]) for k in prototype_output if k != 'meta')
 
         # pass minimize to constructor for TrainResult
         if 'minimize' in outputs:
@@ -112,18 +191,26 @@ class LightningDataParallel(DataParallel):
 
         result.update(outputs)
         result['meta'] = meta
+        object.__setattr__(result, '_dp_scalar_blocks', scalar_blocks)
         return result
 
+    def _gather_fn(self, *tensors):
+        return Gather.apply(self.output_device, self.dim, *tensors)
+
     def gather(self, outputs):
         r"""
         Override the gather method to support python scalars as well.
+        Tensors of the same dtype and shape are packed and gathered together.
         """
+        pending = []
+
         def gather_map(outputs):
             elem = outputs[0]
             elem_type = type(elem)
 
             if isinstance(elem, torch.Tensor):
-                return Gather.apply(self.output_device, self.dim, *outputs)
+                pending.append(outputs)
+                return _PendingGather(len(pending) - 1)
 
             if elem is None:
                 return None
@@ -145,7 +232,16 @@ class LightningDataParallel(DataParallel):
             res = gather_map(outputs)
         finally:
             gather_map = None
-        return res
+
+        if not pending:
+            return res
+        if self.dim == 0:
+            gathered = _batched_gather(pending, self._gather_fn)
+        else:
+            gathered = [self._gather_fn(*tensors) for tensors in pending]
+        if isinstance(res, _PendingGather):
+            return gathered[res.index]
+        return apply_to_collection(res, _PendingGather, lambda p: gathered[p.index])
 
     def parallel_apply(self, replicas, inputs, kwargs):
         return parallel_apply(replicas, inputs, kwargs, self.device_ids[:len(replicas)])
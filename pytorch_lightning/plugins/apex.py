@@ -16,11 +16,6 @@ from torch.optim.optimizer import Optimizer
 from pytorch_lightning.utilities.distributed import rank_zero_warn
 from pytorch_lightning.utilities import AMPType
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 
 class ApexPlugin:
 
@@ -28,6 +23,7 @@ class ApexPlugin:
         self.trainer = trainer
 
     def connect(self, model, optimizers):
+        from apex import amp
         model, optimizers = self.configure_apex(amp, model, optimizers, self.trainer.amp_level)
         self.trainer.reinit_scheduler_properties(optimizers, self.trainer.lr_schedulers)
         return model, optimizers
@@ -37,6 +33,7 @@ class ApexPlugin:
         return output
 
     def backward(self, closure_loss, optimizer, opt_idx, *args, **kwargs):
+        from apex import amp
         closure_loss = amp.scale_loss(closure_loss, optimizer)
 
         # enter apex context
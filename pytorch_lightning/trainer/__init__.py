@@ -804,6 +804,20 @@ Writes logs to disk this often.
 See Also:
     - :ref:`logging`
 
+flush_logs_every_n_seconds
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Also writes logs to disk when this many seconds passed since they were last written, useful when steps are slow.
+The loggers are written together, and once more when training ends.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(flush_logs_every_n_seconds=None)
+
+    # write logs at least every minute
+    trainer = Trainer(flush_logs_every_n_seconds=60)
+
 logger
 ^^^^^^
 
@@ -987,6 +1001,27 @@ Example::
     --env=XLA_USE_BF16=1
     -- python your_trainer_file.py
 
+persistent_workers
+^^^^^^^^^^^^^^^^^^
+
+Keep the worker processes of multi-process train and val dataloaders alive between epochs and validation
+runs, instead of starting new ones (with a fresh copy of the dataset) every time a dataloader is iterated.
+The next validation run is also started while training, so its workers prefetch the first batches.
+Only plain map-style ``DataLoader`` instances with ``num_workers > 0`` are rebuilt with ``persistent_workers=True``,
+and nothing changes when ``reload_dataloaders_every_epoch=True``. Requires PyTorch 1.7 or newer.
+
+.. testcode::
+
+    # default used by the Trainer (new workers for every pass)
+    trainer = Trainer(persistent_workers=False)
+
+    # reuse the workers
+    trainer = Trainer(persistent_workers=True)
+
+.. warning:: The workers keep the copy of the dataset they started with. Changes made to the dataset in the
+    main process between epochs (e.g. in a callback) don't reach them. While training, the workers of the
+    val dataloaders stay busy and hold their prefetched batches in memory.
+
 plugins
 ^^^^^^^
 
@@ -1024,6 +1059,43 @@ To define your own behavior, subclass the relevant class and pass it in. Here's
 
     trainer = Trainer(cluster_environment=cluster_environment())
 
+preemption_snapshot_every_n_steps
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+When SLURM preempts a job, the trainer saves an hpc checkpoint in the short grace period of the signal.
+With this flag the training state is copied to CPU memory every n steps instead, and only that copy is
+written when the signal arrives. It goes to ``preemption_scratch_dir`` first, a fast local disk, and is copied
+to the ``weights_save_path`` in the background. The signal handler waits ``preemption_save_timeout`` seconds
+at most for the copy to be written.
+
+.. testcode::
+
+    # default used by the Trainer (the checkpoint is dumped when the signal arrives)
+    trainer = Trainer(preemption_snapshot_every_n_steps=0)
+
+    # refresh the snapshot every 100 steps, write it to local scratch first
+    trainer = Trainer(preemption_snapshot_every_n_steps=100, preemption_scratch_dir='/scratch/snapshots')
+
+.. note:: The snapshot holds a copy of the model and optimizer states in (pinned) CPU memory.
+
+prefetch_batches
+^^^^^^^^^^^^^^^^
+
+Number of batches to fetch ahead in a background thread. On GPU the prefetched batches are also
+pinned and moved to the device (calling :meth:`~pytorch_lightning.core.hooks.DataHooks.transfer_batch_to_device`)
+on a separate CUDA stream, so the copy of the next batch overlaps with the current step.
+On CPU only data loading is overlapped.
+
+.. testcode::
+
+    # default used by the Trainer (no prefetching)
+    trainer = Trainer(prefetch_batches=0)
+
+    # keep up to 2 batches ready
+    trainer = Trainer(prefetch_batches=2)
+
+.. note:: The ``transfer_batch_to_device`` hook runs in the background thread when prefetching is enabled.
+
 prepare_data_per_node
 ^^^^^^^^^^^^^^^^^^^^^
 
@@ -1046,6 +1118,23 @@ If False will only call from NODE_RANK=0, LOCAL_RANK=0
     # use only NODE_RANK=0, LOCAL_RANK=0
     Trainer(prepare_data_per_node=False)
 
+toggle_optimizers
+^^^^^^^^^^^^^^^^^
+
+With several optimizers, the training step for one optimizer only computes the gradients of the parameters
+that optimizer trains, all other parameters are set to ``requires_grad=False``. Which parameters each
+optimizer trains is computed once when the training starts, switching optimizers only flips the parameters
+they don't share. Models overriding :meth:`~pytorch_lightning.core.lightning.LightningModule.toggle_optimizer`
+toggle the parameters themselves.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(toggle_optimizers=True)
+
+    # the loss of each optimizer only depends on its own parameters, no need to toggle them
+    trainer = Trainer(toggle_optimizers=False)
+
 tpu_cores
 ^^^^^^^^^
 
@@ -1457,7 +1546,7 @@ with the hidden
 
             return {
                 "loss": ...,
-                "hiddens": hiddens  # remember to detach() this
+                "hiddens": hiddens  # detached by the trainer after the backward pass
             }
 
 To modify how the batch is split,
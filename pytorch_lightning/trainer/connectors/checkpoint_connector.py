@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import io
+import json
 import os
 import re
 import signal
+import threading
 from abc import ABC
 from subprocess import call
+from typing import Optional
 
 import torch
 import torch.distributed as torch_distrib
@@ -28,18 +31,15 @@ from pytorch_lightning.callbacks import EarlyStopping, ModelCheckpoint
 from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.loggers import LightningLoggerBase
 from pytorch_lightning.overrides.data_parallel import LightningDataParallel, LightningDistributedDataParallel
+from pytorch_lightning.trainer.supporters import CheckpointSnapshot
 from pytorch_lightning.utilities import AMPType, rank_zero_warn
+from pytorch_lightning.utilities.checkpoint_store import IncrementalCheckpointStore
 from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.upgrade_checkpoint import KEYS_MAPPING as DEPRECATED_CHECKPOINT_KEYS
 from pytorch_lightning.accelerators.accelerator import Accelerator
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 try:
     from omegaconf import Container
 except ImportError:
@@ -48,10 +48,23 @@ else:
     OMEGACONF_AVAILABLE = True
 
 
+# the number of the latest hpc checkpoint of a folder, so it does not need to be listed
+HPC_MANIFEST_NAME = 'hpc_latest.json'
+
+
 class CheckpointConnector:
 
     def __init__(self, trainer):
         self.trainer = trainer
+        self._snapshot = None
+        self._snapshot_step = None
+        self._snapshot_flush = None
+
+    def on_trainer_init(self, preemption_snapshot_every_n_steps, preemption_scratch_dir, preemption_save_timeout):
+        self.trainer.preemption_snapshot_every_n_steps = preemption_snapshot_every_n_steps
+        self.trainer.preemption_scratch_dir = preemption_scratch_dir
+        self.trainer.preemption_save_timeout = preemption_save_timeout
+        self._snapshot = CheckpointSnapshot() if preemption_snapshot_every_n_steps else None
 
     def restore_weights(self, model: LightningModule):
         """
@@ -118,6 +131,7 @@ class CheckpointConnector:
         if self.trainer.amp_backend == AMPType.NATIVE and 'native_amp_scaling_state' in checkpoint:
             self.trainer.scaler.load_state_dict(checkpoint['native_amp_scaling_state'])
         elif self.trainer.amp_backend == AMPType.APEX and 'amp_scaling_state' in checkpoint:
+            from apex import amp
             amp.load_state_dict(checkpoint['amp_scaling_state'])
 
         # load training state (affects trainer only)
@@ -150,6 +164,12 @@ class CheckpointConnector:
         self.trainer.global_step = checkpoint['global_step']
         self.trainer.current_epoch = checkpoint['epoch']
 
+        # a checkpoint saved in the middle of an epoch resumes it at the next batch
+        train_dataloader_state = checkpoint.get('train_dataloader_state')
+        if train_dataloader_state is not None:
+            self.trainer.current_epoch = train_dataloader_state['epoch']
+            self.trainer.train_loop.load_train_dataloader_state_dict(train_dataloader_state)
+
         # crash if max_epochs is lower then the current epoch from the checkpoint
         if self.trainer.current_epoch > self.trainer.max_epochs:
             m = f"""
@@ -162,7 +182,11 @@ class CheckpointConnector:
         # Inequality deals with different global step for odd vs even num_training_batches
         n_accum = 1 if self.trainer.accumulate_grad_batches is None else self.trainer.accumulate_grad_batches
         expected_steps = self.trainer.num_training_batches / n_accum
-        if self.trainer.num_training_batches != 0 and self.trainer.global_step % expected_steps > 1:
+        if (
+            train_dataloader_state is None
+            and self.trainer.num_training_batches != 0
+            and self.trainer.global_step % expected_steps > 1
+        ):
             rank_zero_warn(
                 "You're resuming from a checkpoint that ended mid-epoch. "
                 "This can cause unreliable results if further training is done, "
@@ -194,7 +218,10 @@ class CheckpointConnector:
         # look for hpc weights
         folderpath = str(self.trainer.weights_save_path)
         fs = get_filesystem(folderpath)
-        if fs.exists(folderpath):
+        if self.read_hpc_manifest(folderpath) is not None:
+            self.hpc_load(folderpath, self.trainer.on_gpu)
+            did_restore = True
+        elif fs.exists(folderpath):
             files = [os.path.basename(f['name']) for f in fs.listdir(folderpath)]
             hpc_weight_paths = [x for x in files if 'hpc_ckpt' in x]
 
@@ -213,13 +240,19 @@ class CheckpointConnector:
         fs = get_filesystem(folderpath)
         fs.makedirs(folderpath, exist_ok=True)
 
-        # save logger to make sure we get all the metrics
-        logger.save()
+        ckpt_number = self.latest_hpc_ckpt_number(folderpath) + 1
+        filepath = os.path.join(folderpath, f'hpc_ckpt_{ckpt_number}.ckpt')
 
-        ckpt_number = self.max_ckpt_in_folder(folderpath) + 1
+        if self._snapshot is not None and self._snapshot.checkpoint is not None:
+            self.flush_snapshot(filepath, ckpt_number)
+            # the metrics are saved once the snapshot is safe
+            if logger is not None:
+                logger.save()
+            return filepath
 
-        fs.makedirs(folderpath, exist_ok=True)
-        filepath = os.path.join(folderpath, f'hpc_ckpt_{ckpt_number}.ckpt')
+        # save logger to make sure we get all the metrics
+        if logger is not None:
+            logger.save()
 
         # give model a chance to do something on hpc_save
         model = self.trainer.get_model()
@@ -239,8 +272,55 @@ class CheckpointConnector:
             )
             atomic_save(checkpoint, filepath)
 
+        self.write_hpc_manifest(folderpath, ckpt_number)
         return filepath
 
+    def refresh_snapshot(self):
+        """
+        Refreshes the CPU copy of the training state every ``preemption_snapshot_every_n_steps`` steps, which
+        :meth:`hpc_save` writes when the job is preempted instead of dumping a checkpoint in the signal handler.
+        """
+        every_n_steps = self.trainer.preemption_snapshot_every_n_steps
+        step = self.trainer.global_step
+        if not every_n_steps or step % every_n_steps != 0 or step == self._snapshot_step:
+            return
+        # the buffers are being written
+        if self._snapshot_flush is not None and self._snapshot_flush.is_alive():
+            return
+        if self.trainer.is_global_zero:
+            self._snapshot.refresh(self.dump_checkpoint())
+            self._snapshot_step = step
+
+    def flush_snapshot(self, filepath: str, ckpt_number: int):
+        """
+        Writes the snapshot to the scratch directory, then copies it to ``filepath`` in the background.
+        Waits until the snapshot is in scratch, for ``preemption_save_timeout`` seconds at most.
+        """
+        scratch_dir = self.trainer.preemption_scratch_dir or os.path.dirname(filepath)
+        scratch_path = os.path.join(scratch_dir, os.path.basename(filepath))
+        self.trainer.get_model().on_hpc_save(self._snapshot.checkpoint)
+
+        written = threading.Event()
+
+        def flush():
+            try:
+                get_filesystem(scratch_dir).makedirs(scratch_dir, exist_ok=True)
+                self._snapshot.save(scratch_path)
+            finally:
+                written.set()
+            if scratch_path != filepath:
+                get_filesystem(filepath).put(scratch_path, filepath)
+            self.write_hpc_manifest(os.path.dirname(filepath), ckpt_number)
+            log.info(f'saved the preemption snapshot of step {self._snapshot_step} to {filepath}')
+
+        self._snapshot_flush = threading.Thread(target=flush, daemon=True)
+        self._snapshot_flush.start()
+        if not written.wait(self.trainer.preemption_save_timeout):
+            rank_zero_warn(
+                f'The preemption snapshot was not written to {scratch_dir}'
+                f' within {self.trainer.preemption_save_timeout} seconds.'
+            )
+
     def dump_checkpoint(self, weights_only: bool = False) -> dict:
         """Creating model checkpoint.
 
@@ -274,10 +354,16 @@ class CheckpointConnector:
                 lr_schedulers.append(scheduler['scheduler'].state_dict())
             checkpoint['lr_schedulers'] = lr_schedulers
 
+            # save where the current epoch stopped, when it is saved in the middle of one
+            train_dataloader_state = self.trainer.train_loop.train_dataloader_state_dict()
+            if train_dataloader_state is not None:
+                checkpoint['train_dataloader_state'] = train_dataloader_state
+
             # save native amp scaling
             if self.trainer.amp_backend == AMPType.NATIVE and not self.trainer.use_tpu and self.trainer.scaler is not None:
                 checkpoint['native_amp_scaling_state'] = self.trainer.scaler.state_dict()
             elif self.trainer.amp_backend == AMPType.APEX:
+                from apex import amp
                 checkpoint['amp_scaling_state'] = amp.state_dict()
 
         # add the module_arguments and state_dict from the model
@@ -304,7 +390,7 @@ class CheckpointConnector:
         return checkpoint
 
     def hpc_load(self, folderpath, on_gpu):
-        filepath = '{}/hpc_ckpt_{}.ckpt'.format(folderpath, self.max_ckpt_in_folder(folderpath))
+        filepath = '{}/hpc_ckpt_{}.ckpt'.format(folderpath, self.latest_hpc_ckpt_number(folderpath))
 
         # load on CPU first
         checkpoint = torch.load(filepath, map_location=lambda storage, loc: storage)
@@ -319,6 +405,7 @@ class CheckpointConnector:
         if self.trainer.amp_backend == AMPType.NATIVE and 'native_amp_scaling_state' in checkpoint:
             self.trainer.scaler.load_state_dict(checkpoint['native_amp_scaling_state'])
         elif self.trainer.amp_backend == AMPType.APEX and 'amp_scaling_state' in checkpoint:
+            from apex import amp
             amp.load_state_dict(checkpoint['amp_scaling_state'])
 
         if self.trainer.root_gpu is not None:
@@ -332,6 +419,42 @@ class CheckpointConnector:
 
         log.info(f'restored hpc model from: {filepath}')
 
+    def latest_hpc_ckpt_number(self, folderpath: str) -> int:
+        """The number of the latest hpc checkpoint in ``folderpath``, read from its manifest when it has one."""
+        ckpt_number = self.read_hpc_manifest(folderpath)
+        if ckpt_number is not None:
+            return ckpt_number
+        fs = get_filesystem(folderpath)
+        return self.max_ckpt_in_folder(folderpath) if fs.exists(folderpath) else 0
+
+    def read_hpc_manifest(self, folderpath: str) -> Optional[int]:
+        """The number of the latest hpc checkpoint in the manifest of ``folderpath``, ``None`` if it has no
+        (readable) manifest."""
+        fs = get_filesystem(folderpath)
+        manifest_path = os.path.join(folderpath, HPC_MANIFEST_NAME)
+        if not fs.isfile(manifest_path):
+            return None
+        try:
+            with fs.open(manifest_path, 'r') as f:
+                return int(json.load(f)['latest'])
+        except (ValueError, KeyError, TypeError) as err:
+            rank_zero_warn(f'The hpc manifest {manifest_path} can not be read ({err}), listing the folder instead.')
+            return None
+
+    def write_hpc_manifest(self, folderpath: str, ckpt_number: int):
+        manifest_path = os.path.join(folderpath, HPC_MANIFEST_NAME)
+        content = json.dumps({'latest': ckpt_number})
+        if "://" in folderpath:
+            # objects of remote filesystems only appear once they are written completely
+            with get_filesystem(folderpath).open(manifest_path, 'w') as f:
+                f.write(content)
+            return
+        # replace the manifest, so a preemption while writing it can not leave it truncated
+        tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, manifest_path)
+
     def max_ckpt_in_folder(self, path, name_key='ckpt_'):
         fs = get_filesystem(path)
         files = [os.path.basename(f["name"]) for f in fs.listdir(path)]
@@ -347,17 +470,20 @@ class CheckpointConnector:
 
         return max(ckpt_vs)
 
-    def save_checkpoint(self, filepath, weights_only: bool = False):
+    def save_checkpoint(
+        self, filepath, weights_only: bool = False, store: Optional[IncrementalCheckpointStore] = None
+    ):
         checkpoint = self.dump_checkpoint(weights_only)
+        save = atomic_save if store is None else store.save
 
         if self.trainer.is_global_zero:
             # do the actual save
             try:
-                atomic_save(checkpoint, filepath)
+                save(checkpoint, filepath)
             except AttributeError as err:
                 if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
                     del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
                 rank_zero_warn(
                     'Warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
                 )
-                atomic_save(checkpoint, filepath)
+                save(checkpoint, filepath)
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
+
+import torch
+
 from pytorch_lightning.core.datamodule import LightningDataModule
+from pytorch_lightning.trainer.supporters import BatchPrefetcher
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from typing import List, Optional, Union
 from torch.utils.data import DataLoader
@@ -23,22 +28,77 @@ class DataConnector(object):
 
     def __init__(self, trainer):
         self.trainer = trainer
-
-    def on_trainer_init(self, check_val_every_n_epoch, reload_dataloaders_every_epoch, prepare_data_per_node):
+        self._eval_iterators = {}
+        self._staged_batch = None
+        self._staged_device = None
+
+    def on_trainer_init(
+            self,
+            check_val_every_n_epoch,
+            reload_dataloaders_every_epoch,
+            prepare_data_per_node,
+            prefetch_batches,
+            persistent_workers=False,
+    ):
         self.trainer.datamodule = None
         self.trainer.prepare_data_per_node = prepare_data_per_node
+        self.trainer.prefetch_batches = prefetch_batches
+        self.trainer.persistent_workers = persistent_workers
 
         self.trainer.check_val_every_n_epoch = check_val_every_n_epoch
         self.trainer.reload_dataloaders_every_epoch = reload_dataloaders_every_epoch
         self.trainer._is_data_prepared = False
 
-    def get_profiled_train_dataloader(self, train_dataloader):
+    def get_profiled_train_dataloader(self, train_dataloader, start: int = 0):
         profiled_dl = self.trainer.profiler.profile_iterable(
-            enumerate(self._with_is_last(train_dataloader)),
+            enumerate(self._with_is_last(self.prefetch(train_dataloader)), start),
             "get_train_batch"
         )
         return profiled_dl
 
+    def get_eval_iterator(self, dataloader):
+        """Returns an iterator over the given evaluation dataloader. If the iterator was already started
+        by :meth:`prefetch_eval_iterator`, it is reused together with the batches its workers prefetched."""
+        prefetched = self._eval_iterators.pop(id(dataloader), None)
+        if prefetched is not None and prefetched[0] is dataloader:
+            return self.prefetch(prefetched[1])
+        return self.prefetch(dataloader)
+
+    def prefetch_eval_iterator(self, dataloader):
+        """Starts the next pass over a dataloader with persistent workers right away, so its workers
+        fill their (``prefetch_factor`` bounded) queues while training runs until the next evaluation."""
+        if isinstance(dataloader, DataLoader) and getattr(dataloader, 'persistent_workers', False):
+            self._eval_iterators[id(dataloader)] = (dataloader, iter(dataloader))
+
+    def reset_eval_iterators(self):
+        self._eval_iterators = {}
+
+    def prefetch(self, iterable):
+        """Wraps an iterable of batches so that ``Trainer(prefetch_batches=n)`` batches are fetched and moved to
+        the accelerator's device (including the ``transfer_batch_to_device`` hook) while the current step runs."""
+        if not self.trainer.prefetch_batches:
+            return iterable
+
+        device = self.trainer.accelerator_backend.batch_device()
+        transfer_fn = None
+        if device is not None:
+            transfer_fn = partial(self.trainer.accelerator_backend.batch_to_device, device=device)
+
+        prefetcher = BatchPrefetcher(iterable, self.trainer.prefetch_batches, transfer_fn=transfer_fn, device=device)
+        return self._track_staged(prefetcher, device)
+
+    def _track_staged(self, prefetcher, device):
+        for batch in prefetcher:
+            if device is not None:
+                self._staged_batch, self._staged_device = batch, device
+            yield batch
+
+    def is_staged(self, batch, device) -> bool:
+        """Whether the batch was already moved to the given device by the prefetcher."""
+        if self._staged_batch is None or batch is not self._staged_batch:
+            return False
+        return torch.device(device) == self._staged_device
+
     def _with_is_last(self, iterable):
         """Pass through values from the given iterable with an added boolean indicating if this is the last item.
         See `https://stackoverflow.com/a/1630350 <https://stackoverflow.com/a/1630350>`_"""
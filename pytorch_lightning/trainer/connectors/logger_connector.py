@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import time
 import torch
 from pytorch_lightning.core import memory
 from pytorch_lightning.loggers import TensorBoardLogger, LoggerCollection
@@ -33,13 +34,16 @@ class LoggerConnector:
         self.logged_metrics = {}
         self.progress_bar_metrics = {}
         self.eval_loop_results = []
+        self._last_flush_step = None
+        self._last_flush_time = time.monotonic()
 
-    def on_trainer_init(self, logger, flush_logs_every_n_steps, log_every_n_steps):
+    def on_trainer_init(self, logger, flush_logs_every_n_steps, log_every_n_steps, flush_logs_every_n_seconds=None):
         # logging
         self.configure_logger(logger)
         # todo: IDE is complaining, these shall be initialized in the Trainer init at leas as placeholders
         #  and assign here the desired value
         self.trainer.flush_logs_every_n_steps = flush_logs_every_n_steps
+        self.trainer.flush_logs_every_n_seconds = flush_logs_every_n_seconds
         self.trainer.log_every_n_steps = log_every_n_steps
 
     def configure_logger(self, logger):
@@ -60,6 +64,31 @@ class LoggerConnector:
             else:
                 self.trainer.logger = logger
 
+    def flush_logs(self, force: bool = False):
+        """
+        Saves the loggers every ``flush_logs_every_n_steps`` steps or ``flush_logs_every_n_seconds`` seconds.
+
+        All loggers of a :class:`~pytorch_lightning.loggers.LoggerCollection` are saved together.
+
+        Args:
+            force: save now, independent of the schedule
+        """
+        if self.trainer.logger is None or not self.trainer.is_global_zero:
+            return
+
+        step = self.trainer.global_step
+        if not force:
+            # with accumulated gradients, several batches share a step and it is flushed once
+            due_by_steps = (step + 1) % self.trainer.flush_logs_every_n_steps == 0 and step != self._last_flush_step
+            every_n_seconds = self.trainer.flush_logs_every_n_seconds
+            due_by_time = every_n_seconds is not None and time.monotonic() - self._last_flush_time >= every_n_seconds
+            if not (due_by_steps or due_by_time):
+                return
+
+        self.trainer.logger.save()
+        self._last_flush_step = step
+        self._last_flush_time = time.monotonic()
+
     def log_metrics(self, metrics, grad_norm_dic, step=None):
         """Logs the metric dict passed in.
         If `step` parameter is None and `step` key is presented is metrics,
@@ -93,7 +122,8 @@ class LoggerConnector:
         if self.trainer.logger is not None:
             if self.trainer.is_global_zero:
                 self.trainer.logger.agg_and_log_metrics(scalar_metrics, step=step)
-                self.trainer.logger.save()
+                # hand the metrics over right away, the loggers write them to disk in `flush_logs`
+                self.trainer.logger._finalize_agg_metrics()
 
             # track the logged metrics
             self.logged_metrics.update(scalar_metrics)
@@ -450,7 +480,9 @@ class LoggerConnector:
             time_reduced_outputs = []
             for train_step_idx in range(len(opt_outputs)):
                 tbptt_outs = opt_outputs[train_step_idx]
-                tbptt_outs = tbptt_outs[0].__class__.reduce_across_time(tbptt_outs)
+                # the results of the TBPTT splits may have been reduced across time during the batch already
+                if isinstance(tbptt_outs, list):
+                    tbptt_outs = tbptt_outs[0].__class__.reduce_across_time(tbptt_outs)
                 if len(tbptt_outs) > 1:
                     time_reduced_outputs.append(tbptt_outs)
 
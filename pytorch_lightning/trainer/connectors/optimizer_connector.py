@@ -20,10 +20,11 @@ class OptimizerConnector:
     def __init__(self, trainer):
         self.trainer = trainer
 
-    def on_trainer_init(self):
+    def on_trainer_init(self, toggle_optimizers: bool = True):
         self.trainer.lr_schedulers = []
         self.trainer.optimizers = []
         self.trainer.optimizer_frequencies = []
+        self.trainer.toggle_optimizers = toggle_optimizers
 
     def update_learning_rates(self, interval: str, monitor_metrics=None):
         """Update learning rates.
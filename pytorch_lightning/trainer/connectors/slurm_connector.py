@@ -102,7 +102,8 @@ class SLURMConnector:
                 log.warning('requeue failed...')
 
             # close experiment to avoid issues
-            self.trainer.logger.close()
+            if self.trainer.logger is not None:
+                self.trainer.logger.close()
 
     def term_handler(self, signum, frame):
         # save
@@ -29,6 +29,10 @@ class TrainingTricksConnector:
             terminate_on_nan
     ):
 
+        if not isinstance(terminate_on_nan, int) or terminate_on_nan < 0:
+            raise MisconfigurationException(
+                f'`terminate_on_nan` should be a bool or a positive int of steps, got {terminate_on_nan}.'
+            )
         self.trainer.terminate_on_nan = terminate_on_nan
 
         # gradient clipping
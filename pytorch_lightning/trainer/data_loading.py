@@ -17,13 +17,15 @@ import platform
 from abc import ABC, abstractmethod
 from typing import Union, List, Tuple, Callable, Optional
 
-from torch.utils.data import DataLoader, RandomSampler, SequentialSampler
+from torch.utils.data import BatchSampler, DataLoader, RandomSampler, SequentialSampler
 from torch.utils.data.distributed import DistributedSampler
 
 from pytorch_lightning.accelerators.accelerator import Accelerator
 from pytorch_lightning.core import LightningModule
+from pytorch_lightning.trainer.connectors.data_connector import DataConnector
+from pytorch_lightning.trainer.supporters import PassGenerator, PicklableGenerator, ResumableSampler
 from pytorch_lightning.utilities import rank_zero_warn
-from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
+from pytorch_lightning.utilities.data import can_persist_workers, has_iterable_dataset, has_len
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.debugging import InternalDebugger
 from pytorch_lightning.utilities.model_utils import is_overridden
@@ -32,22 +34,10 @@ from copy import deepcopy
 from typing import Iterable
 
 TPU_AVAILABLE = XLADeviceUtils.tpu_device_exists()
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 if TPU_AVAILABLE:
     import torch_xla
     import torch_xla.core.xla_model as xm
 
-try:
-    import horovod.torch as hvd
-except (ModuleNotFoundError, ImportError):
-    HOROVOD_AVAILABLE = False
-else:
-    HOROVOD_AVAILABLE = True
-
 
 class TrainerDataLoadingMixin(ABC):
 
@@ -77,6 +67,9 @@ class TrainerDataLoadingMixin(ABC):
     num_processes: int
     distributed_backend: Optional[str]
     dev_debugger: InternalDebugger
+    reload_dataloaders_every_epoch: bool
+    persistent_workers: bool
+    data_connector: DataConnector
 
     def _worker_check(self, dataloader: DataLoader, name: str) -> None:
         on_windows = platform.system() == 'Windows'
@@ -139,10 +132,55 @@ class TrainerDataLoadingMixin(ABC):
         dataloader = type(dataloader)(**dl_args)
         return dataloader
 
+    def _with_persistent_workers(self, dataloader):
+        # with `Trainer(persistent_workers=True)`, keep the worker processes (and their copy of the dataset)
+        # alive between epochs and validation runs instead of respawning them every time the dataloader is iterated
+        if not self.persistent_workers or self.reload_dataloaders_every_epoch or not can_persist_workers(dataloader):
+            return dataloader
+
+        skip_keys = ['batch_sampler', 'dataset_kind', 'multiprocessing_context']
+
+        dl_args = {
+            k: v for k, v in dataloader.__dict__.items() if not k.startswith('_') and k not in skip_keys
+        }
+
+        dl_args['multiprocessing_context'] = dataloader.multiprocessing_context
+        dl_args['persistent_workers'] = True
+        dataloader = DataLoader(**dl_args)
+        return dataloader
+
+    def _with_resumable_sampler(self, dataloader):
+        # let an epoch a checkpoint interrupted be resumed at the next batch, without loading the trained samples
+        if not isinstance(dataloader, DataLoader) or has_iterable_dataset(dataloader):
+            return dataloader
+        batch_sampler = dataloader.batch_sampler
+        if type(batch_sampler) is not BatchSampler or isinstance(batch_sampler.sampler, ResumableSampler):
+            return dataloader
+
+        # the generators which the order of the samples and the seeds of the workers are drawn from
+        generators = []
+        sampler = batch_sampler.sampler
+        if isinstance(sampler, RandomSampler) and hasattr(sampler, 'generator'):
+            seed = sampler.generator is None
+            if seed:
+                sampler.generator = PicklableGenerator()
+            generators.append(PassGenerator(sampler.generator, seed, first_pass_only=False))
+        if hasattr(dataloader, 'generator') and all(dataloader.generator is not g.generator for g in generators):
+            seed = dataloader.generator is None
+            if seed:
+                dataloader.generator = PicklableGenerator()
+            # persistent workers are seeded once, when the first pass starts them
+            first_pass_only = dataloader.num_workers > 0 and getattr(dataloader, 'persistent_workers', False)
+            generators.append(PassGenerator(dataloader.generator, seed, first_pass_only))
+
+        batch_sampler.sampler = ResumableSampler(sampler, batch_sampler.batch_size, generators)
+        return dataloader
+
     def _get_distributed_sampler(self, dataloader, train):
         if self.use_tpu:
             kwargs = dict(num_replicas=xm.xrt_world_size(), rank=xm.get_ordinal())
         elif self.use_horovod:
+            import horovod.torch as hvd
             kwargs = dict(num_replicas=hvd.size(), rank=hvd.rank())
         else:
             world_size = {
@@ -180,6 +218,8 @@ class TrainerDataLoadingMixin(ABC):
 
         # automatically add samplers
         self.train_dataloader = self.auto_add_sampler(self.train_dataloader, train=True)
+        self.train_dataloader = self._with_persistent_workers(self.train_dataloader)
+        self.train_dataloader = self._with_resumable_sampler(self.train_dataloader)
 
         self.num_training_batches = len(self.train_dataloader) if has_len(self.train_dataloader) else float('inf')
         self._worker_check(self.train_dataloader, 'train dataloader')
@@ -269,6 +309,10 @@ class TrainerDataLoadingMixin(ABC):
         # add samplers
         dataloaders = [self.auto_add_sampler(dl, train=False) for dl in dataloaders if dl is not None]
 
+        # validation runs several times per fit, keep their workers around
+        if mode == 'val':
+            dataloaders = [self._with_persistent_workers(dl) for dl in dataloaders]
+
         loader_num_batches = []
 
         # determine number of batches
@@ -313,6 +357,7 @@ class TrainerDataLoadingMixin(ABC):
         has_loader = is_overridden('val_dataloader', model)
         has_step = is_overridden('validation_step', model)
         if has_loader and has_step:
+            self.data_connector.reset_eval_iterators()
             self.num_val_batches, self.val_dataloaders = self._reset_eval_dataloader(model, 'val')
 
     def reset_test_dataloader(self, model) -> None:
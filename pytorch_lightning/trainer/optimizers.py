@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import ABC
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import torch
 from torch import optim
@@ -152,6 +152,83 @@ class TrainerOptimizersMixin(ABC):
                     scheduler.load_state_dict(state)
 
 
+class OptimizerToggle(object):
+    """
+    Sets ``requires_grad`` of the parameters of a model to train with one optimizer at a time, like
+    :meth:`~pytorch_lightning.core.lightning.LightningModule.toggle_optimizer` does.
+
+    Which parameters each optimizer trains is computed once and recomputed whenever the ``param_groups`` of an
+    optimizer change, which every toggle checks by the number and sizes of the groups. Switching to another
+    optimizer only flips the parameters which only one of the two trains, the parameters they share keep their
+    flag. The flags of all parameters are only set by the first toggle, after the ``param_groups`` changed and
+    after :meth:`reset`: call it when changing ``requires_grad`` of the parameters elsewhere.
+
+    Example:
+
+        >>> model = torch.nn.ModuleList([torch.nn.Linear(1, 1) for _ in range(3)])
+        >>> shared = list(model[2].parameters())
+        >>> optimizers = [optim.SGD([*model[0].parameters(), *shared], lr=0.1),
+        ...               optim.SGD([*model[1].parameters(), *shared], lr=0.1)]
+        >>> toggle = OptimizerToggle(model, optimizers)
+        >>> toggle.toggle(1)
+        >>> [layer.weight.requires_grad for layer in model]
+        [False, True, True]
+        >>> toggle.toggle(0)
+        >>> [layer.weight.requires_grad for layer in model]
+        [True, False, True]
+    """
+
+    def __init__(self, model: torch.nn.Module, optimizers: Sequence[Optimizer]):
+        self._model = model
+        self.optimizers = optimizers
+        self._build()
+
+    def _param_groups_signature(self) -> tuple:
+        return tuple(
+            tuple((id(group['params']), len(group['params'])) for group in optimizer.param_groups)
+            for optimizer in self.optimizers
+        )
+
+    def _build(self):
+        params = {id(param): param for param in self._model.parameters()}
+        optimizer_params = []
+        for optimizer in self.optimizers:
+            ids = {id(param) for group in optimizer.param_groups for param in group['params']}
+            for group in optimizer.param_groups:
+                for param in group['params']:
+                    params.setdefault(id(param), param)
+            optimizer_params.append(ids)
+
+        self._signature = self._param_groups_signature()
+        self._params = list(params.values())
+        self._masks = [[id(param) in ids for param in self._params] for ids in optimizer_params]
+        # the parameters to flip from one optimizer to another, by their indices
+        self._flips = {}
+        self._current = None
+
+    def reset(self):
+        """Makes the next :meth:`toggle` set the flags of all parameters instead of only the differences."""
+        self._current = None
+
+    def toggle(self, optimizer_idx: int):
+        if self._param_groups_signature() != self._signature:
+            self._build()
+        if optimizer_idx == self._current:
+            return
+        if self._current is None:
+            flips = list(zip(self._params, self._masks[optimizer_idx]))
+        else:
+            key = (self._current, optimizer_idx)
+            flips = self._flips.get(key)
+            if flips is None:
+                current, target = self._masks[self._current], self._masks[optimizer_idx]
+                flips = [(param, flag) for param, was, flag in zip(self._params, current, target) if was != flag]
+                self._flips[key] = flips
+        for param, flag in flips:
+            param.requires_grad = flag
+        self._current = optimizer_idx
+
+
 class _MockOptimizer(Optimizer):
     """The `_MockOptimizer` will be used inplace of an optimizer in the event that `None`
     is returned from `configure_optimizers`.
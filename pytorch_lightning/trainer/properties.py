@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.checkpoint_store import IncrementalCheckpointStore
 from pytorch_lightning.trainer.connectors.logger_connector import LoggerConnector
 from pytorch_lightning.trainer.states import TrainerState
 from typing import List, Optional, Union, Type, TypeVar
@@ -186,8 +187,10 @@ class TrainerProperties(ABC):
             return os.path.normpath(self._weights_save_path)
         return self._weights_save_path
 
-    def save_checkpoint(self, filepath, weights_only: bool = False):
-        self.checkpoint_connector.save_checkpoint(filepath, weights_only)
+    def save_checkpoint(
+        self, filepath, weights_only: bool = False, store: Optional[IncrementalCheckpointStore] = None
+    ):
+        self.checkpoint_connector.save_checkpoint(filepath, weights_only, store=store)
 
     def get_model(self):
         return self.model_connector.get_model()
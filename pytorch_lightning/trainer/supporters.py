@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import os
-from typing import Optional
+import queue
+import threading
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import fsspec
 import torch
-from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
 from torch import Tensor
+from torch.utils.data import Sampler
 
 
 class TensorRunningAccum(object):
@@ -110,6 +116,318 @@ class Accumulator(object):
         return self.total / self.num_values
 
 
+class TBPTTHiddens(object):
+    """
+    Carries the hidden state of truncated backpropagation through time from one split of a batch to the next.
+
+    The tensors of the hiddens a split returns are detached from its graph in place, once the split did its
+    backward pass, so the next split gets them without new tensors being allocated. Views and leaf tensors, like
+    a learned initial state, are detached out of place instead, as detaching them in place would fail or stop
+    training the leaf.
+
+    Example:
+
+        >>> hiddens = TBPTTHiddens()
+        >>> h = torch.ones(2, requires_grad=True) * 2
+        >>> hiddens.update((h, "any other state"))[0] is h
+        True
+        >>> h.requires_grad
+        False
+    """
+
+    def __init__(self):
+        self.hiddens = None
+
+    def reset(self):
+        self.hiddens = None
+
+    def update(self, hiddens):
+        self.hiddens = apply_to_collection(hiddens, Tensor, self._detach)
+        return self.hiddens
+
+    @staticmethod
+    def _detach(tensor: Tensor) -> Tensor:
+        if not tensor.requires_grad:
+            return tensor
+        if tensor.grad_fn is None or tensor._base is not None:
+            return tensor.detach()
+        return tensor.detach_()
+
+
+class BatchPrefetcher(object):
+    """Iterates over ``iterable`` while a background thread fetches and stages up to ``depth`` batches ahead.
+
+    Staging runs ``transfer_fn`` on each batch and then casts its floating point tensors to ``dtype``, if given.
+    When ``device`` is a CUDA device, the batch is pinned and transferred on a side stream, the consumer only waits
+    for that copy (and cast) right before using the batch. Without a device the batches are just fetched ahead of
+    time, which overlaps data loading with compute.
+
+    The trainer does not pass a ``dtype``: with ``precision=16`` autocast (or apex) casts the inputs of each op.
+
+    Examples:
+        >>> prefetcher = BatchPrefetcher(range(5), depth=2, transfer_fn=lambda batch: batch * 10)
+        >>> list(prefetcher)
+        [0, 10, 20, 30, 40]
+        >>> batch, = BatchPrefetcher([(torch.ones(2), torch.arange(2))], dtype=torch.float16)
+        >>> [tensor.dtype for tensor in batch]
+        [torch.float16, torch.int64]
+    """
+
+    _DONE = object()
+
+    def __init__(
+            self,
+            iterable: Iterable,
+            depth: int = 1,
+            transfer_fn: Optional[Callable[[Any], Any]] = None,
+            device: Optional[torch.device] = None,
+            dtype: Optional[torch.dtype] = None,
+    ):
+        self.iterable = iterable
+        self.depth = max(1, int(depth))
+        self.transfer_fn = transfer_fn
+        self.device = torch.device(device) if device is not None else None
+        self.dtype = dtype
+
+    @property
+    def uses_cuda_stream(self) -> bool:
+        return self.device is not None and self.device.type == 'cuda'
+
+    def __len__(self) -> int:
+        return len(self.iterable)
+
+    def __iter__(self):
+        batches = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        stream = torch.cuda.Stream(self.device) if self.uses_cuda_stream else None
+
+        worker = threading.Thread(target=self._stage_batches, args=(batches, stop, stream), daemon=True)
+        worker.start()
+        try:
+            while True:
+                item, event, error = batches.get()
+                if error is not None:
+                    raise error
+                if item is self._DONE:
+                    return
+                if event is not None:
+                    self._wait_for_transfer(item, event)
+                yield item
+        finally:
+            # the consumer may stop early, e.g. when running on limited batches. Wait for the worker to leave the
+            # iterator, which is not thread-safe and may be reset by the next pass, e.g. with persistent workers
+            stop.set()
+            self._drain(batches)
+            worker.join()
+            self._drain(batches)
+
+    def _stage_batches(self, batches: queue.Queue, stop: threading.Event, stream: Optional[torch.cuda.Stream]):
+        try:
+            for batch in self.iterable:
+                event = None
+                if stream is not None:
+                    with torch.cuda.stream(stream):
+                        batch = apply_to_collection(batch, Tensor, self._pin)
+                        batch = self._transfer(batch)
+                        event = torch.cuda.Event()
+                        event.record(stream)
+                else:
+                    batch = self._transfer(batch)
+
+                if not self._put(batches, stop, (batch, event, None)):
+                    return
+            self._put(batches, stop, (self._DONE, None, None))
+        except Exception as ex:
+            self._put(batches, stop, (None, None, ex))
+
+    def _transfer(self, batch):
+        if self.transfer_fn is not None:
+            batch = self.transfer_fn(batch)
+        if self.dtype is not None:
+            batch = apply_to_collection(batch, Tensor, self._cast)
+        return batch
+
+    def _cast(self, tensor: Tensor) -> Tensor:
+        return tensor.to(self.dtype) if tensor.is_floating_point() else tensor
+
+    def _wait_for_transfer(self, batch, event: torch.cuda.Event):
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_event(event)
+
+        # the memory was allocated on the side stream, don't let it be reused while the step runs
+        def record(tensor):
+            if tensor.is_cuda:
+                tensor.record_stream(current_stream)
+            return tensor
+
+        apply_to_collection(batch, Tensor, record)
+
+    @staticmethod
+    def _pin(tensor: Tensor) -> Tensor:
+        return tensor.pin_memory() if tensor.device.type == 'cpu' and not tensor.is_pinned() else tensor
+
+    @staticmethod
+    def _drain(batches: queue.Queue):
+        while True:
+            try:
+                batches.get_nowait()
+            except queue.Empty:
+                return
+
+    @staticmethod
+    def _put(batches: queue.Queue, stop: threading.Event, item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class PicklableGenerator(torch.Generator):
+    """A CPU generator which is pickled with its state, so the dataloaders holding one can be pickled."""
+
+    def __reduce__(self):
+        return type(self), (), self.get_state()
+
+    def __setstate__(self, state: Tensor):
+        self.set_state(state)
+
+
+# a generator a pass over the training data depends on: whether it is seeded at the start of the pass, and whether
+# only the first pass uses it, like the one the seeds of persistent workers are drawn from
+PassGenerator = namedtuple('PassGenerator', ['generator', 'seed', 'first_pass_only'])
+
+
+class ResumableSampler(Sampler):
+    """
+    Wraps the sampler of the training dataloader, so a pass over it which a checkpoint interrupted can be resumed
+    at the next batch.
+
+    :meth:`start_pass` is called right before the dataloader is iterated. It seeds the generators the order of the
+    samples and the seeds of the workers are drawn from, and keeps their states, which :meth:`state_dict` returns
+    together with the number of batches trained so far. After :meth:`load_state_dict`, the next pass restores those
+    states instead and skips the indices of the batches trained already, so their samples are not loaded again.
+
+    Example:
+
+        >>> from torch.utils.data import RandomSampler
+        >>> generator = PassGenerator(torch.Generator(), seed=True, first_pass_only=False)
+        >>> sampler = ResumableSampler(RandomSampler(range(6), generator=generator.generator), 2, [generator])
+        >>> sampler.start_pass()
+        >>> indices = list(sampler)
+        >>> state = sampler.state_dict(batches_seen=2)
+        >>> sampler.load_state_dict(state)
+        >>> sampler.start_pass()
+        >>> list(sampler) == indices[4:]
+        True
+
+    Args:
+        sampler: The sampler of the dataloader.
+        batch_size: The number of indices in a batch.
+        generators: The generators the passes depend on. Generators the user passed to the dataloader are not
+            seeded, they only need to be restored.
+    """
+
+    def __init__(self, sampler: Sampler, batch_size: int, generators: Iterable[PassGenerator] = ()):
+        self.sampler = sampler
+        self.batch_size = batch_size
+        self.generators = list(generators)
+        self._pass_states = None
+        self._resume_states = None
+        self._skip_batches = 0
+
+    @staticmethod
+    def of(dataloader) -> Optional['ResumableSampler']:
+        """The resumable sampler of ``dataloader``, if it has one."""
+        sampler = getattr(getattr(dataloader, 'batch_sampler', None), 'sampler', None)
+        return sampler if isinstance(sampler, ResumableSampler) else None
+
+    def start_pass(self):
+        first_pass = self._pass_states is None
+        states = list(self._pass_states or [None] * len(self.generators))
+        for i, (generator, seed, first_pass_only) in enumerate(self.generators):
+            if first_pass_only and not first_pass:
+                continue
+            if self._resume_states is not None:
+                generator.set_state(self._resume_states[i])
+            elif seed:
+                # drawn from the global generator, so the passes follow `seed_everything`
+                generator.manual_seed(int(torch.empty((), dtype=torch.int64).random_().item()))
+            states[i] = generator.get_state()
+        self._pass_states = states
+        self._resume_states = None
+
+    def __iter__(self):
+        skip, self._skip_batches = self._skip_batches, 0
+        return itertools.islice(iter(self.sampler), skip * self.batch_size, None)
+
+    def __len__(self) -> int:
+        return len(self.sampler)
+
+    def state_dict(self, batches_seen: int) -> Dict[str, Any]:
+        return {'generator_states': list(self._pass_states or []), 'batches_seen': batches_seen}
+
+    def load_state_dict(self, state_dict: Dict[str, Any]):
+        states: List[Tensor] = state_dict['generator_states']
+        if len(states) != len(self.generators):
+            raise ValueError(
+                f'The checkpoint holds the states of {len(states)} dataloader generators,'
+                f' but the training dataloader depends on {len(self.generators)}.'
+            )
+        self._resume_states = states
+        self._skip_batches = state_dict['batches_seen']
+
+
+class CheckpointSnapshot(object):
+    """
+    Keeps a copy of a checkpoint in CPU memory, which can be written right away when the job is preempted.
+
+    :meth:`refresh` copies the tensors of a checkpoint into buffers which the next refresh reuses. Tensors on a GPU
+    are copied asynchronously into pinned buffers, :meth:`save` waits for the copies before writing.
+
+    Example:
+
+        >>> import io
+        >>> snapshot = CheckpointSnapshot()
+        >>> weight = torch.zeros(2)
+        >>> snapshot.refresh({'state_dict': {'weight': weight}, 'global_step': 1})
+        >>> _ = weight.add_(1)  # training goes on, the snapshot is not affected
+        >>> snapshot.checkpoint
+        {'state_dict': {'weight': tensor([0., 0.])}, 'global_step': 1}
+    """
+
+    def __init__(self):
+        self.checkpoint = None
+        self._buffers = []
+        self._copied = None
+
+    def refresh(self, checkpoint: Dict[str, Any]):
+        buffers = []
+
+        def copy(tensor: Tensor) -> Tensor:
+            index = len(buffers)
+            buffer = self._buffers[index] if index < len(self._buffers) else None
+            if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+                buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda)
+            buffer.copy_(tensor.detach(), non_blocking=tensor.is_cuda)
+            buffers.append(buffer)
+            return buffer
+
+        self.checkpoint = apply_to_collection(checkpoint, Tensor, copy)
+        self._buffers = buffers
+        self._copied = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            self._copied = torch.cuda.Event()
+            self._copied.record()
+
+    def save(self, filepath: str):
+        if self._copied is not None:
+            self._copied.synchronize()
+        atomic_save(self.checkpoint, filepath)
+
+
 class PredictionCollection(object):
     def __init__(self, global_rank: int, world_size: int):
         self.global_rank = global_rank
@@ -67,11 +67,6 @@ warnings.filterwarnings(
 )
 os.environ['PYTHONWARNINGS'] = 'ignore:semaphore_tracker:UserWarning'
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 
 class Trainer(
     TrainerProperties,
@@ -127,7 +122,8 @@ class Trainer(
         reload_dataloaders_every_epoch: bool = False,
         auto_lr_find: Union[bool, str] = False,
         replace_sampler_ddp: bool = True,
-        terminate_on_nan: bool = False,
+        terminate_on_nan: Union[bool, int] = False,
+        toggle_optimizers: bool = True,
         auto_scale_batch_size: Union[str, bool] = False,
         prepare_data_per_node: bool = True,
         plugins: Optional[list] = None,
@@ -135,6 +131,12 @@ class Trainer(
         amp_level: str = 'O2',
         distributed_backend: Optional[str] = None,
         automatic_optimization: bool = True,
+        prefetch_batches: int = 0,
+        persistent_workers: bool = False,
+        flush_logs_every_n_seconds: Optional[float] = None,
+        preemption_snapshot_every_n_steps: int = 0,
+        preemption_scratch_dir: Optional[str] = None,
+        preemption_save_timeout: float = 30.0,
     ):
         r"""
         Customize every aspect of training via flags
@@ -186,6 +188,8 @@ class Trainer(
 
             flush_logs_every_n_steps: How often to flush logs to disk (defaults to every 100 steps).
 
+            flush_logs_every_n_seconds: Also flush logs to disk when this many seconds passed since the last flush.
+
             gpus: number of gpus to train on (int) or which GPUs to train on (list or str) applied per node
 
             gradient_clip_val: 0 means don't clip.
@@ -205,6 +209,23 @@ class Trainer(
             automatic_optimization: If False you are responsible for calling .backward, .step, zero_grad.
                 Meant to be used with multiple optimizers by advanced users.
 
+            prefetch_batches: How many batches to fetch and move to the device in a background thread while the
+                current step runs. Default: 0 (no prefetching).
+
+            persistent_workers: Keep the worker processes of multi-process train and val dataloaders alive between
+                epochs and validation runs. The workers keep the copy of the dataset they started with, so changes
+                made to it between epochs are not seen. Default: False.
+
+            preemption_snapshot_every_n_steps: On SLURM, keep a copy of the training state in CPU memory, refreshed
+                every n steps, which is saved when the job is preempted. Default: 0 (the checkpoint is dumped
+                when the job is preempted).
+
+            preemption_scratch_dir: Where the preemption snapshot is written first, it is copied to the
+                ``weights_save_path`` in the background. Default: ``None`` (written to ``weights_save_path``).
+
+            preemption_save_timeout: How many seconds the preemption signal handler waits at most for the
+                snapshot to be written.
+
             prepare_data_per_node: If True, each LOCAL_RANK=0 will call prepare data.
                 Otherwise only NODE_RANK=0, LOCAL_RANK=0 will prepare data
 
@@ -248,6 +269,12 @@ class Trainer(
 
             terminate_on_nan: If set to True, will terminate training (by raising a `ValueError`) at the
                 end of each training batch, if any of the parameters or the loss are NaN or +/-inf.
+                An int checks every that many steps.
+
+            toggle_optimizers: With several optimizers, only compute the gradients of the parameters of the
+                optimizer the training step runs for, see
+                :meth:`~pytorch_lightning.core.lightning.LightningModule.toggle_optimizer`. Set to ``False`` when
+                the loss of each optimizer only depends on the parameters it trains.
 
             tpu_cores: How many TPU cores to train on (1 or 8) / Single TPU to train on [1]
 
@@ -311,12 +338,21 @@ class Trainer(
         # hook
         self.on_init_start()
 
+        # init preemption snapshot flags
+        self.checkpoint_connector.on_trainer_init(
+            preemption_snapshot_every_n_steps, preemption_scratch_dir, preemption_save_timeout
+        )
+
         # init optimizer + lr scheduler related flags
-        self.optimizer_connector.on_trainer_init()
+        self.optimizer_connector.on_trainer_init(toggle_optimizers)
 
         # init data flags
         self.data_connector.on_trainer_init(
-            check_val_every_n_epoch, reload_dataloaders_every_epoch, prepare_data_per_node
+            check_val_every_n_epoch,
+            reload_dataloaders_every_epoch,
+            prepare_data_per_node,
+            prefetch_batches,
+            persistent_workers,
         )
 
         # init training tricks
@@ -358,7 +394,9 @@ class Trainer(
         self.profile_connector.on_trainer_init(profiler)
 
         # init logger flags
-        self.logger_connector.on_trainer_init(logger, flush_logs_every_n_steps, log_every_n_steps)
+        self.logger_connector.on_trainer_init(
+            logger, flush_logs_every_n_steps, log_every_n_steps, flush_logs_every_n_seconds
+        )
 
         # init debugging flags
         self.debugging_connector.on_init_start(
@@ -495,6 +533,7 @@ class Trainer(
                 met_min_epochs = epoch >= self.min_epochs - 1
                 met_min_steps = self.global_step >= self.min_steps if self.min_steps else True
 
+                self.accelerator_backend.update_should_stop()
                 if self.should_stop:
                     if met_min_epochs and met_min_steps:
                         self.train_loop.on_train_end()
@@ -553,7 +592,9 @@ class Trainer(
             dataloader = self.accelerator_backend.process_dataloader(dataloader)
             dl_max_batches = self.evaluation_loop.max_batches[dataloader_idx]
 
-            for batch_idx, batch in enumerate(dataloader):
+            dataloader_iter = self.data_connector.get_eval_iterator(dataloader)
+
+            for batch_idx, batch in enumerate(dataloader_iter):
                 if batch is None:
                     continue
 
@@ -590,6 +631,10 @@ class Trainer(
             self.evaluation_loop.outputs.append(dl_outputs)
             self.evaluation_loop.step_metrics.append(dl_step_metrics)
 
+            # warm up the next validation run while training continues
+            if not test_mode:
+                self.data_connector.prefetch_eval_iterator(dataloader)
+
         # lightning module method
         deprecated_eval_results, epoch_logs = self.evaluation_loop.evaluation_epoch_end(
             num_dataloaders=len(dataloaders)
@@ -616,6 +661,9 @@ class Trainer(
         # self.reset_test_dataloader(ref_model)
         eval_loop_results, _ = self.run_evaluation(test_mode=True)
 
+        # write out the logged test metrics
+        self.logger_connector.flush_logs(force=True)
+
         if len(eval_loop_results) == 0:
             return 1
 
@@ -14,6 +14,7 @@
 
 import subprocess
 from copy import copy, deepcopy
+from typing import Any, Dict, Optional
 
 import numpy as np
 import torch
@@ -22,9 +23,10 @@ import torch.distributed as torch_distrib
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.core.memory import ModelSummary
-from pytorch_lightning.core.step_result import EvalResult, Result
+from pytorch_lightning.core.step_result import EvalResult, Result, RunningTimeReduction
+from pytorch_lightning.trainer.optimizers import OptimizerToggle
 from pytorch_lightning.trainer.states import TrainerState
-from pytorch_lightning.trainer.supporters import TensorRunningAccum, Accumulator
+from pytorch_lightning.trainer.supporters import TensorRunningAccum, Accumulator, ResumableSampler, TBPTTHiddens
 from pytorch_lightning.utilities import parsing, AMPType
 from pytorch_lightning.utilities.distributed import rank_zero_info, rank_zero_warn
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -45,6 +47,11 @@ class TrainLoop:
         self._teardown_already_run = False
         self.running_loss = TensorRunningAccum(window_length=20)
         self.automatic_optimization = True
+        self._optimizer_toggle = None
+        self.tbptt_hiddens = TBPTTHiddens()
+        # the batches of the current epoch trained so far, and the state of an epoch to resume
+        self.epoch_batches_seen = 0
+        self._resume_dataloader_state = None
 
     def on_trainer_init(self, max_epochs, min_epochs, max_steps, min_steps, num_sanity_val_steps, automatic_optimization):
         self.trainer.global_step = 0
@@ -82,6 +89,12 @@ class TrainLoop:
             with torch.cuda.device(f'cuda:{self.trainer.root_gpu}'):
                 torch.cuda.empty_cache()
 
+        # which parameters each optimizer trains, unless the model toggles them itself
+        model = self.trainer.get_model()
+        self._optimizer_toggle = None
+        if len(self.trainer.optimizers) > 1 and not is_overridden('toggle_optimizer', model):
+            self._optimizer_toggle = OptimizerToggle(model, self.trainer.optimizers)
+
         # hook
         self.trainer.call_hook('on_train_start')
 
@@ -172,6 +185,9 @@ class TrainLoop:
 
         self._teardown_already_run = True
 
+        # wait for early stopping decisions still reduced in the background
+        self.trainer.accelerator_backend.update_should_stop()
+
         # trigger checkpoint check. need to temporarily decrease the global step to avoid saving duplicates
         # when a checkpoint was saved at the last step
         self.trainer.global_step -= 1
@@ -192,6 +208,9 @@ class TrainLoop:
         # give accelerators a chance to finish
         self.trainer.accelerator_backend.on_train_end()
 
+        # drop the batches prefetched for a validation run that won't happen anymore
+        self.trainer.data_connector.reset_eval_iterators()
+
         # clear mem
         if self.trainer.on_gpu:
             model = self.trainer.get_model()
@@ -403,7 +422,8 @@ class TrainLoop:
 
         # map to results under the hood
         result.minimize = loss
-        result.hiddens = hiddens
+        # keep the graph of the hiddens, they are detached in place once the backward pass is done
+        result['hiddens'] = hiddens
 
         # track batch for manual reduction with result
         result.track_batch_size(len(split_batch))
@@ -507,14 +527,16 @@ class TrainLoop:
         hiddens = opt_closure_result.hiddens
         if isinstance(opt_closure_result.training_step_output, Result):
             opt_closure_result.training_step_output_for_epoch_end.drop_hiddens()
-        return hiddens
+        return self.tbptt_hiddens.update(hiddens)
 
     def tbptt_split_batch(self, batch):
         splits = [batch]
         if self.trainer.truncated_bptt_steps is not None:
             model_ref = self.trainer.get_model()
-            with self.trainer.profiler.profile('tbptt_split_batch'):
-                splits = model_ref.tbptt_split_batch(batch, self.trainer.truncated_bptt_steps)
+            # the splits are made lazily, so profile taking each of them rather than the call
+            splits = self.trainer.profiler.profile_iterable(
+                model_ref.tbptt_split_batch(batch, self.trainer.truncated_bptt_steps), 'tbptt_split_batch'
+            )
         return splits
 
     def run_training_epoch(self):
@@ -529,7 +551,8 @@ class TrainLoop:
         epoch_output = [[] for _ in range(self.num_optimizers)]
 
         # enable profiling for the dataloader
-        train_dataloader = self.trainer.data_connector.get_profiled_train_dataloader(train_dataloader)
+        first_batch_idx = self.start_train_dataloader_pass()
+        train_dataloader = self.trainer.data_connector.get_profiled_train_dataloader(train_dataloader, first_batch_idx)
         dataloader_idx = 0
         should_check_val = False
         for batch_idx, (batch, is_last_batch) in train_dataloader:
@@ -543,6 +566,7 @@ class TrainLoop:
             # when returning -1 from train_step, we end epoch early
             if batch_output.signal == -1:
                 break
+            self.epoch_batches_seen = batch_idx + 1
 
             # only track outputs when user implements training_epoch_end
             # otherwise we will build up unnecessary memory
@@ -578,13 +602,17 @@ class TrainLoop:
             monitor_metrics.update(batch_output.batch_log_metrics)
             self.update_train_loop_lr_schedulers(monitor_metrics=monitor_metrics)
 
+            # keep the training state ready to be saved when the job is preempted
+            self.trainer.checkpoint_connector.refresh_snapshot()
+
             # max steps reached, end training
             if self.trainer.max_steps is not None and self.trainer.max_steps == self.trainer.global_step + 1:
                 break
 
             # end epoch early
             # stop when the flag is changed or we've gone past the amount
-            # requested in the batches
+            # requested in the batches, early stopping decisions of all processes apply one step later
+            self.trainer.accelerator_backend.update_should_stop(before_step=self.trainer.total_batch_idx)
             if self.trainer.should_stop:
                 break
 
@@ -597,6 +625,8 @@ class TrainLoop:
             # progress global step according to grads progress
             self.increment_accumulated_grad_global_step()
 
+        self.epoch_batches_seen = 0
+
         # log epoch metrics
         self.trainer.logger_connector.log_train_epoch_end_metrics(
             epoch_output,
@@ -618,6 +648,36 @@ class TrainLoop:
         # progress global step according to grads progress
         self.increment_accumulated_grad_global_step()
 
+    def start_train_dataloader_pass(self) -> int:
+        """
+        Prepares the pass of the epoch over the training dataloader, which resumes the interrupted epoch of a restored
+        checkpoint at its next batch.
+
+        Return:
+            the index of the first batch of the pass
+        """
+        state, self._resume_dataloader_state = self._resume_dataloader_state, None
+        sampler = ResumableSampler.of(self.trainer.train_dataloader)
+        self.epoch_batches_seen = 0
+        if sampler is None:
+            return 0
+        if state is not None and state['epoch'] == self.trainer.current_epoch:
+            sampler.load_state_dict(state['sampler'])
+            self.epoch_batches_seen = state['sampler']['batches_seen']
+        sampler.start_pass()
+        return self.epoch_batches_seen
+
+    def train_dataloader_state_dict(self) -> Optional[Dict[str, Any]]:
+        """The state to resume the current epoch with, ``None`` unless it was interrupted after some batches."""
+        sampler = ResumableSampler.of(self.trainer.train_dataloader)
+        if sampler is None or not 0 < self.epoch_batches_seen < self.trainer.num_training_batches:
+            return None
+        return {'epoch': self.trainer.current_epoch, 'sampler': sampler.state_dict(self.epoch_batches_seen)}
+
+    def load_train_dataloader_state_dict(self, state_dict: Dict[str, Any]):
+        """Resumes the epoch of ``state_dict`` at its next batch, when the training starts."""
+        self._resume_dataloader_state = state_dict
+
     def run_training_batch(self, batch, batch_idx, dataloader_idx):
         # track grad norms
         grad_norm_dic = {}
@@ -630,11 +690,19 @@ class TrainLoop:
 
         # bookkeeping
         using_results_obj = False
+        self.tbptt_hiddens.reset()
         self.trainer.hiddens = None
 
         # track all outputs across time and num of optimizers
         batch_outputs = [[] for _ in range(len(self.get_optimizers_iterable()))]
 
+        # without training_epoch_end the results of the TBPTT splits are only reduced across time, fold them as
+        # they come instead of keeping them all until the end of the epoch
+        time_reductions = None
+        model = self.trainer.get_model()
+        if self.trainer.truncated_bptt_steps is not None and not is_overridden('training_epoch_end', model=model):
+            time_reductions = [RunningTimeReduction() for _ in batch_outputs]
+
         if batch is None:
             return AttributeDict(signal=0, grad_norm_dic=grad_norm_dic)
 
@@ -663,9 +731,16 @@ class TrainLoop:
             for opt_idx, optimizer in optimizers:
                 # make sure only the gradients of the current optimizer's parameters are calculated
                 # in the training step to prevent dangling gradients in multiple-optimizer setup.
-                if self.automatic_optimization and len(self.trainer.optimizers) > 1:
-                    model = self.trainer.get_model()
-                    model.toggle_optimizer(optimizer, opt_idx)
+                if self.automatic_optimization and len(self.trainer.optimizers) > 1 and self.trainer.toggle_optimizers:
+                    if self._optimizer_toggle is not None:
+                        # the optimizers may have been replaced, e.g. by a callback calling `init_optimizers`
+                        if self._optimizer_toggle.optimizers is not self.trainer.optimizers:
+                            model = self.trainer.get_model()
+                            self._optimizer_toggle = OptimizerToggle(model, self.trainer.optimizers)
+                        self._optimizer_toggle.toggle(opt_idx)
+                    else:
+                        model = self.trainer.get_model()
+                        model.toggle_optimizer(optimizer, opt_idx)
 
                 # -------------------
                 # calculate loss (train step + train step end)
@@ -690,12 +765,17 @@ class TrainLoop:
                 self.trainer.hiddens = self.process_hiddens(opt_closure_result)
 
                 # check if loss or model weights are nan
-                if self.trainer.terminate_on_nan:
+                terminate_on_nan = int(self.trainer.terminate_on_nan)
+                if terminate_on_nan and self.trainer.global_step % terminate_on_nan == 0:
                     self.trainer.detect_nan_tensors(opt_closure_result.loss)
 
                 # track all the outputs across all steps
                 batch_opt_idx = opt_idx if len(batch_outputs) > 1 else 0
-                batch_outputs[batch_opt_idx].append(opt_closure_result.training_step_output_for_epoch_end)
+                training_step_output_for_epoch_end = opt_closure_result.training_step_output_for_epoch_end
+                if time_reductions is not None and isinstance(training_step_output_for_epoch_end, Result):
+                    time_reductions[batch_opt_idx].update(training_step_output_for_epoch_end)
+                else:
+                    batch_outputs[batch_opt_idx].append(training_step_output_for_epoch_end)
 
                 if not self.automatic_optimization:
                     continue
@@ -735,6 +815,12 @@ class TrainLoop:
                     # reset for next set of accumulated grads
                     self.accumulated_loss.reset()
 
+        # a result reduced across time replaces the list of the results of the splits
+        if time_reductions is not None:
+            for opt_idx, reduction in enumerate(time_reductions):
+                if reduction.num_splits > 0:
+                    batch_outputs[opt_idx] = reduction.compute()
+
         # collapse all metrics into one dict
         batch_log_metrics = {k: v for d in batch_log_metrics for k, v in d.items()}
 
@@ -841,12 +927,7 @@ class TrainLoop:
 
     def save_loggers_on_train_batch_end(self):
         # when loggers should save to disk
-        should_save_log = (
-            (self.trainer.global_step + 1) % self.trainer.flush_logs_every_n_steps == 0 or self.trainer.should_stop
-        )
-        if should_save_log or self.trainer.fast_dev_run:
-            if self.trainer.is_global_zero and self.trainer.logger is not None:
-                self.trainer.logger.save()
+        self.trainer.logger_connector.flush_logs(force=self.trainer.should_stop or self.trainer.fast_dev_run)
 
     def process_train_step_outputs(self, all_train_step_outputs, early_stopping_accumulator, checkpoint_accumulator):
         """
@@ -862,7 +943,9 @@ class TrainLoop:
             if len(optimizer_idx_outputs) == 0:
                 continue
 
-            sample_output = optimizer_idx_outputs[-1]
+            sample_output = optimizer_idx_outputs
+            if isinstance(optimizer_idx_outputs, list):
+                sample_output = optimizer_idx_outputs[-1]
 
             # pull out callback info if available (ie: Results object)
             if isinstance(sample_output, dict) and 'early_stop_on' in sample_output:
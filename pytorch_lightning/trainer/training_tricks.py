@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 import torch
 from torch import Tensor
@@ -21,15 +23,27 @@ from pytorch_lightning import _logger as log
 from pytorch_lightning.callbacks import GradientAccumulationScheduler
 from pytorch_lightning.core.lightning import LightningModule
 
-try:
-    from apex import amp
-except ImportError:
-    amp = None
-
 EPSILON = 1e-6
 EPSILON_FP16 = 1e-5
 
 
+def _all_finite(tensors: Iterable[Tensor]) -> bool:
+    """Whether all ``tensors`` are finite, reduced to one flag per device and dtype before reading them."""
+    groups = {}
+    for tensor in tensors:
+        if tensor.is_floating_point() and tensor.numel():
+            groups.setdefault((tensor.device, tensor.dtype), []).append(tensor.detach())
+    flags = []
+    for group in groups.values():
+        # the infinity norm is the largest magnitude, it is finite unless an element is nan or inf
+        if hasattr(torch, '_foreach_norm'):
+            maxima = torch.stack(torch._foreach_norm(group, math.inf))
+        else:
+            maxima = torch.stack([tensor.abs().max() for tensor in group])
+        flags.append(torch.isfinite(maxima).all())
+    return all(bool(flag) for flag in flags)
+
+
 class TrainerTrainingTricksMixin(ABC):
 
     # this is just a summary on variables used in this abstract class,
@@ -51,6 +65,10 @@ class TrainerTrainingTricksMixin(ABC):
     def detect_nan_tensors(self, loss: Tensor) -> None:
         model = self.get_model()
 
+        # check the loss and all weights at once, the tensors are only scanned to name the non-finite one
+        if _all_finite([loss, *model.parameters()]):
+            return
+
         # check if loss is nan
         if not torch.isfinite(loss).all():
             raise ValueError(
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """General utilities"""
+import importlib
 from enum import Enum
 
 import numpy
@@ -21,12 +22,27 @@ from pytorch_lightning.utilities.apply_func import move_data_to_device
 from pytorch_lightning.utilities.distributed import rank_zero_only, rank_zero_warn, rank_zero_info
 from pytorch_lightning.utilities.parsing import AttributeDict, flatten_dict, is_picklable
 
-try:
-    from apex import amp
-except ImportError:
-    APEX_AVAILABLE = False
-else:
-    APEX_AVAILABLE = True
+
+def _module_available(module_path: str) -> bool:
+    """
+    Checks if a module can be imported, without importing it.
+
+    >>> _module_available('os')
+    True
+    >>> _module_available('bla.bla')
+    False
+    """
+    # finding a submodule imports its parents, only do so when the package is installed
+    if importlib.util.find_spec(module_path.split('.')[0]) is None:
+        return False
+    try:
+        return importlib.util.find_spec(module_path) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+APEX_AVAILABLE = _module_available("apex")
+HOROVOD_AVAILABLE = _module_available("horovod.torch")
 
 NATIVE_AMP_AVALAIBLE = hasattr(torch.cuda, "amp") and hasattr(torch.cuda.amp, "autocast")
 
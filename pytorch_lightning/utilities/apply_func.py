@@ -13,18 +13,60 @@
 # limitations under the License.
 
 import importlib
+import sys
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from copy import copy
-from typing import Any, Callable, Union
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 import torch
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
 
 TORCHTEXT_AVAILABLE = importlib.util.find_spec("torchtext") is not None
-if TORCHTEXT_AVAILABLE:
-    from torchtext.data import Batch
-else:
-    Batch = type(None)
+
+
+def _torchtext_batch_type() -> Optional[type]:
+    # a torchtext batch can only exist once its module was imported, so torchtext is never imported here
+    module = sys.modules.get("torchtext.data")
+    return getattr(module, "Batch", None)
+
+
+# tensors up to this size are batched into a single host-to-device copy
+_COALESCE_MAX_BYTES = 1 << 20
+
+# the decisions per type are cached, bound the cache in case types get created dynamically
+_KIND_CACHE_SIZE = 1024
+
+# the rebuild functions of the most recently flattened structures, e.g. the batches of each dataloader
+_SPEC_CACHE_SIZE = 64
+_SPEC_CACHE = OrderedDict()
+
+_LEAF, _MAPPING, _NAMEDTUPLE, _SEQUENCE, _OTHER = range(5)
+
+
+@lru_cache(maxsize=_KIND_CACHE_SIZE)
+def _collection_kind(elem_type: type, dtype: Union[type, tuple]) -> int:
+    """Decides how :func:`apply_to_collection` treats elements of ``elem_type``, cached per distinct type
+    so that the ABC ``isinstance`` checks and the named tuple detection only run once."""
+    if issubclass(elem_type, dtype):
+        return _LEAF
+    if issubclass(elem_type, Mapping):
+        return _MAPPING
+    if issubclass(elem_type, tuple) and hasattr(elem_type, '_fields'):
+        return _NAMEDTUPLE
+    if issubclass(elem_type, Sequence) and not issubclass(elem_type, str):
+        return _SEQUENCE
+    return _OTHER
+
+
+def _kind_of(data: Any, dtype: Union[type, tuple]) -> int:
+    try:
+        return _collection_kind(data.__class__, dtype)
+    except TypeError:
+        # unhashable `dtype` (e.g. a list of types), fall back to the uncached checks
+        return _collection_kind.__wrapped__(data.__class__, dtype)
 
 
 def apply_to_collection(data: Any, dtype: Union[type, tuple], function: Callable, *args, **kwargs) -> Any:
@@ -43,24 +85,102 @@ def apply_to_collection(data: Any, dtype: Union[type, tuple], function: Callable
 
     """
     elem_type = type(data)
+    kind = _kind_of(data, dtype)
 
     # Breaking condition
-    if isinstance(data, dtype):
+    if kind == _LEAF:
         return function(data, *args, **kwargs)
 
     # Recursively apply to collection items
-    elif isinstance(data, Mapping):
+    elif kind == _MAPPING:
         return elem_type({k: apply_to_collection(v, dtype, function, *args, **kwargs)
                           for k, v in data.items()})
-    elif isinstance(data, tuple) and hasattr(data, '_fields'):  # named tuple
+    elif kind == _NAMEDTUPLE:
         return elem_type(*(apply_to_collection(d, dtype, function, *args, **kwargs) for d in data))
-    elif isinstance(data, Sequence) and not isinstance(data, str):
+    elif kind == _SEQUENCE:
         return elem_type([apply_to_collection(d, dtype, function, *args, **kwargs) for d in data])
 
     # data is neither of dtype, nor a collection
     return data
 
 
+def flatten_collection(data: Any, dtype: Union[type, tuple]) -> Tuple[List[Any], Any]:
+    """
+    Flattens a collection into the list of its elements of a certain dtype and a spec of its structure.
+
+    The function which rebuilds a collection from its leaves is made once per distinct structure (the types,
+    keys and lengths of its containers) and cached, so collections of the same structure, like the batches of
+    a dataloader, share it.
+
+    Example:
+
+        >>> leaves, spec = flatten_collection({'a': 1, 'b': [2, 'c']}, int)
+        >>> leaves
+        [1, 2]
+        >>> unflatten_collection([x * 10 for x in leaves], spec)
+        {'a': 10, 'b': [20, 'c']}
+    """
+    leaves, others = [], []
+    structure = _flatten(data, dtype, leaves, others)
+    return leaves, (_rebuild_fn(structure), others)
+
+
+def unflatten_collection(leaves: List[Any], spec: Any) -> Any:
+    """Rebuilds a collection flattened by :func:`flatten_collection` from (new) leaves."""
+    rebuild, others = spec
+    return rebuild(iter(leaves), iter(others))
+
+
+def _flatten(data: Any, dtype: Union[type, tuple], leaves: List[Any], others: List[Any]) -> Any:
+    """Collects the leaves and the other elements of ``data`` and returns its (hashable) structure."""
+    kind = _kind_of(data, dtype)
+    if kind == _LEAF:
+        leaves.append(data)
+        return _LEAF
+    if kind == _MAPPING:
+        keys, children = [], []
+        for k, v in data.items():
+            keys.append(k)
+            children.append(_flatten(v, dtype, leaves, others))
+        return kind, type(data), tuple(keys), tuple(children)
+    if kind in (_NAMEDTUPLE, _SEQUENCE):
+        return kind, type(data), tuple(_flatten(d, dtype, leaves, others) for d in data)
+    others.append(data)
+    return _OTHER
+
+
+def _rebuild_fn(structure: Any) -> Callable:
+    try:
+        rebuild = _SPEC_CACHE.get(structure)
+    except TypeError:
+        # e.g. a mapping with unhashable keys
+        return _compile_rebuild(structure)
+    if rebuild is not None:
+        _SPEC_CACHE.move_to_end(structure)
+        return rebuild
+    rebuild = _SPEC_CACHE[structure] = _compile_rebuild(structure)
+    if len(_SPEC_CACHE) > _SPEC_CACHE_SIZE:
+        _SPEC_CACHE.popitem(last=False)
+    return rebuild
+
+
+def _compile_rebuild(structure: Any) -> Callable:
+    """Makes the function which rebuilds a collection of ``structure`` from iterators of its leaves and others."""
+    if structure == _LEAF:
+        return lambda leaves, others: next(leaves)
+    if structure == _OTHER:
+        return lambda leaves, others: next(others)
+
+    kind, elem_type = structure[:2]
+    if kind == _MAPPING:
+        keys, builders = structure[2], [_compile_rebuild(child) for child in structure[3]]
+        return lambda leaves, others: elem_type({k: build(leaves, others) for k, build in zip(keys, builders)})
+    builders = [_compile_rebuild(child) for child in structure[2]]
+    if kind == _NAMEDTUPLE:
+        return lambda leaves, others: elem_type(*[build(leaves, others) for build in builders])
+    return lambda leaves, others: elem_type([build(leaves, others) for build in builders])
+
+
 class TransferableDataType(ABC):
     """
     A custom type for data that can be moved to a torch device via `.to(...)`.
@@ -107,9 +227,11 @@ def move_data_to_device(batch: Any, device: torch.device):
         - :class:`torch.device`
     """
 
+    torchtext_batch = _torchtext_batch_type()
+
     def batch_to(data):
         # try to move torchtext data first
-        if TORCHTEXT_AVAILABLE and isinstance(data, Batch):
+        if torchtext_batch is not None and isinstance(data, torchtext_batch):
 
             # Shallow copy because each Batch has a reference to Dataset which contains all examples
             device_data = copy(data)
@@ -121,5 +243,38 @@ def move_data_to_device(batch: Any, device: torch.device):
         kwargs = dict(non_blocking=True) if isinstance(data, torch.Tensor) else {}
         return data.to(device, **kwargs)
 
-    dtype = (TransferableDataType, Batch) if TORCHTEXT_AVAILABLE else TransferableDataType
-    return apply_to_collection(batch, dtype=dtype, function=batch_to)
+    dtype = (TransferableDataType, torchtext_batch) if torchtext_batch is not None else TransferableDataType
+    leaves, spec = flatten_collection(batch, dtype)
+    moved = [None] * len(leaves)
+
+    # small host tensors are copied to the GPU together in one flat buffer per dtype
+    groups = {}
+    to_cuda = torch.device(device).type == 'cuda'
+    for i, leaf in enumerate(leaves):
+        if to_cuda and _is_coalescable(leaf):
+            groups.setdefault(leaf.dtype, []).append(i)
+        else:
+            moved[i] = batch_to(leaf)
+
+    for indices in groups.values():
+        if len(indices) == 1:
+            moved[indices[0]] = batch_to(leaves[indices[0]])
+            continue
+        tensors = [leaves[i] for i in indices]
+        flat = _flatten_dense_tensors(tensors).to(device, non_blocking=True)
+        for i, tensor in zip(indices, _unflatten_dense_tensors(flat, tensors)):
+            moved[i] = tensor
+
+    return unflatten_collection(moved, spec)
+
+
+def _is_coalescable(data: Any) -> bool:
+    return (
+        isinstance(data, torch.Tensor)
+        and data.device.type == 'cpu'
+        and data.layout == torch.strided
+        and not data.requires_grad
+        # a pinned tensor is copied asynchronously by itself, the flat buffer would be pageable memory
+        and not data.is_pinned()
+        and data.numel() * data.element_size() <= _COALESCE_MAX_BYTES
+    )
@@ -0,0 +1,230 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import io
+import os
+import pickle
+from typing import Any, Dict, Set
+
+import numpy as np
+import torch
+
+from pytorch_lightning import _logger as log
+from pytorch_lightning.utilities.cloud_io import get_filesystem
+
+MANIFEST_MAGIC = b"PL_INCREMENTAL_CHECKPOINT\n"
+
+
+# the dtypes of the tensors stored by their bytes, the others are pickled into the manifest
+_NUMPY_DTYPES = {
+    torch.bool: np.bool_,
+    torch.uint8: np.uint8,
+    torch.int8: np.int8,
+    torch.int16: np.int16,
+    torch.int32: np.int32,
+    torch.int64: np.int64,
+    torch.float16: np.float16,
+    torch.float32: np.float32,
+    torch.float64: np.float64,
+    torch.complex64: np.complex64,
+    torch.complex128: np.complex128,
+}
+
+
+def _tensor_bytes(tensor: torch.Tensor) -> np.ndarray:
+    """The raw data of ``tensor`` as a flat numpy array of bytes, which can be hashed and written without a copy."""
+    return tensor.detach().cpu().contiguous().numpy().reshape(-1).view(np.uint8)
+
+
+def _tensor_from_bytes(data: bytes, dtype: torch.dtype, shape) -> torch.Tensor:
+    # copy, so the tensor owns writable memory
+    return torch.from_numpy(np.frombuffer(data, dtype=_NUMPY_DTYPES[dtype]).copy()).reshape(shape)
+
+
+def _map_location(tensor: torch.Tensor, location: str, map_location) -> torch.Tensor:
+    """Moves a loaded tensor like :func:`torch.load` moves the storages of the tensors it loads."""
+    if map_location is None:
+        return tensor.to(location)
+    if callable(map_location):
+        return map_location(tensor, location)
+    if isinstance(map_location, dict):
+        return tensor.to(map_location.get(location, location))
+    return tensor.to(map_location)
+
+
+class _ManifestPickler(pickle.Pickler):
+    """Pickles a checkpoint with its tensors by reference, the large ones by the digest of their data."""
+
+    def __init__(self, file, store: 'IncrementalCheckpointStore'):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.store = store
+        self.digests = set()
+
+    def persistent_id(self, obj):
+        if type(obj) not in (torch.Tensor, torch.nn.Parameter) or obj.layout != torch.strided or obj.is_quantized:
+            return None
+        if obj.dtype not in _NUMPY_DTYPES:
+            return None
+        data = _tensor_bytes(obj)
+        meta = (obj.dtype, tuple(obj.shape), str(obj.device), type(obj) is torch.nn.Parameter, obj.requires_grad)
+        if data.nbytes < self.store.min_blob_bytes:
+            return ('inline', data.tobytes()) + meta
+        digest = self.store.put(data)
+        self.digests.add(digest)
+        return ('blob', digest) + meta
+
+
+class _ManifestUnpickler(pickle.Unpickler):
+    """Unpickles a checkpoint pickled by :class:`_ManifestPickler`, reading its tensors from the blobs."""
+
+    def __init__(self, file, blob_dir: str, map_location=None):
+        super().__init__(file)
+        self.fs = get_filesystem(blob_dir)
+        self.blob_dir = blob_dir
+        self.map_location = map_location
+
+    def persistent_load(self, pid):
+        kind, data, dtype, shape, location, is_parameter, requires_grad = pid
+        if kind == 'blob':
+            with self.fs.open(os.path.join(self.blob_dir, data), "rb") as f:
+                data = f.read()
+        tensor = _map_location(_tensor_from_bytes(data, dtype, shape), location, self.map_location)
+        if is_parameter:
+            return torch.nn.Parameter(tensor, requires_grad=requires_grad)
+        return tensor.requires_grad_(requires_grad)
+
+
+class IncrementalCheckpointStore:
+    """
+    Saves checkpoints as small manifests which reference their tensors in a content-addressed blob store.
+
+    Each tensor of at least ``min_blob_bytes`` is hashed and written to a blob named by the digest of its data,
+    unless a blob with that digest exists already. Tensors which did not change since an earlier checkpoint, like
+    frozen weights or embeddings which are not trained, are therefore written once and shared by all manifests.
+    The manifests are loaded transparently by :func:`~pytorch_lightning.utilities.cloud_io.load`, and with it by
+    ``load_from_checkpoint`` and the trainer, as long as the blobs stay next to them.
+
+    Example:
+
+        >>> import tempfile
+        >>> from pytorch_lightning.utilities.cloud_io import load
+        >>> store = IncrementalCheckpointStore(tempfile.mkdtemp(), min_blob_bytes=0)
+        >>> frozen = torch.ones(8)
+        >>> store.save({'frozen': frozen, 'step': torch.tensor(1)}, os.path.join(store.dirpath, 'a.ckpt'))
+        >>> store.save({'frozen': frozen, 'step': torch.tensor(2)}, os.path.join(store.dirpath, 'b.ckpt'))
+        >>> len(os.listdir(store.blob_dir))  # the frozen tensor is stored once
+        3
+        >>> load(os.path.join(store.dirpath, 'b.ckpt'))['step']
+        tensor(2)
+        >>> os.remove(os.path.join(store.dirpath, 'a.ckpt'))
+        >>> store.collect_garbage()
+        1
+
+    Args:
+        dirpath: The directory of the manifests, the blobs are stored in its subdirectory ``.blobs``.
+        min_blob_bytes: Smaller tensors are kept in the manifest instead of a blob of their own.
+    """
+
+    BLOB_DIR_NAME = ".blobs"
+
+    def __init__(self, dirpath: str, min_blob_bytes: int = 4096):
+        self.dirpath = dirpath
+        self.blob_dir = os.path.join(dirpath, self.BLOB_DIR_NAME)
+        self.min_blob_bytes = min_blob_bytes
+        self._fs = get_filesystem(dirpath)
+        # digests of the blobs known to be stored, to skip checking for them again
+        self._stored = set()
+
+    def put(self, data) -> str:
+        """Stores the bytes of ``data`` unless they are already stored, and returns their digest."""
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        if digest in self._stored:
+            return digest
+        blob_path = os.path.join(self.blob_dir, digest)
+        if not self._fs.exists(blob_path):
+            self._fs.makedirs(self.blob_dir, exist_ok=True)
+            self._write(blob_path, data)
+        self._stored.add(digest)
+        return digest
+
+    def save(self, checkpoint: Dict[str, Any], filepath: str):
+        """
+        Saves ``checkpoint`` to ``filepath`` as a manifest, writing only the tensor data not stored yet.
+
+        Args:
+            checkpoint: The object to save, typically the result of ``dump_checkpoint``.
+            filepath: The path of the manifest, which needs to be in :attr:`dirpath`.
+        """
+        buffer = io.BytesIO()
+        pickler = _ManifestPickler(buffer, self)
+        pickler.dump(checkpoint)
+        manifest = {
+            'blob_dir': os.path.relpath(self.blob_dir, os.path.dirname(filepath)),
+            'blobs': sorted(pickler.digests),
+            'checkpoint': buffer.getvalue(),
+        }
+        self._write(filepath, MANIFEST_MAGIC + pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def collect_garbage(self) -> int:
+        """
+        Removes the blobs which no manifest in :attr:`dirpath` references anymore.
+
+        Return:
+            the number of removed blobs
+        """
+        if not self._fs.exists(self.blob_dir):
+            return 0
+        referenced = set()
+        for path in self._fs.ls(self.dirpath, detail=False):
+            referenced |= self.referenced_blobs(path)
+        removed = 0
+        for blob_path in self._fs.ls(self.blob_dir, detail=False):
+            digest = os.path.basename(blob_path)
+            if digest not in referenced and not digest.endswith('.tmp'):
+                self._fs.rm(blob_path)
+                self._stored.discard(digest)
+                removed += 1
+        log.debug(f"Removed {removed} unreferenced checkpoint blobs from {self.blob_dir}")
+        return removed
+
+    def referenced_blobs(self, filepath: str) -> Set[str]:
+        """The digests of the blobs the manifest at ``filepath`` references, none if it is not a manifest."""
+        if not self._fs.isfile(filepath):
+            return set()
+        with self._fs.open(filepath, "rb") as f:
+            if f.read(len(MANIFEST_MAGIC)) != MANIFEST_MAGIC:
+                return set()
+            return set(pickle.load(f)['blobs'])
+
+    def _write(self, path: str, data):
+        # write then rename, so no reader sees a partial blob or manifest
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with self._fs.open(tmp_path, "wb") as f:
+            f.write(data)
+        self._fs.mv(tmp_path, path)
+
+
+def load_manifest(f, filepath: str, map_location=None) -> Dict[str, Any]:
+    """
+    Loads the checkpoint of the manifest at ``filepath``, saved by :class:`IncrementalCheckpointStore`.
+
+    Args:
+        f: The open manifest, positioned right after :data:`MANIFEST_MAGIC`.
+        filepath: The path of the manifest, the blob directory is relative to it.
+        map_location: Where to move the tensors, as for :func:`torch.load`. A function gets each tensor and the
+            name of the device it was saved from.
+    """
+    manifest = pickle.load(f)
+    blob_dir = os.path.join(os.path.dirname(filepath), manifest['blob_dir'])
+    return _ManifestUnpickler(io.BytesIO(manifest['checkpoint']), blob_dir, map_location).load()
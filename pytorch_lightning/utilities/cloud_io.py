@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import io
+import os
+import shutil
 from distutils.version import LooseVersion
 from typing import Union
 from pathlib import Path
@@ -27,8 +29,13 @@ pathlike = Union[Path, str]
 def load(path_or_url: str, map_location=None):
     if path_or_url.startswith("http"):
         return torch.hub.load_state_dict_from_url(path_or_url, map_location=map_location)
+    from pytorch_lightning.utilities.checkpoint_store import MANIFEST_MAGIC, load_manifest
     fs = get_filesystem(path_or_url)
     with fs.open(path_or_url, "rb") as f:
+        # checkpoints saved incrementally are manifests of tensors stored next to them
+        if f.read(len(MANIFEST_MAGIC)) == MANIFEST_MAGIC:
+            return load_manifest(f, path_or_url, map_location=map_location)
+        f.seek(0)
         return torch.load(f, map_location=map_location)
 
 
@@ -60,5 +67,36 @@ def atomic_save(checkpoint, filepath: str):
         torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
     else:
         torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
+    if "://" in str(filepath):
+        with fsspec.open(filepath, "wb") as f:
+            f.write(bytesbuffer.getvalue())
+        return
+    # replace the file instead of writing into it, which would also change the files hardlinked to it
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
         f.write(bytesbuffer.getvalue())
+    os.replace(tmp_path, filepath)
+
+
+def alias_file(src: str, dst: str):
+    """Makes ``dst`` a copy of the file ``src`` without reading and writing its content in this process.
+
+    On a local filesystem ``dst`` becomes a hardlink of ``src``, or a kernel side copy where hardlinks are not
+    supported, which filesystems like btrfs and XFS turn into a reflink. Remote filesystems copy ``src`` on the
+    server. Removing either file later leaves the other one intact, and :func:`atomic_save` replaces files
+    instead of writing into them, so saving to either one does not change the other.
+
+    Args:
+        src: The path of an existing file.
+        dst: The path of the copy, an existing file there is replaced.
+    """
+    if "://" in str(src):
+        get_filesystem(src).copy(src, dst)
+        return
+    # link to a temporary name first, so an existing ``dst`` is replaced atomically
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
@@ -18,6 +18,8 @@ from torch.utils.data import DataLoader, IterableDataset
 
 from pytorch_lightning.utilities import rank_zero_warn
 
+PERSISTENT_WORKERS_AVAILABLE = LooseVersion(torch.__version__) >= LooseVersion("1.7.0")
+
 
 def has_iterable_dataset(dataloader: DataLoader):
     return hasattr(dataloader, 'dataset') and isinstance(dataloader.dataset, IterableDataset)
@@ -45,3 +47,14 @@ def has_len(dataloader: DataLoader) -> bool:
             ' this can lead to unintended side effects since the samples will be duplicated.'
         )
     return has_len
+
+
+def can_persist_workers(dataloader: DataLoader) -> bool:
+    """ Checks if the worker processes of a given Dataloader can be kept alive between iterations
+    i.e. it is a plain multi-process map-style `DataLoader` which isn't persisting its workers already. """
+    if not PERSISTENT_WORKERS_AVAILABLE or type(dataloader) is not DataLoader:
+        return False
+    if has_iterable_dataset(dataloader) or dataloader.persistent_workers:
+        return False
+    # a custom `batch_sampler` can not be passed on together with the default arguments
+    return dataloader.num_workers > 0 and dataloader.batch_size is not None
@@ -11,9 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import sys
+from unittest.mock import Mock
+
 import pytest
 import torch
-import os
+
+from pytorch_lightning.accelerators.ddp_accelerator import DDPAccelerator
+from pytorch_lightning.accelerators.ddp_cpu_spawn_accelerator import DDPCPUSpawnAccelerator
+from pytorch_lightning.distributed.dist import LightningDistributed
+from pytorch_lightning.distributed.rendezvous import LocalRendezvous
+from pytorch_lightning.utilities.distributed import find_free_network_port
 from tests.backends import ddp_model
 from tests.utilities.dist import call_training_script
 
@@ -68,3 +77,125 @@ def test_multi_gpu_model_ddp_fit_test(tmpdir, cli_args):
     model_outs = result['result']
     for out in model_outs:
         assert out['test_acc'] > 0.90
+
+
+_READY_SCRIPT = """
+import os
+import sys
+from pytorch_lightning.distributed.rendezvous import LocalRendezvous
+
+if os.environ['LOCAL_RANK'] == os.environ.get('FAILING_LOCAL_RANK'):
+    sys.exit(3)
+LocalRendezvous.from_env().signal_ready(int(os.environ['LOCAL_RANK']))
+"""
+
+
+@pytest.mark.parametrize('failing_local_rank', [None, '2'])
+def test_ddp_children_start_together(tmpdir, monkeypatch, failing_local_rank):
+    """Make sure the DDP processes are launched at once and waited for without fixed delays."""
+    script = tmpdir.join('ready.py')
+    script.write(_READY_SCRIPT)
+    monkeypatch.setattr(sys, 'argv', [str(script)])
+    monkeypatch.setenv('PYTHONPATH', os.getcwd())
+    if failing_local_rank is not None:
+        monkeypatch.setenv('FAILING_LOCAL_RANK', failing_local_rank)
+    # the launcher exports its settings to its own environment, restore it afterwards
+    for name in ('PL_IN_DDP_SUBPROCESS', 'PL_TRAINER_GPUS', 'WORLD_SIZE', 'PL_DDP_PID', 'LOCAL_RANK', 'NODE_RANK',
+                 'MASTER_ADDR', 'MASTER_PORT'):
+        monkeypatch.setenv(name, '')
+        monkeypatch.delenv(name)
+
+    trainer = Mock(global_rank=0, num_processes=4, num_nodes=1, data_parallel_device_ids=[0, 1, 2, 3], logger=None)
+    accelerator = DDPAccelerator(trainer)
+
+    if failing_local_rank is not None:
+        with pytest.raises(RuntimeError, match='local rank 2 exited with code 3'):
+            accelerator._call_children_scripts()
+    else:
+        accelerator._call_children_scripts()
+        assert set(accelerator.startup_timings) == {'spawn', 'ready'}
+        # the launcher used to pause 1-5 seconds after every process
+        assert accelerator.startup_timings['spawn'] < 1
+
+    for proc in accelerator.interactive_ddp_procs:
+        proc.wait()
+    assert len(accelerator.interactive_ddp_procs) == 3
+    assert LocalRendezvous.ENV_VAR not in os.environ
+
+
+def _test_early_stopping_decision(rank, world_size, port, local_decisions):
+    os.environ['MASTER_ADDR'] = 'localhost'
+    os.environ['MASTER_PORT'] = str(port)
+    torch.distributed.init_process_group('gloo', rank=rank, world_size=world_size)
+
+    trainer = Mock(world_size=world_size, total_batch_idx=5, should_stop=local_decisions[rank])
+    accelerator = DDPCPUSpawnAccelerator(trainer, nprocs=world_size)
+    pl_module = Mock(device=torch.device('cpu'))
+
+    # the decision is only submitted, all processes keep training for now
+    assert accelerator.early_stopping_should_stop(pl_module) is False
+    trainer.should_stop = False
+    accelerator.update_should_stop(before_step=5)
+    assert trainer.should_stop is False
+
+    # one step later every process applies the same decision
+    accelerator.update_should_stop(before_step=6)
+    assert trainer.should_stop is all(local_decisions)
+    assert not accelerator.control_signals.pending
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize('local_decisions', [(True, True), (True, False)])
+def test_ddp_early_stopping_decision_async(local_decisions):
+    """Make sure the processes only stop together, without blocking in the early stopping check."""
+    port = find_free_network_port()
+    torch.multiprocessing.spawn(_test_early_stopping_decision, args=(2, port, local_decisions), nprocs=2)
+
+
+def _test_broadcast(rank, world_size, port, src):
+    os.environ['MASTER_ADDR'] = 'localhost'
+    os.environ['MASTER_PORT'] = str(port)
+    torch.distributed.init_process_group('gloo', rank=rank, world_size=world_size)
+
+    def make_obj():
+        torch.manual_seed(src)
+        shared = torch.rand(3, 2)
+        return {
+            'a': shared,
+            'b': shared,
+            'row': shared[1],
+            'column': shared[:, 1],
+            'state_dict': {'weight': torch.rand(3, 4), 'bias': torch.rand(4).t(), 'steps': torch.tensor(7)},
+            'mask': torch.rand(5) > 0.5,
+            'param': torch.nn.Parameter(torch.rand(2, 3)[:, :2]),
+            'counts': [torch.arange(4), torch.zeros(0, dtype=torch.long)],
+            'meta': ('epoch', 3, None),
+        }
+
+    expected = make_obj()
+    obj = make_obj() if rank == src else {'stale': torch.ones(1)}
+    received = LightningDistributed(rank=rank, device=torch.device('cpu')).broadcast(obj, src=src)
+
+    assert received['meta'] == expected['meta']
+    for name in ('weight', 'bias', 'steps'):
+        assert torch.equal(received['state_dict'][name], expected['state_dict'][name])
+    assert received['mask'].dtype == torch.bool and torch.equal(received['mask'], expected['mask'])
+    assert isinstance(received['param'], torch.nn.Parameter) and received['param'].requires_grad
+    assert torch.equal(received['param'], expected['param'])
+    for tensor, expected_tensor in zip(received['counts'], expected['counts']):
+        assert torch.equal(tensor, expected_tensor)
+
+    # tensors referenced twice and views keep sharing their memory
+    assert received['a'] is received['b'] and torch.equal(received['a'], expected['a'])
+    for name in ('row', 'column'):
+        assert torch.equal(received[name], expected[name])
+    received['a'].zero_()
+    assert not received['row'].any() and not received['column'].any()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize('src', [0, 1])
+def test_lightning_distributed_broadcast(src):
+    """Make sure objects with tensors are broadcast from any process."""
+    port = find_free_network_port()
+    torch.multiprocessing.spawn(_test_broadcast, args=(2, port, src), nprocs=2)
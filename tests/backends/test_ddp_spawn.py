@@ -11,14 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import os
+
 import pytest
 import torch
 
 import tests.base.develop_pipelines as tpipes
 import tests.base.develop_utils as tutils
 from pytorch_lightning.callbacks import EarlyStopping
-from tests.base import EvalModelTemplate
+from tests.base import EvalModelTemplate, BoringModel
 from pytorch_lightning.core import memory
+from pytorch_lightning.distributed.shared_weights import SharedWeights
 from pytorch_lightning.trainer import Trainer
 
 
@@ -83,3 +87,102 @@ def test_ddp_all_dataloaders_passed_to_fit(tmpdir):
     )
     result = trainer.fit(model, **fit_options)
     assert result == 1, "DDP doesn't work with dataloaders passed to fit()."
+
+
+def _train_and_hand_back(process_idx, model, queue):
+    shared = SharedWeights(model)
+    # like a model moved to its device, the trained weights no longer live in the shared memory
+    trained = copy.deepcopy(model)
+    with torch.no_grad():
+        trained.weight.add_(1)
+    trained.register_buffer('steps', torch.tensor([4.]))
+    queue.put(shared.hand_back(trained))
+
+
+def test_spawn_hands_back_weights_through_shared_memory():
+    """Make sure the weights trained in a spawned process end up in the model of the main process."""
+    model = torch.nn.Linear(4, 2)
+    initial = model.weight.detach().clone()
+    queue = torch.multiprocessing.get_context('spawn').SimpleQueue()
+
+    SharedWeights.share(model)
+    torch.multiprocessing.spawn(_train_and_hand_back, args=(model, queue), nprocs=1)
+
+    assert torch.equal(model.weight, initial + 1)
+    # the buffer registered after spawning has no shared memory and is sent separately
+    model.register_buffer('steps', torch.zeros(1))
+    SharedWeights.restore(model, queue.get())
+    assert model.steps.item() == 4
+
+
+def _train_private_copy(process_idx, model, queue, port):
+    torch.distributed.init_process_group('gloo', init_method=f'tcp://127.0.0.1:{port}', rank=process_idx, world_size=2)
+    shared = SharedWeights(model)
+    shared.make_private(model)
+    ddp_model = torch.nn.parallel.DistributedDataParallel(model)
+    optimizer = torch.optim.SGD(ddp_model.parameters(), lr=1.0)
+    for _ in range(4):
+        optimizer.zero_grad()
+        (-ddp_model(torch.ones(1, 1)).sum()).backward()
+        optimizer.step()
+    if process_idx == 0:
+        queue.put(shared.hand_back(model))
+    torch.distributed.destroy_process_group()
+
+
+def test_spawned_processes_train_private_weights():
+    """Make sure each spawned process steps its own copy of the shared weights, not the single shared one."""
+    model = torch.nn.Linear(1, 1, bias=False)
+    torch.nn.init.zeros_(model.weight)
+    queue = torch.multiprocessing.get_context('spawn').SimpleQueue()
+    tutils.set_random_master_port()
+    port = os.environ['MASTER_PORT']
+
+    SharedWeights.share(model)
+    torch.multiprocessing.spawn(_train_private_copy, args=(model, queue, port), nprocs=2)
+
+    assert queue.get() is None
+    # 4 steps with a gradient of -1, as when training in a single process
+    assert model.weight.item() == 4
+
+
+class _ConstantGradientModel(BoringModel):
+    """The gradient of the weight is -1 in every step, whichever data a process trains on."""
+
+    def __init__(self):
+        super().__init__()
+        self.layer = torch.nn.Linear(1, 1)
+        torch.nn.init.zeros_(self.layer.weight)
+        torch.nn.init.zeros_(self.layer.bias)
+
+    def training_step(self, batch, batch_idx):
+        return {'loss': -self.layer.weight.sum() - self.layer.bias.sum() + 0 * batch.sum()}
+
+    def configure_optimizers(self):
+        return torch.optim.SGD(self.layer.parameters(), lr=1.0)
+
+
+def test_ddp_cpu_processes_train_private_weights(tmpdir):
+    """Make sure the spawned processes don't all update the shared weights, the result matches one process."""
+    tutils.set_random_master_port()
+    trainer_options = dict(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=0,
+        weights_summary=None,
+        progress_bar_refresh_rate=0,
+        checkpoint_callback=False,
+        logger=False,
+    )
+
+    single = _ConstantGradientModel()
+    Trainer(**trainer_options).fit(single)
+
+    model = _ConstantGradientModel()
+    trainer = Trainer(distributed_backend='ddp_cpu', num_processes=2, **trainer_options)
+    trainer.fit(model)
+
+    assert single.layer.weight.item() == 4
+    assert torch.equal(model.layer.weight, single.layer.weight)
+    assert torch.equal(model.layer.bias, single.layer.bias)
@@ -18,6 +18,8 @@ import tests.base.develop_pipelines as tpipes
 import tests.base.develop_utils as tutils
 from pytorch_lightning.callbacks import EarlyStopping
 from pytorch_lightning.core import memory
+from pytorch_lightning.core.step_result import TrainResult
+from pytorch_lightning.overrides.data_parallel import LightningDataParallel
 from tests.base import EvalModelTemplate
 import pytorch_lightning as pl
 
@@ -96,3 +98,72 @@ def test_dp_test(tmpdir):
     new_weights = model.c_d1.weight.clone().detach().cpu()
 
     assert torch.all(torch.eq(old_weights, new_weights))
+
+
+def _cpu_gather(*tensors):
+    """Same concatenation as `torch.nn.parallel._functions.Gather` along dim 0, without the devices."""
+    return torch.cat([t.view(1) if t.dim() == 0 else t for t in tensors])
+
+
+def test_dp_batched_gather():
+    """Make sure packing the outputs of all replicas into one gather per dtype gives the per-tensor results."""
+    model = LightningDataParallel(EvalModelTemplate())
+    model.dim = 0
+    model._gather_fn = _cpu_gather
+
+    weight = torch.tensor(2., requires_grad=True)
+    outputs = [
+        {
+            'loss': weight * (i + 1),
+            'logits': torch.rand(4, 3),
+            'preds': torch.arange(4 + i),
+            'ints': (torch.tensor(i), torch.tensor([i, i])),
+            'name': 'replica',
+            'nothing': None,
+        }
+        for i in range(3)
+    ]
+    gathered = model.gather(outputs)
+
+    assert torch.equal(gathered['loss'], torch.tensor([2., 4., 6.]))
+    assert torch.equal(gathered['logits'], torch.cat([o['logits'] for o in outputs]))
+    assert torch.equal(gathered['preds'], torch.cat([o['preds'] for o in outputs]))
+    assert torch.equal(gathered['ints'][0], torch.tensor([0, 1, 2]))
+    assert torch.equal(gathered['ints'][1], torch.tensor([0, 0, 1, 1, 2, 2]))
+    assert gathered['name'] == ['replica'] * 3
+    assert gathered['nothing'] is None
+
+    gathered['loss'].sum().backward()
+    assert weight.grad == 6.
+
+
+def test_dp_reduce_gathered_scalars():
+    """Make sure the logged scalars DP gathers as one block are reduced like the per-key reduction."""
+    model = LightningDataParallel(EvalModelTemplate())
+    model.dim = 0
+    model._gather_fn = _cpu_gather
+
+    weight = torch.tensor(1., requires_grad=True)
+    outputs = []
+    for i in range(2):
+        result = TrainResult(minimize=weight * (i + 1))
+        result.log('a', torch.tensor(float(i)))
+        result.log('b', torch.tensor(float(i * 10)), on_epoch=True)
+        result.log('c', torch.tensor([1., 2.]) * i)
+        outputs.append(result)
+
+    gathered = model._LightningDataParallel__gather_structured_result(outputs)
+    assert isinstance(gathered, TrainResult)
+    assert list(gathered.keys()) == list(outputs[0].keys())
+    assert gathered['meta'] is outputs[0]['meta']
+    assert torch.equal(gathered['a'], torch.tensor([0., 1.]))
+
+    gathered['a'] = torch.tensor([4., 6.])
+    gathered.dp_reduce()
+    assert gathered.minimize == 1.5
+    assert gathered['a'] == 5.
+    assert gathered['b'] == 5.
+    assert gathered['c'] == 0.75
+
+    gathered.minimize.backward()
+    assert weight.grad == 1.5
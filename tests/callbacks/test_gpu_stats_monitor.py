@@ -17,6 +17,8 @@ import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import GPUStatsMonitor
+from pytorch_lightning.callbacks import gpu_stats_monitor
+from pytorch_lightning.callbacks.gpu_stats_monitor import HostStatsSource, StatsSource
 from pytorch_lightning.loggers import CSVLogger
 from pytorch_lightning.loggers.csv_logs import ExperimentWriter
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -112,3 +114,82 @@ def test_gpu_stats_monitor_parse_gpu_stats():
     logs = GPUStatsMonitor._parse_gpu_stats('1,2', [[3, 4, 5], [6, 7]], [('gpu', 'a'), ('memory', 'b')])
     expected = {'gpu_id: 1/gpu (a)': 3, 'gpu_id: 1/memory (b)': 4, 'gpu_id: 2/gpu (a)': 6, 'gpu_id: 2/memory (b)': 7}
     assert logs == expected
+
+
+class FakeStatsSource(StatsSource):
+
+    def __init__(self):
+        self.num_samples = 0
+        self.stopped = False
+
+    def sample(self):
+        self.num_samples += 1
+        return {'fake/samples (count)': self.num_samples}
+
+    def stop(self):
+        self.stopped = True
+
+
+def _logged_fields(logger):
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    with open(path_csv, 'r') as fp:
+        return fp.readline().strip().split(',')
+
+
+def test_gpu_stats_monitor_sampled_source(tmpdir):
+    """
+    Test the stats of a source are sampled in the background and logged with the step times.
+    """
+    model = EvalModelTemplate()
+    source = FakeStatsSource()
+    gpu_stats = GPUStatsMonitor(intra_step_time=True, inter_step_time=True, sources=[source], sampling_interval=0.01)
+    logger = CSVLogger(tmpdir)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=0,
+        callbacks=[gpu_stats],
+        logger=logger
+    )
+    trainer.fit(model)
+
+    fields = _logged_fields(logger)
+    for field in ('fake/samples (count)', 'batch_time/intra_step (ms)', 'batch_time/inter_step (ms)'):
+        assert field in fields
+    assert source.num_samples >= 1
+    assert source.stopped
+
+
+def test_gpu_stats_monitor_host_stats(tmpdir):
+    """
+    Test GPUStatsMonitor logs the host stats on a CPU-only node.
+    """
+    model = EvalModelTemplate()
+    gpu_stats = GPUStatsMonitor(memory_utilization=False, gpu_utilization=False, host_stats=True)
+    logger = CSVLogger(tmpdir)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        callbacks=[gpu_stats],
+        logger=logger
+    )
+    trainer.fit(model)
+
+    fields = _logged_fields(logger)
+    for field in ('host/cpu_utilization (%)', 'host/memory.used (MB)', 'host/memory.free (MB)'):
+        assert field in fields
+
+
+@pytest.mark.skipif(not os.path.isfile('/proc/meminfo'), reason="test requires /proc")
+def test_host_stats_source_proc(monkeypatch):
+    monkeypatch.setattr(gpu_stats_monitor, 'PSUTIL_AVAILABLE', False)
+    source = HostStatsSource()
+    source.sample()
+    stats = source.sample()
+    assert 0 <= stats['host/cpu_utilization (%)'] <= 100
+    assert stats['host/memory.used (MB)'] > 0 and stats['host/memory.free (MB)'] > 0
@@ -513,3 +513,96 @@ def test_checkpointing_with_nan_as_first(tmpdir, mode):
 
     # check that last one is also the best one
     assert trainer.dev_debugger.checkpoint_callback_history[-1]['epoch'] == len(monitor) - 1
+
+
+def test_model_checkpoint_save_last_links_top_k(tmpdir):
+    """Test that the last checkpoint is linked to the top-k checkpoint of the same step instead of saved again."""
+    monitor = [3, 2, 5]
+
+    class CurrentModel(EvalModelTemplate):
+        def validation_epoch_end(self, outputs):
+            self.log('abc', torch.tensor(monitor[self.current_epoch], dtype=torch.float))
+
+    model = CurrentModel()
+    model_checkpoint = ModelCheckpoint(monitor='abc', filepath=tmpdir, save_top_k=1, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        checkpoint_callback=model_checkpoint,
+        max_epochs=len(monitor),
+        limit_train_batches=2,
+        limit_val_batches=2,
+    )
+    dump_checkpoint = Mock(wraps=trainer.checkpoint_connector.dump_checkpoint)
+    trainer.checkpoint_connector.dump_checkpoint = dump_checkpoint
+    trainer.fit(model)
+
+    # the checkpoint of each epoch is dumped once, whether one or two files hold it
+    assert dump_checkpoint.call_count == len(monitor)
+    best_path, last_path = str(tmpdir / "epoch=1.ckpt"), str(tmpdir / "last.ckpt")
+    assert sorted(os.listdir(tmpdir)) == ["epoch=1.ckpt", "last.ckpt", "lightning_logs"]
+    assert model_checkpoint.best_model_path == best_path
+
+    # the last epoch was not the best, saving it must not have changed the best one linked to it before
+    assert not os.path.samefile(best_path, last_path)
+    assert torch.load(best_path)["epoch"] == 2
+    assert torch.load(last_path)["epoch"] == 3
+
+
+def test_model_checkpoint_incremental(tmpdir):
+    """Test that incremental checkpoints store unchanged tensors once and remove them with the last reference."""
+    monitor = [3, 2, 1, 0]
+
+    class CurrentModel(EvalModelTemplate):
+        def validation_epoch_end(self, outputs):
+            self.log('abc', torch.tensor(monitor[self.current_epoch], dtype=torch.float))
+
+    model = CurrentModel()
+    model.c_d1.requires_grad_(False)
+    model_checkpoint = ModelCheckpoint(monitor='abc', filepath=tmpdir, save_top_k=2, incremental=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        checkpoint_callback=model_checkpoint,
+        max_epochs=3,
+        limit_train_batches=2,
+        limit_val_batches=2,
+    )
+    trainer.fit(model)
+
+    store = model_checkpoint._store
+    paths = sorted(model_checkpoint.best_k_models)
+    assert paths == [str(tmpdir / "epoch=1.ckpt"), str(tmpdir / "epoch=2.ckpt")]
+    blobs = [store.referenced_blobs(path) for path in paths]
+    # the frozen weight is shared, the trained weights and optimizer states differ
+    assert blobs[0] & blobs[1]
+    assert blobs[0] != blobs[1]
+    # the blobs of the removed first checkpoint which no other one references were removed
+    assert set(os.listdir(store.blob_dir)) == blobs[0] | blobs[1]
+
+    loaded = CurrentModel.load_from_checkpoint(paths[1])
+    for w0, w1 in zip(model.parameters(), loaded.parameters()):
+        assert torch.equal(w0, w1)
+
+    # resume from the manifest
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=4, limit_train_batches=2, resume_from_checkpoint=paths[1])
+    trainer.fit(CurrentModel())
+    assert trainer.current_epoch == 3
+
+
+def test_incremental_checkpoint_store_dtypes(tmpdir):
+    """Test that tensors of every dtype round trip through an incremental checkpoint."""
+    from pytorch_lightning.utilities.checkpoint_store import IncrementalCheckpointStore
+    from pytorch_lightning.utilities.cloud_io import load
+
+    store = IncrementalCheckpointStore(str(tmpdir), min_blob_bytes=0)
+    dtypes = [torch.bool, torch.uint8, torch.int64, torch.float16, torch.float32, torch.float64, torch.bfloat16]
+    checkpoint = {str(dtype): torch.arange(6).reshape(2, 3).to(dtype) for dtype in dtypes}
+    checkpoint['empty'] = torch.empty(0, 3)
+    checkpoint['view'] = torch.arange(12.).reshape(3, 4)[:, 1]
+    path = str(tmpdir / "a.ckpt")
+    store.save(checkpoint, path)
+
+    loaded = load(path)
+    assert loaded.keys() == checkpoint.keys()
+    for key, tensor in checkpoint.items():
+        assert loaded[key].dtype == tensor.dtype
+        assert torch.equal(loaded[key], tensor)
@@ -16,9 +16,14 @@ import torch
 import torch.nn as nn
 
 from pytorch_lightning import LightningModule
-from pytorch_lightning.core.memory import UNKNOWN_SIZE, ModelSummary
+from pytorch_lightning.core.memory import UNKNOWN_SIZE, FakeTensorMode, ModelSummary
 from tests.base.models import ParityModuleRNN
 
+if FakeTensorMode is not None:
+    from torch._subclasses.fake_tensor import FakeTensor
+else:
+    FakeTensor = None
+
 
 class EmptyModule(LightningModule):
     """ A module that has no layers """
@@ -237,3 +242,66 @@ def test_example_input_array_types(example_input, expected_size, mode):
     model.example_input_array = example_input
     summary = model.summarize(mode=mode)
     assert summary.in_sizes == [expected_size]
+
+
+class CountingModel(LightningModule):
+    """ A model which records the inputs of its forward passes """
+
+    def __init__(self):
+        super().__init__()
+        self.layer = nn.Linear(3, 5)
+        self.inputs = []
+        self.example_input_array = torch.rand(2, 3)
+
+    def forward(self, x):
+        self.inputs.append(x)
+        return self.layer(x)
+
+
+@pytest.mark.skipif(FakeTensorMode is None, reason="Test requires fake tensors.")
+def test_summary_shapes_traced_with_fake_tensors():
+    """ Test that the shapes are traced without computing the example input. """
+    model = CountingModel()
+    summary = model.summarize()
+    assert summary.in_sizes == [[2, 3]]
+    assert summary.out_sizes == [[2, 5]]
+    assert len(model.inputs) == 1
+    assert isinstance(model.inputs[0], FakeTensor)
+
+
+def test_summary_shapes_value_dependent_forward():
+    """ Test that the summary falls back to a real forward pass when the forward depends on the input values. """
+
+    class ValueDependentModel(CountingModel):
+        def forward(self, x):
+            if x.sum() > 100:
+                x = x * 2
+            return super().forward(x)
+
+    model = ValueDependentModel()
+    summary = model.summarize()
+    assert summary.in_sizes == [[2, 3]]
+    assert summary.out_sizes == [[2, 5]]
+    if FakeTensor is not None:
+        assert not isinstance(model.inputs[-1], FakeTensor)
+
+
+def test_summary_lazy_and_cached():
+    """ Test that the summary is computed on first use and reused while the model does not change. """
+    model = CountingModel()
+    summary = ModelSummary(model)
+    assert len(model.inputs) == 0
+
+    assert summary.param_nums == [20]
+    assert len(model.inputs) == 1
+    # e.g. fitting the same model again
+    assert str(ModelSummary(model)) == str(summary)
+    assert len(model.inputs) == 1
+
+    model.example_input_array = torch.rand(4, 3)
+    assert ModelSummary(model).in_sizes == [[4, 3]]
+    assert len(model.inputs) == 2
+
+    model.layer = nn.Linear(3, 6)
+    assert ModelSummary(model).param_nums == [24]
+    assert len(model.inputs) == 3
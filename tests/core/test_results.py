@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import sys
+from copy import copy
 from pathlib import Path
 
 import pytest
@@ -203,3 +204,48 @@ def test_result_retrieve_last_logged_item():
     assert result['a_epoch'] == 5.
     assert result['a_step'] == 5.
     assert result['a'] == 5.
+
+
+def _scanned(result):
+    """A copy of ``result`` without the cached log layout, so getters go through the meta scan."""
+    scanned = copy(result)
+    object.__setattr__(scanned, '_log_schemas', None)
+    return scanned
+
+
+def test_result_cached_layout_matches_meta_scan():
+    result = Result()
+    result.log('a', torch.tensor(1.), on_step=True, on_epoch=True, prog_bar=True)
+    result.log('b', torch.tensor(2.), on_step=True, on_epoch=False)
+    result.log('c', torch.tensor(3.), on_step=False, on_epoch=True, prog_bar=True, logger=False)
+    scanned = _scanned(result)
+    assert result._logged_schemas() is not None
+    assert scanned._logged_schemas() is None
+
+    for include_forked_originals in (True, False):
+        assert result.get_batch_log_metrics(include_forked_originals) == \
+            scanned.get_batch_log_metrics(include_forked_originals)
+        assert result.get_batch_pbar_metrics(include_forked_originals) == \
+            scanned.get_batch_pbar_metrics(include_forked_originals)
+    assert result.get_forked_metrics() == scanned.get_forked_metrics()
+    assert list(result.get_batch_log_metrics()) == ['a_step', 'a', 'b']
+    assert list(result.get_batch_pbar_metrics(include_forked_originals=False)) == ['a_step']
+
+    # the copy made every step keeps the fast path
+    assert copy(result)._logged_schemas() is not None
+
+
+def test_result_cached_layout_invalidated():
+    result = Result()
+    result.log('a', 1., on_step=True, on_epoch=False)
+    result.log('a', 2., on_step=True, on_epoch=True)
+    # a key logged twice with other options no longer matches the logged sequence
+    assert result._logged_schemas() is None
+    assert result.get_batch_log_metrics() == {'a_step': 2., 'a': 2.}
+    assert result.get_forked_metrics() == {'a': 2.}
+
+    result = Result()
+    result.log('a', 1., on_step=True, on_epoch=False)
+    result.rename_keys({'a': 'b'})
+    assert result._logged_schemas() is None
+    assert result.get_batch_log_metrics() == {'b': 1.}
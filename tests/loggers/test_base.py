@@ -13,9 +13,11 @@
 # limitations under the License.
 import pickle
 from typing import Optional
+from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.loggers import LightningLoggerBase, LoggerCollection
@@ -212,3 +214,62 @@ def test_with_accumulate_grad_batches():
     assert logger.history == {0: {'loss': 0.5623850983416314}}
     logger.close()
     assert logger.history == {0: {'loss': 0.5623850983416314}, 1: {'loss': 0.4778883735637184}}
+
+
+class SaveCountingLogger(CustomLogger):
+    def __init__(self):
+        super().__init__()
+        self.saved_at = []
+
+    @rank_zero_only
+    def save(self):
+        super().save()
+        self.saved_at.append(self.trainer.global_step)
+
+
+@pytest.mark.parametrize(['flush_logs_every_n_steps', 'accumulate_grad_batches'], [(2, 1), (3, 2)])
+def test_loggers_flushed_on_schedule(tmpdir, flush_logs_every_n_steps, accumulate_grad_batches):
+    """Loggers are saved every `flush_logs_every_n_steps` steps, together, and not after each logged metric."""
+    logger1 = SaveCountingLogger()
+    logger2 = SaveCountingLogger()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=2,
+        log_every_n_steps=1,
+        flush_logs_every_n_steps=flush_logs_every_n_steps,
+        accumulate_grad_batches=accumulate_grad_batches,
+        logger=[logger1, logger2],
+        weights_summary=None,
+    )
+    logger1.trainer = logger2.trainer = trainer
+    trainer.fit(EvalModelTemplate())
+
+    scheduled = [step for step in range(trainer.global_step) if (step + 1) % flush_logs_every_n_steps == 0]
+    # once at the setup and once per scheduled step
+    assert logger1.saved_at == logger2.saved_at
+    assert logger1.saved_at == [0] + scheduled
+    assert logger1.finalized_status == "success"
+
+
+def test_loggers_flushed_by_time(tmpdir):
+    """Loggers are also saved when `flush_logs_every_n_seconds` passed since the last save."""
+    logger = SaveCountingLogger()
+    # every call of the clock advances it by 4 seconds
+    with mock.patch('pytorch_lightning.trainer.connectors.logger_connector.time.monotonic') as monotonic:
+        monotonic.side_effect = (4. * i for i in range(1000))
+        trainer = Trainer(
+            default_root_dir=tmpdir,
+            max_epochs=1,
+            limit_train_batches=6,
+            limit_val_batches=0,
+            flush_logs_every_n_steps=100,
+            flush_logs_every_n_seconds=10,
+            logger=logger,
+            weights_summary=None,
+        )
+        logger.trainer = trainer
+        trainer.fit(EvalModelTemplate())
+    # the setup save, then each step takes the clock 4 seconds further until 10 seconds passed
+    assert logger.saved_at == [0, 2, 5]
@@ -108,3 +108,30 @@ def test_file_logger_log_hyperparams(tmpdir):
     path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
     params = load_hparams_from_yaml(path_yaml)
     assert all([n in params for n in hparams])
+
+
+def test_file_logger_save_writes_changes_only(tmpdir):
+    logger = CSVLogger(tmpdir)
+    logger.log_hyperparams({"lr": 0.1})
+    logger.save()
+    path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+
+    # unchanged hparams are not written again, new rows are appended
+    os.remove(path_yaml)
+    logger.log_hyperparams({"lr": 0.1})
+    logger.log_metrics({"loss": 1.0}, 0)
+    logger.save()
+    logger.log_metrics({"loss": 0.5}, 1)
+    logger.save()
+    assert not os.path.exists(path_yaml)
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["loss,step", "1.0,0", "0.5,1"]
+
+    # changed hparams are written, a new column rewrites the file with the new header
+    logger.log_hyperparams({"lr": 0.01})
+    logger.log_metrics({"acc": 0.7}, 2)
+    logger.save()
+    assert load_hparams_from_yaml(path_yaml) == {"lr": 0.01}
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["loss,step,acc", "1.0,0,", "0.5,1,", ",2,0.7"]
@@ -144,6 +144,23 @@ def test_tensorboard_log_hyperparams(tmpdir):
     logger.log_hyperparams(hparams)
 
 
+def test_tensorboard_hparams_file_updated_on_change(tmpdir):
+    logger = TensorBoardLogger(tmpdir)
+    logger.log_hyperparams({"lr": 0.1})
+    logger.save()
+    hparams_file = os.path.join(logger.log_dir, TensorBoardLogger.NAME_HPARAMS_FILE)
+    mtime = os.path.getmtime(hparams_file)
+
+    logger.log_hyperparams({"lr": 0.1})
+    logger.save()
+    assert os.path.getmtime(hparams_file) == mtime
+
+    logger.log_hyperparams({"lr": 0.01})
+    logger.save()
+    with open(hparams_file) as fp:
+        assert yaml.safe_load(fp) == {"lr": 0.01}
+
+
 def test_tensorboard_log_hparams_and_metrics(tmpdir):
     logger = TensorBoardLogger(tmpdir, default_hp_metric=False)
     hparams = {
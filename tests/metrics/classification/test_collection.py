@@ -0,0 +1,79 @@
+import pytest
+import torch
+
+from pytorch_lightning.metrics import Accuracy, Fbeta, MetricCollection, Precision, Recall
+from pytorch_lightning.metrics.classification import precision_recall
+from tests.metrics.classification.inputs import (
+    _binary_inputs,
+    _binary_prob_inputs,
+    _multiclass_inputs,
+    _multiclass_prob_inputs,
+    _multidim_multiclass_inputs,
+    _multidim_multiclass_prob_inputs,
+    _multilabel_inputs,
+    _multilabel_prob_inputs,
+)
+from tests.metrics.utils import NUM_BATCHES, NUM_CLASSES
+
+torch.manual_seed(42)
+
+
+def _metrics(num_classes, multilabel):
+    return {
+        'accuracy': Accuracy(),
+        'micro_precision': Precision(num_classes=num_classes, multilabel=multilabel),
+        'macro_precision': Precision(num_classes=num_classes, average='macro', multilabel=multilabel),
+        'recall': Recall(num_classes=num_classes, multilabel=multilabel),
+        'fbeta': Fbeta(num_classes=num_classes, beta=0.5, average='macro', multilabel=multilabel),
+    }
+
+
+@pytest.mark.parametrize("preds, target, num_classes, multilabel", [
+    (_binary_prob_inputs.preds, _binary_prob_inputs.target, 1, False),
+    (_binary_inputs.preds, _binary_inputs.target, 1, False),
+    (_multilabel_prob_inputs.preds, _multilabel_prob_inputs.target, NUM_CLASSES, True),
+    (_multilabel_inputs.preds, _multilabel_inputs.target, NUM_CLASSES, True),
+    (_multiclass_prob_inputs.preds, _multiclass_prob_inputs.target, NUM_CLASSES, False),
+    (_multiclass_inputs.preds, _multiclass_inputs.target, NUM_CLASSES, False),
+    (_multidim_multiclass_prob_inputs.preds, _multidim_multiclass_prob_inputs.target, NUM_CLASSES, False),
+    (_multidim_multiclass_inputs.preds, _multidim_multiclass_inputs.target, NUM_CLASSES, False),
+])
+def test_collection_shares_stat_scores(monkeypatch, preds, target, num_classes, multilabel):
+    """The metrics of a collection compute the class predictions and stat scores once and give the same values."""
+    calls = []
+    categorical_input = precision_recall._categorical_input
+
+    def counted_categorical_input(*args):
+        calls.append(args)
+        return categorical_input(*args)
+
+    monkeypatch.setattr(precision_recall, '_categorical_input', counted_categorical_input)
+
+    standalone = _metrics(num_classes, multilabel)
+    collection = MetricCollection(_metrics(num_classes, multilabel))
+
+    for i in range(NUM_BATCHES):
+        step_values = collection(preds[i], target[i])
+        for name, metric in standalone.items():
+            assert torch.allclose(step_values[name], metric(preds[i], target[i]), equal_nan=True)
+
+    # once per `forward` of each standalone metric but accuracy, once per `forward` of the whole collection
+    assert len(calls) == NUM_BATCHES * (len(standalone) - 1 + 1)
+
+    values = collection.compute()
+    for name, metric in standalone.items():
+        assert torch.allclose(values[name], metric.compute(), equal_nan=True)
+
+
+def test_collection_respects_overridden_update():
+    """A metric overriding ``update`` doesn't take the shared intermediates in a collection."""
+    class ShiftedAccuracy(Accuracy):
+        def update(self, preds, target):
+            super().update(preds + 1, target)
+
+    preds, target = _multiclass_inputs.preds[0], _multiclass_inputs.target[0]
+    collection = MetricCollection([Accuracy(), ShiftedAccuracy()])
+    collection.update(preds, target)
+    values = collection.compute()
+    assert values['Accuracy'] == (preds == target).float().mean()
+    assert values['ShiftedAccuracy'] == (preds + 1 == target).float().mean()
@@ -3,6 +3,8 @@ import sys
 import pytest
 import torch
 
+from pytorch_lightning.metrics import Metric, MetricCollection
+from pytorch_lightning.metrics import metric as metric_module
 from tests.metrics.test_metric import Dummy
 from tests.metrics.utils import setup_ddp
 
@@ -43,3 +45,84 @@ def _test_ddp_sum_cat(rank, worldsize):
 @pytest.mark.parametrize("process", [_test_ddp_cat, _test_ddp_sum, _test_ddp_sum_cat])
 def test_ddp(process):
     torch.multiprocessing.spawn(process, args=(2,), nprocs=2)
+
+
+class DummyStates(Metric):
+    def __init__(self):
+        super().__init__()
+        self.add_state("total", torch.tensor(0), dist_reduce_fx="sum")
+        self.add_state("score", torch.tensor([0., 0.]), dist_reduce_fx="sum")
+        self.add_state("avg", torch.tensor(0.), dist_reduce_fx="mean")
+        self.add_state("high", torch.tensor([-1., -1.]), dist_reduce_fx="max")
+        self.add_state("low", torch.tensor(10, dtype=torch.int32), dist_reduce_fx="min")
+        self.add_state("raw", torch.tensor(0.), dist_reduce_fx=None)
+        self.add_state("flags", torch.tensor([False, False]), dist_reduce_fx="sum")
+        self.add_state("preds", [], dist_reduce_fx="cat")
+        self.add_state("items", [], dist_reduce_fx=None)
+
+    def update(self, rank):
+        self.total += rank + 1
+        self.score += torch.tensor([rank, 2. * rank])
+        self.avg += rank + 0.5
+        self.high = torch.max(self.high, torch.tensor([rank, -rank], dtype=torch.float))
+        self.low = torch.min(self.low, torch.tensor(rank + 3, dtype=torch.int32))
+        self.raw = torch.tensor(rank * 3.)
+        self.flags = torch.tensor([rank == 0, True])
+        self.preds.append(torch.arange(3) + rank)
+        self.preds.append(torch.ones(4, dtype=torch.float64) * rank)
+        self.items.append(torch.tensor([rank]))
+
+    def compute(self):
+        pass
+
+
+def _test_ddp_collection_sync(rank, worldsize):
+    setup_ddp(rank, worldsize)
+
+    expected = DummyStates()
+    expected.update(rank)
+    expected._sync_dist()
+
+    collection = MetricCollection({'a': DummyStates(), 'b': DummyStates()})
+    collection.update(rank)
+    collection._sync_dist()
+
+    for metric in collection.values():
+        for attr in expected._reductions:
+            synced, reference = getattr(metric, attr), getattr(expected, attr)
+            if isinstance(reference, list):
+                assert len(synced) == len(reference)
+                for s, r in zip(synced, reference):
+                    assert s.dtype == r.dtype and torch.allclose(s, r)
+            else:
+                assert synced.dtype == reference.dtype and torch.allclose(synced, reference)
+
+
+def _test_ddp_collection_sync_without_dtype_views(rank, worldsize):
+    # like on torch<1.10, each metric synchronizes its own states
+    metric_module._DTYPE_VIEWS_AVAILABLE = False
+    _test_ddp_collection_sync(rank, worldsize)
+
+
+def _test_ddp_collection_sync_uneven(rank, worldsize):
+    setup_ddp(rank, worldsize)
+    collection = MetricCollection([DummyStates()])
+    for _ in range(rank + 1):
+        collection.update(rank)
+    collection._sync_dist()
+
+    metric = collection['DummyStates']
+    assert metric.total == 5
+    assert torch.equal(metric.preds, torch.cat([
+        torch.tensor([0., 1., 2.]), torch.tensor([1., 2., 3.]), torch.zeros(4), torch.ones(4),
+        torch.tensor([1., 2., 3.]), torch.ones(4),
+    ]))
+    assert torch.equal(torch.cat(metric.items), torch.tensor([0, 1, 1]))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize("process", [
+    _test_ddp_collection_sync, _test_ddp_collection_sync_without_dtype_views, _test_ddp_collection_sync_uneven,
+])
+def test_ddp_metric_collection(process):
+    torch.multiprocessing.spawn(process, args=(2,), nprocs=2)
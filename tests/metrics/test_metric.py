@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 import torch
 
-from pytorch_lightning.metrics.metric import Metric
+from pytorch_lightning.metrics.metric import Metric, MetricCollection
 
 torch.manual_seed(42)
 
@@ -38,6 +38,12 @@ def test_add_state():
     a.add_state("b", torch.tensor(0), "mean")
     assert np.allclose(a._reductions["b"](torch.tensor([1.0, 2.0])).numpy(), 1.5)
 
+    a.add_state("b2", torch.tensor(0), "max")
+    assert torch.equal(a._reductions["b2"](torch.tensor([[1, 3], [2, 0]])), torch.tensor([2, 3]))
+
+    a.add_state("b3", torch.tensor(0), "min")
+    assert torch.equal(a._reductions["b3"](torch.tensor([[1, 3], [2, 0]])), torch.tensor([1, 0]))
+
     a.add_state("c", torch.tensor(0), "cat")
     assert a._reductions["c"]([torch.tensor([1]), torch.tensor([1])]).shape == (2,)
 
@@ -84,6 +90,70 @@ def test_reset():
     assert a.x == 0
 
 
+def test_reset_in_place():
+    class A(Dummy):
+        def __init__(self):
+            super().__init__()
+            self.add_state("y", torch.tensor([1., 2.]), dist_reduce_fx="sum")
+            self.add_state("z", [], dist_reduce_fx="cat")
+
+        def update(self, x):
+            self.x += x
+            self.y += x
+            self.z.append(x)
+
+        def compute(self):
+            return self.x, self.z
+
+    a = A()
+    x, y, z = a.x, a.y, a.z
+    a.update(torch.tensor(3))
+    a.reset()
+    assert a.x is x and a.y is y and a.z is z
+    assert a.x == 0 and torch.equal(a.y, torch.tensor([1., 2.])) and a.z == []
+
+    # the computed value keeps referring to the states it was computed from
+    a.update(torch.tensor(3))
+    computed_x, computed_z = a.compute()
+    assert computed_x == 3 and computed_z == [torch.tensor(3)]
+    assert a.x is not x and a.z is not z and a.y is y
+
+    # tensors the metric didn't allocate itself are left alone
+    external = torch.tensor(7)
+    a.x = external
+    a.reset()
+    assert external == 7 and a.x == 0
+
+
+def test_forward_merges_batch_state():
+    class A(Dummy):
+        def __init__(self):
+            super().__init__()
+            self.add_state("x", torch.tensor(0), dist_reduce_fx="sum")
+            self.add_state("high", torch.tensor(-1), dist_reduce_fx="max")
+            self.add_state("seen", [], dist_reduce_fx=None)
+            self.calls = 0
+
+        def update(self, x):
+            self.calls += 1
+            self.x += x
+            self.high = torch.max(self.high, x)
+            self.seen.append(x)
+
+        def compute(self):
+            return self.x, self.high, len(self.seen)
+
+    class B(A):
+        mergeable_states = True
+
+    a, b = A(), B()
+    for x in (4, 2, 3):
+        assert a(torch.tensor(x)) == b(torch.tensor(x)) == (x, x, 1)
+    assert a.calls == 6
+    assert b.calls == 3
+    assert a.compute() == b.compute() == (9, 4, 3)
+
+
 def test_update():
     class A(Dummy):
         def update(self, x):
@@ -168,3 +238,28 @@ def test_pickle(tmpdir):
     metric_loaded = cloudpickle.loads(metric_pickled)
 
     assert metric_loaded.compute() == 1
+
+
+def test_metric_collection():
+    class A(ToPickle):
+        pass
+
+    collection = MetricCollection([ToPickle(), A()])
+    assert collection(5) == {'ToPickle': 5, 'A': 5}
+    collection.update(2)
+    assert collection.compute() == {'ToPickle': 7, 'A': 7}
+    assert collection['A'].x == 0
+
+    collection.update(1)
+    collection.reset()
+    assert collection.compute() == {'ToPickle': 0, 'A': 0}
+
+    collection = MetricCollection({'first': ToPickle(), 'second': ToPickle()})
+    collection.update(3)
+    assert collection.compute() == {'first': 3, 'second': 3}
+
+    with pytest.raises(ValueError, match='two metrics both named'):
+        MetricCollection([ToPickle(), ToPickle()])
+
+    with pytest.raises(ValueError, match='not an instance'):
+        MetricCollection({'a': torch.nn.Linear(1, 1)})
@@ -15,6 +15,8 @@ import glob
 import logging as log
 import os
 import pickle
+import signal
+from unittest.mock import Mock
 
 import cloudpickle
 import pytest
@@ -24,7 +26,7 @@ from torch.utils.data import DataLoader
 
 import tests.base.develop_pipelines as tpipes
 import tests.base.develop_utils as tutils
-from pytorch_lightning import Trainer, LightningModule, Callback
+from pytorch_lightning import Trainer, LightningModule, Callback, seed_everything
 from pytorch_lightning.callbacks import ModelCheckpoint
 from tests.base import EvalModelTemplate, GenericEvalModelTemplate, TrialMNIST
 
@@ -69,6 +71,158 @@ def test_resume_from_checkpoint(tmpdir):
     trainer.fit(model)
 
 
+class IndexedDataset(torch.utils.data.Dataset):
+    """ Returns the index of each sample and the seed of the worker loading it along with the sample. """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.loaded = []
+
+    def __getitem__(self, index):
+        self.loaded.append(index)
+        worker_info = torch.utils.data.get_worker_info()
+        return (*self.dataset[index], index, worker_info.seed if worker_info is not None else -1)
+
+    def __len__(self):
+        return len(self.dataset)
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_resume_mid_epoch(tmpdir, num_workers):
+    """ Test that a checkpoint saved in the middle of an epoch resumes it at the next batch,
+    with the same samples and worker seeds, and without loading the samples trained already. """
+
+    class SamplesModel(EvalModelTemplate):
+
+        def __init__(self, save_at=None):
+            super().__init__()
+            self.save_at = save_at
+            self.train_data = IndexedDataset(self.dataloader(train=True).dataset)
+            self.trained = []
+
+        def train_dataloader(self):
+            return DataLoader(self.train_data, batch_size=self.batch_size, shuffle=True, num_workers=num_workers)
+
+        def training_step(self, batch, batch_idx, optimizer_idx=None):
+            x, y, index, worker_seed = batch
+            self.trained.extend(zip(index.tolist(), worker_seed.tolist()))
+            return super().training_step((x, y), batch_idx, optimizer_idx)
+
+        def on_train_batch_end(self, outputs, batch, batch_idx, dataloader_idx):
+            if (self.current_epoch, batch_idx) == self.save_at:
+                self.trainer.save_checkpoint(str(tmpdir / "mid_epoch.ckpt"))
+                self.trainer.should_stop = True
+
+    trainer_args = dict(default_root_dir=tmpdir, max_epochs=2, limit_val_batches=0, logger=False)
+    batch_size, num_batches = EvalModelTemplate().batch_size, 3
+
+    # the samples of the last epoch when training without interruption
+    seed_everything(1)
+    model = SamplesModel()
+    Trainer(**trainer_args).fit(model)
+    expected = model.trained[-len(model.train_data):]
+
+    seed_everything(1)
+    model = SamplesModel(save_at=(1, num_batches - 1))
+    Trainer(**trainer_args).fit(model)
+    checkpoint = torch.load(str(tmpdir / "mid_epoch.ckpt"))
+    assert checkpoint['train_dataloader_state']['epoch'] == 1
+    assert checkpoint['train_dataloader_state']['sampler']['batches_seen'] == num_batches
+
+    # another seed, the order of the samples and the worker seeds come from the checkpoint
+    seed_everything(2)
+    model = SamplesModel()
+    trainer = Trainer(**trainer_args, resume_from_checkpoint=str(tmpdir / "mid_epoch.ckpt"))
+    trainer.fit(model)
+    assert [index for index, _ in model.trained] == [index for index, _ in expected[num_batches * batch_size:]]
+    # the workers are seeded the same, though the first worker loads the first batch the resumed epoch loads
+    assert {seed for _, seed in model.trained} == {seed for _, seed in expected}
+    assert trainer.current_epoch == 1
+    if num_workers == 0:
+        assert model.train_data.loaded == [index for index, _ in model.trained]
+
+
+def test_preemption_snapshot(tmpdir, monkeypatch):
+    """ Test that on SIGUSR1 the snapshot of the last refresh is written to scratch, copied to the weights save path
+    and recorded in the hpc manifest. """
+    monkeypatch.setenv('SLURM_JOB_NAME', 'test_job')
+    monkeypatch.setenv('SLURM_JOB_ID', '1234')
+    requeue = Mock(return_value=0)
+    monkeypatch.setattr('pytorch_lightning.trainer.connectors.slurm_connector.call', requeue)
+
+    class PreemptedModel(EvalModelTemplate):
+
+        def on_train_batch_end(self, outputs, batch, batch_idx, dataloader_idx):
+            if batch_idx == 4:
+                self.snapshot_weights = {k: v.clone() for k, v in self.state_dict().items()}
+            if batch_idx == 5:
+                os.kill(os.getpid(), signal.SIGUSR1)
+                self.trainer.should_stop = True
+
+    weights_dir = str(tmpdir / 'weights')
+    scratch_dir = str(tmpdir / 'scratch')
+    model = PreemptedModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        weights_save_path=weights_dir,
+        max_epochs=1,
+        limit_val_batches=0,
+        logger=False,
+        preemption_snapshot_every_n_steps=2,
+        preemption_scratch_dir=scratch_dir,
+    )
+    handlers = signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGTERM)
+    try:
+        trainer.fit(model)
+    finally:
+        signal.signal(signal.SIGUSR1, handlers[0])
+        signal.signal(signal.SIGTERM, handlers[1])
+    trainer.checkpoint_connector._snapshot_flush.join()
+
+    requeue.assert_called_once_with(['scontrol', 'requeue', '1234'])
+    assert os.path.isfile(os.path.join(scratch_dir, 'hpc_ckpt_1.ckpt'))
+    checkpoint = torch.load(os.path.join(weights_dir, 'hpc_ckpt_1.ckpt'))
+    # the state after the 5th batch, of the last refresh
+    assert checkpoint['global_step'] == 5
+    for name, weight in model.snapshot_weights.items():
+        assert torch.equal(checkpoint['state_dict'][name], weight)
+
+    # the manifest tells the latest checkpoint without listing the folder
+    monkeypatch.setattr(trainer.checkpoint_connector, 'max_ckpt_in_folder', Mock(side_effect=AssertionError))
+    assert trainer.checkpoint_connector.latest_hpc_ckpt_number(weights_dir) == 1
+
+
+def test_corrupt_hpc_manifest_falls_back_to_listing(tmpdir):
+    """ Test that a truncated hpc manifest, e.g. of a job killed while writing it, doesn't prevent resuming. """
+    weights_dir = str(tmpdir / 'weights')
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        weights_save_path=weights_dir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        logger=False,
+    )
+    trainer.fit(EvalModelTemplate())
+    connector = trainer.checkpoint_connector
+    connector.hpc_save(weights_dir, None)
+    connector.hpc_save(weights_dir, None)
+    # the manifest replaces the previous one, no temporary file is left behind
+    assert not glob.glob(os.path.join(weights_dir, '*.tmp'))
+    assert connector.latest_hpc_ckpt_number(weights_dir) == 2
+
+    with open(os.path.join(weights_dir, 'hpc_latest.json'), 'w') as f:
+        f.write('{"lat')
+    with pytest.warns(UserWarning, match='can not be read'):
+        assert connector.latest_hpc_ckpt_number(weights_dir) == 2
+
+    trainer = Trainer(default_root_dir=tmpdir, weights_save_path=weights_dir, max_epochs=2, logger=False)
+    trainer.model = EvalModelTemplate()
+    with pytest.warns(UserWarning, match='can not be read'):
+        assert trainer.checkpoint_connector.restore_hpc_weights_if_needed(trainer.model)
+    assert trainer.global_step == torch.load(os.path.join(weights_dir, 'hpc_ckpt_2.ckpt'))['global_step']
+
+
 @pytest.mark.skipif(torch.cuda.device_count() < 2, reason="test requires multi-GPU machine")
 def test_running_test_pretrained_model_distrib_dp(tmpdir):
     """Verify `test()` on pretrained model."""
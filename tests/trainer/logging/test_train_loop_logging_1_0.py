@@ -19,7 +19,8 @@ import os
 import torch
 import pytest
 
-from pytorch_lightning import Trainer, callbacks
+from pytorch_lightning import LightningModule, Trainer, callbacks
+from pytorch_lightning.profiler import SimpleProfiler
 from tests.base.deterministic_model import DeterministicModel
 from torch.utils.data import Dataset
 
@@ -361,6 +362,70 @@ def test_tbptt_log(tmpdir):
     assert generated == expected
 
 
+def test_tbptt_log_reduced_across_time(tmpdir):
+    """
+    Tests that the splits are views of the batch, that the hiddens are detached in place
+    and that the values logged per split are reduced across time as they come
+    """
+    truncated_bptt_steps = 3
+    sequence_size = 8
+    batch_size = 4
+    x_seq = torch.rand(4 * batch_size, sequence_size, 2)
+
+    class TestModel(LightningModule):
+        def __init__(self):
+            super().__init__()
+            self.layer = torch.nn.Linear(2, 2)
+            self.logged = []
+            self.returned_hiddens = None
+
+        def training_step(self, batch, batch_idx, hiddens):
+            x, = batch
+            assert x._base is not None, "tbptt split is not a view of the batch"
+            if hiddens is not None:
+                assert hiddens is self.returned_hiddens and not hiddens.requires_grad
+            else:
+                hiddens = torch.zeros(batch_size, 2)
+
+            out = self.layer(x).sum(1) + hiddens
+            loss = out.pow(2).mean()
+            value = loss.detach()
+            self.logged.append((batch_idx, value))
+            self.log('mean', value, on_step=False, on_epoch=True)
+            self.log('max', value, on_step=False, on_epoch=True, tbptt_reduce_fx=torch.max)
+            self.log('median', value, on_step=False, on_epoch=True, tbptt_reduce_fx=torch.median)
+
+            self.returned_hiddens = torch.tanh(out)
+            return {'loss': loss, 'hiddens': self.returned_hiddens}
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer.parameters(), lr=0.01)
+
+        def train_dataloader(self):
+            return torch.utils.data.DataLoader(torch.utils.data.TensorDataset(x_seq), batch_size=batch_size)
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_val_batches=0,
+        truncated_bptt_steps=truncated_bptt_steps,
+        weights_summary=None,
+        profiler=SimpleProfiler(),
+    )
+    trainer.fit(model)
+
+    # taking each split is profiled, plus the end of each batch's splits
+    assert len(trainer.profiler.recorded_durations['tbptt_split_batch']) == 4 * (3 + 1)
+
+    # 3 splits per batch, the last one shorter
+    assert [batch_idx for batch_idx, _ in model.logged] == [i for i in range(4) for _ in range(3)]
+    values = torch.stack([value for _, value in model.logged]).view(4, 3)
+    assert trainer.logged_metrics['mean'] == pytest.approx(values.mean(1).mean().item())
+    assert trainer.logged_metrics['max'] == pytest.approx(values.max(1).values.mean().item())
+    assert trainer.logged_metrics['median'] == pytest.approx(values.median(1).values.mean().item())
+
+
 def test_different_batch_types_for_sizing(tmpdir):
 
     class TestModel(BoringModel):
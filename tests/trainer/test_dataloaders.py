@@ -13,6 +13,7 @@
 # limitations under the License.
 import os
 import platform
+import threading
 from distutils.version import LooseVersion
 from unittest.mock import patch
 
@@ -24,9 +25,11 @@ from torch.utils.data.distributed import DistributedSampler
 
 import tests.base.develop_pipelines as tpipes
 from pytorch_lightning import Trainer, Callback
+from pytorch_lightning.trainer.supporters import BatchPrefetcher
 from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
+from tests.base.boring_model import BoringModel, RandomDataset
 
 
 def test_fit_train_loader_only(tmpdir):
@@ -1078,3 +1081,207 @@ def test_dataloaders_load_only_once_passed_loaders(tmpdir):
     ]
     for call, expected in zip(calls, expected_sequence):
         assert call['name'] == expected
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='Does not apply to Windows platform.')
+@pytest.mark.skipif(LooseVersion(torch.__version__) < LooseVersion("1.7.0"), reason="requires persistent workers")
+@pytest.mark.parametrize(['persistent_workers', 'reload_dataloaders_every_epoch'], [
+    pytest.param(True, False),
+    pytest.param(True, True),
+    pytest.param(False, False),
+])
+def test_dataloader_workers_persist_between_runs(tmpdir, persistent_workers, reload_dataloaders_every_epoch):
+    """ Test that the worker processes of multi-process dataloaders are reused across validation runs and epochs
+    only when asked to """
+
+    class WorkerPidsCallback(Callback):
+
+        def __init__(self):
+            self.train_pids = []
+            self.val_pids = []
+
+        def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+            if batch_idx == 0:
+                self.train_pids.append(self._worker_pids(trainer.train_dataloader))
+
+        def on_validation_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+            if batch_idx == 0 and not trainer.running_sanity_check:
+                self.val_pids.append(self._worker_pids(trainer.val_dataloaders[0]))
+
+        @staticmethod
+        def _worker_pids(dataloader):
+            iterator = dataloader._iterator if dataloader.persistent_workers else None
+            return tuple(w.pid for w in iterator._workers) if iterator is not None else None
+
+    class TestModel(BoringModel):
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer.parameters(), lr=0.1)
+
+    model = TestModel()
+    train_dl = DataLoader(RandomDataset(32, 64), batch_size=4, num_workers=2)
+    val_dl = DataLoader(RandomDataset(32, 64), batch_size=4, num_workers=2)
+
+    callback = WorkerPidsCallback()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_train_batches=4,
+        limit_val_batches=2,
+        val_check_interval=0.5,
+        reload_dataloaders_every_epoch=reload_dataloaders_every_epoch,
+        persistent_workers=persistent_workers,
+        callbacks=[callback],
+    )
+    trainer.fit(model, train_dataloader=train_dl, val_dataloaders=val_dl)
+
+    assert len(callback.train_pids) == 2
+    assert len(callback.val_pids) == 4
+    if not persistent_workers or reload_dataloaders_every_epoch:
+        assert not trainer.train_dataloader.persistent_workers
+        assert not trainer.val_dataloaders[0].persistent_workers
+        assert all(pids is None for pids in callback.train_pids + callback.val_pids)
+    else:
+        assert trainer.train_dataloader.persistent_workers
+        assert trainer.val_dataloaders[0].persistent_workers
+        assert len(set(callback.train_pids)) == 1
+        assert len(set(callback.val_pids)) == 1
+
+    # the user passed dataloaders are left untouched
+    assert not train_dl.persistent_workers and not val_dl.persistent_workers
+
+
+def test_batch_prefetcher_stages_ahead():
+    """ Test that the prefetcher fetches the next batches while the current one is consumed """
+    fetched = []
+    next_fetched = threading.Event()
+
+    def batches():
+        for i in range(4):
+            fetched.append(i)
+            if i == 1:
+                next_fetched.set()
+            yield torch.tensor([i])
+
+    prefetcher = BatchPrefetcher(batches(), depth=2, transfer_fn=lambda batch: batch * 2)
+    consumed = []
+    for batch in prefetcher:
+        if not consumed:
+            # batch 1 gets fetched while batch 0 is still being processed
+            assert next_fetched.wait(timeout=5)
+        consumed.append(batch.item())
+    assert consumed == [0, 2, 4, 6]
+    assert fetched == [0, 1, 2, 3]
+
+
+def test_batch_prefetcher_errors_and_early_stop():
+    """ Test that errors raised while fetching reach the consumer and the consumer can stop early """
+
+    def failing_batches():
+        yield torch.tensor([0])
+        raise ValueError('broken batch')
+
+    with pytest.raises(ValueError, match='broken batch'):
+        list(BatchPrefetcher(failing_batches()))
+
+    prefetcher = iter(BatchPrefetcher(range(100), depth=1))
+    assert next(prefetcher) == 0
+    prefetcher.close()
+
+
+def test_batch_prefetcher_early_stop_leaves_iterator():
+    """ Test that stopping early waits for the staging thread to leave the iterator it fetches from """
+    fetching = threading.Event()
+    release = threading.Event()
+    inside = []
+
+    def slow_batches():
+        for i in range(100):
+            inside.append(True)
+            if i == 2:
+                fetching.set()
+                release.wait(timeout=5)
+            inside.pop()
+            yield i
+
+    prefetcher = iter(BatchPrefetcher(slow_batches(), depth=1))
+    assert next(prefetcher) == 0
+    assert fetching.wait(timeout=5)
+    threading.Timer(0.2, release.set).start()
+    prefetcher.close()
+    # the thread was inside the iterator when the consumer stopped, closing waited for it to come out
+    assert not inside
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='Does not apply to Windows platform.')
+@pytest.mark.skipif(LooseVersion(torch.__version__) < LooseVersion("1.7.0"), reason="requires persistent workers")
+def test_prefetch_batches_with_persistent_workers_and_limited_batches(tmpdir):
+    """ Test that the passes over persistent workers which the prefetcher stops early can be started again """
+
+    class TestModel(BoringModel):
+
+        def __init__(self):
+            super().__init__()
+            self.seen = []
+
+        def training_step(self, batch, batch_idx):
+            self.seen.append((self.current_epoch, batch_idx))
+            return super().training_step(batch, batch_idx)
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer.parameters(), lr=0.1)
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=3,
+        limit_train_batches=3,
+        limit_val_batches=2,
+        prefetch_batches=2,
+        persistent_workers=True,
+        weights_summary=None,
+        progress_bar_refresh_rate=0,
+    )
+    train_dl = DataLoader(RandomDataset(32, 64), batch_size=2, num_workers=2)
+    val_dl = DataLoader(RandomDataset(32, 64), batch_size=2, num_workers=2)
+    trainer.fit(model, train_dataloader=train_dl, val_dataloaders=val_dl)
+
+    assert trainer.train_dataloader.persistent_workers
+    assert model.seen == [(epoch, batch_idx) for epoch in range(3) for batch_idx in range(3)]
+
+
+@pytest.mark.parametrize('prefetch_batches', [0, 2])
+def test_dataloader_prefetch_batches(tmpdir, prefetch_batches):
+    """ Test that training and evaluation see every batch in order when prefetching on CPU """
+
+    class TestModel(BoringModel):
+
+        def __init__(self):
+            super().__init__()
+            self.seen = {'train': [], 'val': []}
+
+        def training_step(self, batch, batch_idx):
+            self.seen['train'].append(batch.clone())
+            return super().training_step(batch, batch_idx)
+
+        def validation_step(self, batch, batch_idx):
+            self.seen['val'].append(batch.clone())
+            return super().validation_step(batch, batch_idx)
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer.parameters(), lr=0.1)
+
+    train_data = RandomDataset(32, 20)
+    val_data = RandomDataset(32, 12)
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        num_sanity_val_steps=0,
+        limit_train_batches=4,
+        prefetch_batches=prefetch_batches,
+    )
+    trainer.fit(model, DataLoader(train_data, batch_size=4), DataLoader(val_data, batch_size=4))
+
+    assert torch.equal(torch.cat(model.seen['train']), torch.cat([train_data.data[:16]] * 2))
+    assert torch.equal(torch.cat(model.seen['val']), torch.cat([val_data.data] * 2))
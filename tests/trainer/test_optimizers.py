@@ -17,6 +17,7 @@ import torch
 from pytorch_lightning import Trainer, Callback
 from tests.base import EvalModelTemplate
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.trainer.optimizers import OptimizerToggle
 from tests.base.boring_model import BoringModel
 
 
@@ -359,3 +360,73 @@ def test_multiple_optimizers_callbacks(tmpdir):
         weights_summary=None,
     )
     trainer.fit(model)
+
+
+@pytest.mark.parametrize('toggle_optimizers', [True, False])
+def test_multiple_optimizers_toggle(tmpdir, toggle_optimizers):
+    """
+    Tests that each optimizer's training step only computes the gradients of its parameters
+    """
+    class TestModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.layer_1 = torch.nn.Linear(32, 2)
+            self.layer_2 = torch.nn.Linear(32, 2)
+            self.shared = torch.nn.Linear(2, 2)
+            self.requires_grad = []
+
+        def training_step(self, batch, batch_idx, optimizer_idx):
+            layers = (self.layer_1, self.layer_2, self.shared)
+            self.requires_grad.append([layer.weight.requires_grad for layer in layers])
+            layer = self.layer_1 if optimizer_idx == 0 else self.layer_2
+            output = self.shared(layer(batch[0]))
+            return self.loss(batch, output)
+
+        def configure_optimizers(self):
+            a = torch.optim.SGD([*self.layer_1.parameters(), *self.shared.parameters()], 1e-2)
+            b = torch.optim.SGD([*self.layer_2.parameters(), *self.shared.parameters()], 1e-2)
+            return a, b
+
+    model = TestModel()
+    model.training_epoch_end = None
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=1,
+        weights_summary=None,
+        toggle_optimizers=toggle_optimizers,
+    )
+    trainer.fit(model)
+
+    if toggle_optimizers:
+        expected = [[True, False, True], [False, True, True]] * 2
+    else:
+        expected = [[True, True, True]] * 4
+    assert model.requires_grad == expected
+
+
+def test_optimizer_toggle_follows_param_groups():
+    """
+    Tests that the optimizer toggle notices parameters added to an optimizer and flags changed outside of it
+    """
+    model = torch.nn.ModuleList([torch.nn.Linear(1, 1) for _ in range(3)])
+    optimizers = [torch.optim.SGD(model[0].parameters(), lr=0.1), torch.optim.SGD(model[1].parameters(), lr=0.1)]
+    toggle = OptimizerToggle(model, optimizers)
+
+    # a layer no optimizer trains yet, unfrozen and added to the first optimizer
+    model[2].requires_grad_(False)
+    toggle.toggle(0)
+    toggle.toggle(1)
+    model[2].requires_grad_(True)
+    optimizers[0].add_param_group({'params': list(model[2].parameters())})
+    toggle.toggle(0)
+    assert [layer.weight.requires_grad for layer in model] == [True, False, True]
+    toggle.toggle(1)
+    assert [layer.weight.requires_grad for layer in model] == [False, True, False]
+
+    # the first toggle after a reset overwrites flags changed in between
+    model.requires_grad_(True)
+    toggle.reset()
+    toggle.toggle(1)
+    assert [layer.weight.requires_grad for layer in model] == [False, True, False]
@@ -815,6 +815,28 @@ def test_nan_params_detection(tmpdir):
     assert not torch.isfinite(params).all()
 
 
+def test_nan_params_detection_every_n_steps(tmpdir):
+
+    class CurrentModel(EvalModelTemplate):
+        test_batch_nan = 5
+
+        def on_after_backward(self):
+            if self.global_step == self.test_batch_nan:
+                torch.nn.init.constant_(self.c_d1.bias, math.nan)
+
+    model = CurrentModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=10,
+        terminate_on_nan=4,
+    )
+
+    # checked every 4 steps, by then the loss is nan as well
+    with pytest.raises(ValueError, match=r'.*The loss returned in `training_step` is nan or inf.*'):
+        trainer.fit(model)
+    assert trainer.global_step == 8
+
+
 def test_trainer_interrupted_flag(tmpdir):
     """Test the flag denoting that a user interrupted training."""
 
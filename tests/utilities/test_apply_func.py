@@ -15,9 +15,20 @@ import numbers
 from collections import namedtuple
 
 import numpy as np
+import pytest
 import torch
 
-from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.apply_func import (
+    _KIND_CACHE_SIZE,
+    _SPEC_CACHE,
+    _SPEC_CACHE_SIZE,
+    _collection_kind,
+    _is_coalescable,
+    apply_to_collection,
+    flatten_collection,
+    move_data_to_device,
+    unflatten_collection,
+)
 
 
 def test_recursive_application_to_collection():
@@ -77,3 +88,59 @@ def test_recursive_application_to_collection():
 
     assert isinstance(reduced['g'], numbers.Number), 'Reduction of a number should result in a tensor'
     assert reduced['g'] == expected_result['g'], 'Reduction of a number did not yield the desired result'
+
+
+def test_flatten_unflatten_collection():
+    ntc = namedtuple('Foo', ['bar', 'baz'])
+    collection = {
+        'a': torch.tensor([1.]),
+        'b': [torch.tensor([2.]), 'dummy', (torch.tensor([3.]), 4)],
+        'c': ntc(bar=torch.tensor([5.]), baz=None),
+    }
+
+    leaves, spec = flatten_collection(collection, torch.Tensor)
+    assert [x.item() for x in leaves] == [1., 2., 3., 5.]
+
+    restored = unflatten_collection([x * 2 for x in leaves], spec)
+    expected = apply_to_collection(collection, torch.Tensor, lambda x: x * 2)
+    assert restored.keys() == expected.keys()
+    assert torch.equal(restored['a'], expected['a'])
+    assert restored['b'][1] == 'dummy' and restored['b'][2][1] == 4
+    assert isinstance(restored['b'][2], tuple)
+    assert isinstance(restored['c'], ntc) and restored['c'].baz is None
+    assert torch.equal(restored['c'].bar, expected['c'].bar)
+
+
+def test_flatten_collection_spec_cache():
+    _SPEC_CACHE.clear()
+    spec = flatten_collection({'x': torch.zeros(1), 'y': [torch.ones(2), 'a']}, torch.Tensor)[1]
+    same = flatten_collection({'x': torch.ones(3), 'y': [torch.zeros(1), 'b']}, torch.Tensor)[1]
+    other = flatten_collection({'x': torch.ones(3), 'y': [torch.zeros(1)]}, torch.Tensor)[1]
+    # the structures are equal, only the leaves and the other elements differ
+    assert spec[0] is same[0] and spec[1] != same[1]
+    assert other[0] is not spec[0]
+    assert len(_SPEC_CACHE) == 2
+
+    for i in range(_SPEC_CACHE_SIZE + 10):
+        flatten_collection([torch.zeros(1)] * i, torch.Tensor)
+    assert len(_SPEC_CACHE) == _SPEC_CACHE_SIZE
+
+
+def test_apply_to_collection_kind_cache_is_bounded():
+    for i in range(_KIND_CACHE_SIZE + 10):
+        dynamic_type = type(f'Dynamic{i}', (dict,), {})
+        assert apply_to_collection(dynamic_type(x=1), int, lambda x: x + 1) == {'x': 2}
+    assert _collection_kind.cache_info().currsize <= _KIND_CACHE_SIZE
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+def test_move_data_to_device_coalesces_small_tensors():
+    batch = {'x': torch.rand(3), 'y': [torch.rand(2, 2), torch.arange(4)], 'z': torch.rand(2)}
+    moved = move_data_to_device(batch, torch.device('cuda', 0))
+
+    for src, dst in zip(flatten_collection(batch, torch.Tensor)[0], flatten_collection(moved, torch.Tensor)[0]):
+        assert dst.is_cuda and dst.dtype == src.dtype
+        assert torch.equal(dst.cpu(), src)
+
+    # pinned tensors keep their asynchronous copy
+    assert _is_coalescable(torch.rand(2)) and not _is_coalescable(torch.rand(2).pin_memory())